@@ -2,11 +2,10 @@
 # Libraries and modules
 #++++++++++++++++++++++++++++++++++++
 
-from beeoptimal import ArtificialBeeColony
+from beeoptimal import run_many
 import numpy as np
 from beeoptimal.benchmarks import *
 import matplotlib.pyplot as plt
-from tqdm import trange
 
 #++++++++++++++++++++++++++++++++++++
 # Global variables and settings
@@ -25,6 +24,7 @@ STAGNATION_TOL      = np.NINF
 RANDOM_SEED         = 1234
 IMG_PATH            = 'images/analysis_nbees/'
 N_SIMULATIONS       = 15
+N_JOBS              = -1
 PLOT_COLORS         = ['#2E86C1','#E74C3C','#F3C40F','#68C73C']
 
 
@@ -34,8 +34,8 @@ PLOT_COLORS         = ['#2E86C1','#E74C3C','#F3C40F','#68C73C']
 
 if __name__ == '__main__':
     
-    # Fix seed for reproducibility
-    np.random.seed(RANDOM_SEED)     
+    # Fix seed for reproducibility (each configuration gets its own independent streams)
+    seeds = iter(np.random.SeedSequence(RANDOM_SEED).spawn(len(BENCHMARK_FUNCTIONS)*len(COLONY_SIZE)))
     
     for function in BENCHMARK_FUNCTIONS:
         print('\n')
@@ -47,25 +47,19 @@ if __name__ == '__main__':
 
         for i,colony_size in enumerate(COLONY_SIZE):
             # Simulations
-            for s in trange(N_SIMULATIONS,desc=f'Simulations (COLONY_SIZE={colony_size})'):
+            config = {'colony_size'    : colony_size,
+                      'bounds'         : function.bounds,
+                      'function'       : function.fun,
+                      'max_iters'      : MAX_ITERS,
+                      'limit'          : LIMIT,
+                      'selection'      : SELECTION,
+                      'mutation'       : MUTATION,
+                      'initialization' : INITIALIZATION,
+                      'stagnation_tol' : STAGNATION_TOL}
+            print(f'Simulations (COLONY_SIZE={colony_size})')
+            results = run_many(config,n_runs=N_SIMULATIONS,n_jobs=N_JOBS,seeds=next(seeds),verbose=True)
 
-                ABC = ArtificialBeeColony(
-                    colony_size = colony_size,
-                    bounds      = function.bounds,
-                    function    = function.fun
-                    )
-                
-                ABC.optimize(
-                    max_iters      = MAX_ITERS,
-                    limit          = LIMIT,
-                    selection      = SELECTION,
-                    mutation       = MUTATION,
-                    initialization = INITIALIZATION,
-                    stagnation_tol = STAGNATION_TOL,
-                    random_seed    = None
-                    )
-
-                cost_history[i,s,:]    = [best_bee.value for best_bee in ABC.optimal_bee_history]
+            cost_history[i,:,:] = results.convergence
         
         # Compute statistics
         cost_medians = np.median(cost_history,axis=1)
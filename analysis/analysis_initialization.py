@@ -34,7 +34,7 @@ IMG_PATH            = 'images/analysis_initialization/'
 if __name__ == '__main__':
     
     # Fix seed for reproducibility
-    np.random.seed(RANDOM_SEED)   
+    rng = np.random.default_rng(RANDOM_SEED)   
     
     for function in BENCHMARK_FUNCTIONS:
         
@@ -61,10 +61,11 @@ if __name__ == '__main__':
                     mutation       = MUTATION,
                     initialization = initialization,
                     stagnation_tol = STAGNATION_TOL, 
-                    random_seed    = None
+                    random_seed    = rng,
+                    history        = 'best'
                     )
 
-                cost_history[i,s,:]    = [best_bee.value for best_bee in ABC.optimal_bee_history]
+                cost_history[i,s,:]    = ABC.history.best_values
         
         # Compute statistics
         cost_medians = np.median(cost_history,axis=1)
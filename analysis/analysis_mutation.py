@@ -35,7 +35,7 @@ IMG_PATH            = 'images/analysis_mutation/'
 if __name__ == '__main__':
     
     # Fix seed for reproducibility
-    np.random.seed(RANDOM_SEED)   
+    rng = np.random.default_rng(RANDOM_SEED)   
     
     for function in BENCHMARK_FUNCTIONS:
         
@@ -65,10 +65,12 @@ if __name__ == '__main__':
                         initialization = initialization,
                         stagnation_tol = STAGNATION_TOL,
                         mr             = MR,
-                        verbose=False
+                        verbose=False,
+                        random_seed    = rng,
+                        history        = 'best'
                         )
 
-                    optimal_history = [best_bee.value for best_bee in ABC.optimal_bee_history]
+                    optimal_history = list(ABC.history.best_values)
                     # Padding in case of stagnation
                     optimal_history += [optimal_history[-1]] * (MAX_ITERS + 1 - len(optimal_history))
                     cost_history[m,i,s,:] = optimal_history
@@ -2,11 +2,10 @@
 # Libraries and modules
 #++++++++++++++++++++++++++++++++++++
 
-from beeoptimal import ArtificialBeeColony
+from beeoptimal import run_many
 import numpy as np
 from beeoptimal.benchmarks import *
 import matplotlib.pyplot as plt
-from tqdm import trange
 
 #++++++++++++++++++++++++++++++++++++
 # Global variables and settings
@@ -26,6 +25,7 @@ RANDOM_SEED         = 1234
 IMG_PATH            = 'images/analysis_mr/'
 STAGNATION_TOL      = np.NINF # No stagnation, we want to see the full optimization process
 N_SIMULATIONS       = 10
+N_JOBS              = -1
 PLOT_COLORS         = ['#2E86C1','#8E44AD','#E74C3C','#F3C40F','#68C73C']
 
 
@@ -35,8 +35,8 @@ PLOT_COLORS         = ['#2E86C1','#8E44AD','#E74C3C','#F3C40F','#68C73C']
 
 if __name__ == '__main__':
     
-    # Fix seed for reproducibility
-    np.random.seed(RANDOM_SEED)     
+    # Fix seed for reproducibility (each configuration gets its own independent streams)
+    seeds = iter(np.random.SeedSequence(RANDOM_SEED).spawn(len(BENCHMARK_FUNCTIONS)*len(MUTATION_RATES)))
     
     for function in BENCHMARK_FUNCTIONS:
         print('\n')
@@ -49,26 +49,20 @@ if __name__ == '__main__':
 
         for i,mr in enumerate(MUTATION_RATES):
             # Simulations
-            for s in trange(N_SIMULATIONS,desc=f'Simulations (MR={mr})'):
+            config = {'colony_size'    : COLONY_SIZE,
+                      'bounds'         : function.bounds,
+                      'function'       : function.fun,
+                      'max_iters'      : MAX_ITERS,
+                      'limit'          : LIMIT,
+                      'selection'      : SELECTION,
+                      'mutation'       : MUTATION,
+                      'mr'             : mr,
+                      'initialization' : INITIALIZATION,
+                      'stagnation_tol' : STAGNATION_TOL}
+            print(f'Simulations (MR={mr})')
+            results = run_many(config,n_runs=N_SIMULATIONS,n_jobs=N_JOBS,seeds=next(seeds),verbose=True)
 
-                ABC = ArtificialBeeColony(
-                    colony_size = COLONY_SIZE,
-                    bounds      = function.bounds,
-                    function    = function.fun
-                    )
-                
-                ABC.optimize(
-                    max_iters      = MAX_ITERS,
-                    limit          = LIMIT,
-                    selection      = SELECTION,
-                    mutation       = MUTATION,
-                    mr             = mr,
-                    initialization = INITIALIZATION,
-                    stagnation_tol = STAGNATION_TOL,
-                    random_seed    = None
-                    )
-
-                cost_history[i,s,:]    = [best_bee.value for best_bee in ABC.optimal_bee_history]
+            cost_history[i,:,:] = results.convergence
         
         # Compute statistics
         cost_medians = np.median(cost_history,axis=1)
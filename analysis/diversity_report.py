@@ -33,7 +33,7 @@ CSV_PATH            = 'simulations/diversity_report2.csv'
 if __name__ == '__main__':
     
     # Fix seed for reproducibility
-    np.random.seed(RANDOM_SEED)   
+    rng = np.random.default_rng(RANDOM_SEED)   
     
     diversity_df  = pd.DataFrame(columns=['Function','Initialization','Diversity'])
     
@@ -60,7 +60,7 @@ if __name__ == '__main__':
                     selection      = SELECTION,
                     mutation       = MUTATION,
                     initialization = initialization,
-                    random_seed    = None
+                    random_seed    = rng
                     )
                 
                 initial_positions = np.array([bee.position for bee in ABC.colony_history[0]]) # n_employs x n_dimensions
@@ -39,7 +39,7 @@ for idx,mutation in enumerate(MUTATIONS):
     function    = reconstruction_error,
     bounds      = np.array([(0.0, 1.0)] * 784)
     )
-    ABC.optimize(verbose=True,mutation=mutation,max_iters=4000,mr=0.5)
+    ABC.optimize(verbose=True,mutation=mutation,max_iters=4000,mr=0.5,history='best')
 
     plots = []
     # Adaptive step in order to have gifs with same number of frames
@@ -0,0 +1,59 @@
+#++++++++++++++++++++++++++++++++++++
+# Libraries and modules
+#++++++++++++++++++++++++++++++++++++
+
+import subprocess
+import sys
+import re
+import numpy as np
+
+#++++++++++++++++++++++++++++++++++++
+# Global variables and settings
+#++++++++++++++++++++++++++++++++++++
+
+N_REPEATS        = 20
+BASELINE         = 'import numpy'
+STATEMENTS       = ['import beeoptimal',
+                    'from beeoptimal import ArtificialBeeColony',
+                    'import beeoptimal; beeoptimal.Sphere2d',
+                    'import beeoptimal; beeoptimal.contourplot']
+# Modules that a bare `import beeoptimal` must not load (they are imported on first use)
+LAZY_MODULES     = ['plotly','PIL','tqdm','asyncio','sqlite3','multiprocessing','cProfile','beeoptimal.benchmarks','beeoptimal.plotting']
+MAX_OVERHEAD_MS  = 50  # Maximum import time of beeoptimal on top of numpy
+
+#++++++++++++++++++++++++++++++++++++
+# Functions
+#++++++++++++++++++++++++++++++++++++
+
+def import_time(statement):
+    """
+    Measures the cumulative import time (in milliseconds) of a statement in a fresh interpreter, with `python -X importtime`.
+    """
+    result = subprocess.run([sys.executable,'-X','importtime','-c',statement],capture_output=True,text=True,check=True)
+    # Each line reports: self time | cumulative time | module (top-level imports are not indented)
+    times = [int(match.group(1)) for match in re.finditer(r'^import time:\s+\d+ \|\s+(\d+) \| \S',result.stderr,re.M)]
+    return sum(times) / 1000
+
+#++++++++++++++++++++++++++++++++++++
+# Main
+#++++++++++++++++++++++++++++++++++++
+
+if __name__ == '__main__':
+
+    baseline = np.median([import_time(BASELINE) for _ in range(N_REPEATS)])
+    print(f"{BASELINE:<50}: {baseline:8.1f} ms")
+
+    for statement in STATEMENTS:
+        median = np.median([import_time(statement) for _ in range(N_REPEATS)])
+        print(f"{statement:<50}: {median:8.1f} ms (+{median-baseline:.1f} ms over numpy)")
+        if statement == 'import beeoptimal':
+            overhead = median - baseline
+
+    # Check that the heavy dependencies are not loaded by `import beeoptimal`
+    check  = f"import sys,beeoptimal; print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    loaded = subprocess.run([sys.executable,'-c',check],capture_output=True,text=True,check=True).stdout.strip()
+    if loaded:
+        sys.exit(f"FAILED: `import beeoptimal` loads {loaded}")
+    if overhead > MAX_OVERHEAD_MS:
+        sys.exit(f"FAILED: `import beeoptimal` takes {overhead:.1f} ms on top of numpy (maximum {MAX_OVERHEAD_MS} ms)")
+    print("OK")
@@ -5,9 +5,7 @@
 from beeoptimal import ArtificialBeeColony
 import numpy as np
 from beeoptimal.benchmarks import *
-from beeoptimal.plotting import contourplot_bees
-import tempfile
-from PIL import Image
+from beeoptimal.plotting import write_animation
 
 #++++++++++++++++++++++++++++++++++++
 # Global variables and settings
@@ -28,6 +26,8 @@ VERBOSE             = True
 RANDOM_SEED         = 12345
 MUTATION_NAMES      = ['StandardABC','ModifiedABC','ABCbest1','ABCbest2','DirectedABC']
 GIF_PATH            = 'images/optimization_gifs/'
+N_FRAMES            = 50
+N_JOBS              = -1
 
 #++++++++++++++++++++++++++++++++++++
 # Tests
@@ -77,36 +77,22 @@ if __name__ == '__main__':
                 print(f"\tFound    : {ABC.optimal_bee.value}")
                 print('-'*100)
                 
-                # GIF
-                plots = []
-                # Adaptive step in order to have gifs with same number of frames
-                step = max(1, (ABC.actual_iters+1) // 50) #Note: actual_iters +1 to include initial population
-                for iteration in range(0,(ABC.actual_iters+1),step): 
-                    plots.append(contourplot_bees(
-                        function=function,
-                        bee_colony=ABC.colony_history[iteration],
-                        title=f"{function.name.upper()} optimization [Iteration {iteration} / {ABC.actual_iters}]",
-                        optimal_solution=function.optimal_solution,
-                        bounds=None,
-                        zoom = 1.0,
-                        figsize=(600,600)
-                        ))
-
-                with tempfile.TemporaryDirectory() as tmpdirname:
-                    image_files = []
-                    # Save each figure as a separate image file
-                    for i, fig in enumerate(plots):
-                        # Define the file path
-                        file_path = f"{tmpdirname}/frame_{i}.png"
-                        fig.write_image(file_path, format="png", scale=3)   # Plotly version
-                        #fig.savefig(file_path, format="png",dpi=300)       # Matplotlib version
-                        image_files.append(file_path)
-
-                    # Open images and save as GIF
-                    images = [Image.open(file) for file in image_files]
-                    gif_path = GIF_PATH  + f"{mutation_name}/" + f"{function.name}_{mutation_name}_{initialization}.gif"
-                    images[0].save(gif_path, save_all=True, append_images=images[1:], 
-                                duration=200, loop=0)
-                    print(f"Animated GIF saved in {gif_path}")
+                # GIF (frames rendered in parallel and streamed into the file)
+                gif_path = GIF_PATH  + f"{mutation_name}/" + f"{function.name}_{mutation_name}_{initialization}.gif"
+                write_animation(
+                    abc=ABC,
+                    function=function,
+                    path=gif_path,
+                    title=f"{function.name.upper()} optimization",
+                    optimal_solution=function.optimal_solution,
+                    bounds=None,
+                    zoom = 1.0,
+                    figsize=(600,600),
+                    max_frames=N_FRAMES,
+                    frame_duration=200,
+                    scale=3,
+                    n_jobs=N_JOBS
+                    )
+                print(f"Animated GIF saved in {gif_path}")
         
 #--------------------------------------------------------------------------------
\ No newline at end of file
@@ -2,10 +2,9 @@
 # Libraries and modules
 #++++++++++++++++++++++++++++++++++++
 
-from beeoptimal.abc import ArtificialBeeColony
+from beeoptimal import run_sweep
 import numpy as np
 from beeoptimal.benchmarks import *
-from tqdm import trange
 import pandas as pd
 
 
@@ -25,8 +24,10 @@ MR                  = 0.7
 STAGNATION_TOL      = 1e-6#np.NINF
 RANDOM_SEED         = 12345
 N_SIMULATIONS       = 15
+N_JOBS              = -1
 FULL_CSV_PATH       = 'simulations/Ackley_full_stagnation.csv'      
 STATS_CSV_PATH      = 'simulations/Ackley_stats_stagnation.csv'
+STORE_PATH          = 'simulations/Ackley_stagnation.sqlite' # Finished runs are stored here: rerun the script to resume an interrupted sweep
 
 
 #++++++++++++++++++++++++++++++++++++
@@ -35,52 +36,29 @@ STATS_CSV_PATH      = 'simulations/Ackley_stats_stagnation.csv'
 
 if __name__ == '__main__':
     
-    # Seed for reproducibility
-    np.random.seed(RANDOM_SEED) 
-    
-    opt_report_full_df  = pd.DataFrame(columns=['Function','Initialization','Mutation','OptValue'])
-    opt_report_stats_df = pd.DataFrame(columns=['Function','Initialization','Mutation','Mean','Std','Median','Best','Worst'])
-    
-    for function in BENCHMARK_FUNCTIONS:
-        for mutation in MUTATIONS:
-            for initialization in INITIALIZATIONS:
-                print('\n')
-                print('-'*100)
-                print(f"Evaluating {function.name.upper()} with {initialization} initialization and {mutation} mutation")
-                print('-'*100)
-                
-                optimum_series = np.full(N_SIMULATIONS,np.nan)
-                
-                for s in trange(N_SIMULATIONS,desc='Running simulations'):
-                    
-                    ABC = ArtificialBeeColony(
-                        colony_size = COLONY_SIZE,
-                        bounds      = function.bounds,
-                        function    = function.fun
-                        )
-                    
-                    ABC.optimize(
-                        max_iters      = MAX_ITERS,
-                        selection      = SELECTION,
-                        mutation       = mutation,
-                        initialization = initialization,
-                        mr             = MR,   
-                        stagnation_tol = STAGNATION_TOL,
-                        verbose        = False,
-                        random_seed    = None
-                        )
-                    
-                    optimum_series[s] = ABC.optimal_bee.value
-                    
-                    opt_report_full_df.loc[len(opt_report_full_df)] = [function.name,initialization,mutation,ABC.optimal_bee.value]
-                
-                mean   = np.mean(optimum_series)
-                std    = np.std(optimum_series)
-                median = np.median(optimum_series)
-                best   = np.min(optimum_series)
-                worst  = np.max(optimum_series)
-                opt_report_stats_df.loc[len(opt_report_stats_df)] = [function.name,initialization,mutation,mean,std,median,best,worst]
+    # Sweep (each run is stored as soon as it finishes, runs already in the store are skipped)
+    grid = {'benchmark'      : BENCHMARK_FUNCTIONS,
+            'mutation'       : MUTATIONS,
+            'initialization' : INITIALIZATIONS}
+    base_config = {'colony_size'    : COLONY_SIZE,
+                   'max_iters'      : MAX_ITERS,
+                   'selection'      : SELECTION,
+                   'mr'             : MR,
+                   'stagnation_tol' : STAGNATION_TOL,
+                   'history'        : 'none'}
+    store = run_sweep(grid,n_runs=N_SIMULATIONS,store=STORE_PATH,base_config=base_config,n_jobs=N_JOBS,random_seed=RANDOM_SEED,verbose=True)
+
+    # Reports
+    opt_report_full_df = store.to_dataframe().rename(columns={'benchmark'      : 'Function',
+                                                              'initialization' : 'Initialization',
+                                                              'mutation'       : 'Mutation',
+                                                              'best_value'     : 'OptValue'})
+    opt_report_full_df = opt_report_full_df[['Function','Initialization','Mutation','OptValue']]
+    opt_report_stats_df = (opt_report_full_df
+                           .groupby(['Function','Initialization','Mutation'],sort=False)['OptValue']
+                           .agg(Mean='mean',Std=lambda values: np.std(values),Median='median',Best='min',Worst='max')
+                           .reset_index())
 
     opt_report_full_df.to_csv(FULL_CSV_PATH,index=False)
     opt_report_stats_df.to_csv(STATS_CSV_PATH,index=False)
-            
\ No newline at end of file
+    store.close()
@@ -1,14 +1,42 @@
 from .abc import ArtificialBeeColony,Bee
-from .benchmarks import BenchmarkFunction
-from .benchmarks import (
-    Sphere2d,Sphere10d,Sphere30d,
-    Rosenbrock2d,Rosenbrock10d,Rosenbrock30d,
-    Ackley2d,Ackley10d,Ackley30d,
-    Rastrigin2d,Rastrigin10d,Rastrigin30d,
-    Weierstrass2d,Weierstrass10d,Weierstrass30d,
-    Griewank2d,Griewank10d,Griewank30d,
-    Schwefel2d,Schwefel10d,Schwefel30d,
-    Sumsquares2d,Sumsquares10d,Sumsquares30d,
-    Eggholder
-)
-from .plotting import contourplot,surfaceplot,contourplot_bees#ContourPlotBee,ContourPlotBee_matplotlib
\ No newline at end of file
+from .history import ColonyHistory
+from .cache import EvaluationCache
+from .stats import ColonyStats
+
+# The other modules are imported on first access (see `__getattr__`), so that `import beeoptimal`
+# (e.g. in the worker processes of a pool) does not pay for plotly, PIL, sqlite3, multiprocessing and the benchmark catalogue
+LAZY_ATTRIBUTES_ = {
+    'IslandABC'       : 'islands',
+    'run_many'        : 'runs',
+    'MultiRunResults' : 'runs',
+    'run_sweep'       : 'sweeps',
+    'ResultStore'     : 'sweeps',
+    **{name: 'benchmarks' for name in [
+        'BenchmarkFunction',
+        'Sphere2d','Sphere10d','Sphere30d',
+        'Rosenbrock2d','Rosenbrock10d','Rosenbrock30d',
+        'Ackley2d','Ackley10d','Ackley30d',
+        'Rastrigin2d','Rastrigin10d','Rastrigin30d',
+        'Weierstrass2d','Weierstrass10d','Weierstrass30d',
+        'Griewank2d','Griewank10d','Griewank30d',
+        'Schwefel2d','Schwefel10d','Schwefel30d',
+        'Sumsquares2d','Sumsquares10d','Sumsquares30d',
+        'Eggholder'
+    ]},
+    **{name: 'plotting' for name in [
+        'contourplot','surfaceplot','contourplot_bees','evaluate_grid','clear_grid_cache','animate_colony','write_animation'
+    ]},
+}
+
+__all__ = ['ArtificialBeeColony','Bee','ColonyHistory','EvaluationCache','ColonyStats',*LAZY_ATTRIBUTES_]
+
+def __getattr__(name):
+    if name in LAZY_ATTRIBUTES_:
+        import importlib
+        value = getattr(importlib.import_module(f'.{LAZY_ATTRIBUTES_[name]}',__name__),name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_ATTRIBUTES_))
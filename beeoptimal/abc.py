@@ -3,9 +3,15 @@
 #++++++++++++++++++++++++++++++++++++
 
 import numpy as np
-import copy
+import os
+import json
+import time
+from concurrent.futures import Executor
 from .bee import Bee
-from tqdm import trange,tqdm
+from .history import ColonyHistory
+from .cache import EvaluationCache
+from .stats import ColonyStats
+from .utils import get_progress_bar
 
 #++++++++++++++++++++++++++++++++++++
 # Artificial Bee Colony (ABC) class
@@ -22,24 +28,40 @@ class ArtificialBeeColony():
         n_onlooker_bees (int)            : The number of onlooker bees.
         max_scouts (int)                 : The maximum number of scout bees per iteration. Defaults to None (will be set to n_employed_bees).
         dim (int)                        : The dimensionality of the search space.
-        function (callable)              : The objective function to optimize.
+        function (callable)              : The objective function to optimize (possibly wrapped in an `EvaluationCache`).
         bounds (array-like)              : The bounds for each dimension of the search space, provided as a 2D array [(lower1, upper1), ..., (lowerD, upperD)].
-        employed_bees (list[Bee])        : The employed bees in the colony.
-        onlooker_bees (list[Bee])        : The onlooker bees in the colony.
-        colony_history (list[list[Bee]]) : The history of the employed bees at each iteration.
+        vectorized (bool)                : Whether `function` evaluates a whole batch of positions at once. Defaults to False.
+        positions (numpy-array)          : The positions of the employed bees (i.e. the food sources), with shape `(n_employed_bees,D)`.
+        values (numpy-array)             : The objective values of the employed bees, with shape `(n_employed_bees,)`.
+        fitness (numpy-array)            : The fitness values of the employed bees, with shape `(n_employed_bees,)`.
+        trials (numpy-array)             : The trial counters of the employed bees, with shape `(n_employed_bees,)`.
+        employed_bees (list[Bee])        : The employed bees in the colony (built on demand from the arrays above).
+        onlooker_bees (list[Bee])        : The onlooker bees in the colony (built on demand).
+        history (ColonyHistory)          : The array-backed history of the last optimization.
+        colony_history (list[list[Bee]]) : The history of the employed bees at each recorded iteration (read-only, built on access).
         optimal_bee (Bee)                : The optimal bee in the colony.
-        optimal_bee_history (list[Bee])  : The history of the optimal bee at each iteration.
+        optimal_bee_history (list[Bee])  : The history of the optimal bee at each iteration (read-only, built on access).
         max_iters (int)                  : The maximum number of iterations. Defaults to 1000.
         actual_iters (int)               : The actual number of iterations.
         limit (int)                      : The trial limit for scout bees. If 'default', it is set to 0.6 * n_employed_bees * dimensionality. Defaults to 'default'.
-        selection (str, optional)        : The selection strategy for onlooker bees. Must be one among 'RouletteWheel' and 'Tournament'. Defaults to 'RouletteWheel'.
+        selection (str, optional)        : The selection strategy for onlooker bees. Must be one among 'RouletteWheel', 'Tournament' and 'StochasticUniversalSampling'. Defaults to 'RouletteWheel'.
         mutation (str)                   : The mutation strategy. Must be one among 'StandardABC', 'ModifiedABC', 'ABC/best/1', 'ABC/best/2' and 'DirectedABC'. Defaults to 'StandardABC'.
         initialization (str)             : The initialization strategy for the bee population. Must be one among 'random' and 'cahotic'. Defaults to 'random'.
+        cahotic_scouts (str)             : How scouts are reinitialized with the 'cahotic' initialization. Must be one among 'full', 'pool' and 'pair'. Defaults to 'full'.
+        scout_priority (str)             : Which exhausted food sources become scouts first. Must be one among 'index' and 'stalest'. Defaults to 'index'.
         stagnation_tol (float)           : The tolerance for stagnation in fitness values to trigger early termination. Defaults to np.NINF (i.e. stagnation disabled).
         sf (float)                       : The scaling factor for mutations. Defaults to 1.0.
         initial_sf (float)               : The initial scaling factor. Defaults to 1.0.
         self_adaptive_sf (bool)          : Whether to use a self-adaptive scaling factor. Defaults to False.
         mr (float)                       : The mutation rate for 'ModifiedABC' strategy. Defaults to 0.7.
+        n_evaluations (int)              : The number of objective function evaluations performed during the last optimization (values served by an
+                                           `EvaluationCache` are not counted).
+        rng (Generator)                  : The random number generator of the colony (a `np.random.Generator`, re-seeded by `random_seed`).
+        phase (str)                      : The current phase of the optimization. One among 'initialization', 'employees', 'onlookers', 'scouts'
+                                           and 'finished' (None before `setup`).
+        stagnated (bool)                 : Whether the last optimization terminated early because of stagnation.
+        stats (ColonyStats)              : The per-iteration timings of the phases, of the history and of the objective function (None unless enabled with `stats`).
+        profiler (cProfile.Profile)      : The profiler of the last optimization loop (None unless enabled with `profiler`).
     
     .. note::
             To ensure compatibility with all the mutation types, the bee colony must have at least 5 employed bees and at least 5 onlokeer bees.
@@ -47,7 +69,7 @@ class ArtificialBeeColony():
     
     #------------------------------------------------------------------------------------------------------------------
     
-    def __init__(self,colony_size,function,bounds,n_employed_bees=None,max_scouts=None):
+    def __init__(self,colony_size,function,bounds,n_employed_bees=None,max_scouts=None,vectorized=False):
         """
         Initializes the ABC
         
@@ -57,6 +79,8 @@ class ArtificialBeeColony():
             bounds (array-like)             : The bounds for each dimension of the search space, provided as a 2D array [(lower1, upper1), ..., (lowerD, upperD)].
             n_employed_bees (int, optional) : The number of employed bees. Defaults to half the total number of bees.
             max_scouts (int, optional)      : The maximum number of scout bees per iteration. Defaults to None (will be set to n_employed_bees).
+            vectorized (bool, optional)     : Whether `function` evaluates a whole batch of positions at once, i.e. maps a numpy array of shape `(N,D)`
+                                              to a numpy array of shape `(N,)`. Defaults to False (`function` is called once per position).
 
         Raises:
             TypeError  : If the function is not callable.
@@ -69,6 +93,7 @@ class ArtificialBeeColony():
             ValueError : If the number of employed bees is less than 5 or it is s.t the number of onlookers is less than 5.
             TypeError  : If the maximum number of scouts is not an integer.
             ValueError : If the maximum number of scouts is less than 0 or greater than the number of employed bees.
+            TypeError  : If `vectorized` is not a boolean.
         
         .. note::
             Constraints about colony size, n_employed_bees and max_scouts ensure compatibility across all mutation types.
@@ -112,13 +137,30 @@ class ArtificialBeeColony():
             self.max_scouts = max_scouts
         else:
             self.max_scouts = self.n_employed_bees
+        
+        if not isinstance(vectorized,bool):
+            raise TypeError("`vectorized` must be bool")
+        self.vectorized = vectorized
       
         
-        self.employed_bees       = []
-        self.onlooker_bees       = []
-        self.colony_history      = []
+        self.positions           = np.empty((0,self.dim))
+        self.values              = np.empty(0)
+        self.fitness             = np.empty(0)
+        self.trials              = np.empty(0,dtype=int)
+        self.onlooker_positions  = np.empty((0,self.dim))
+        self.onlooker_values     = np.empty(0)
+        self.history             = None
         self.optimal_bee         = None
-        self.optimal_bee_history = []
+        self.n_evaluations       = 0
+        self.executor            = None
+        self.n_workers           = None
+        self.rng                 = np.random.default_rng()
+        self.phase               = None
+        self.stagnated           = False
+        self._pending            = None
+        self._cache_hits         = 0
+        self.stats               = None
+        self.profiler            = None
             
     #------------------------------------------------------------------------------------------------------------------
     
@@ -128,41 +170,611 @@ class ArtificialBeeColony():
                  selection        = 'RouletteWheel',
                  mutation         = 'StandardABC',
                  initialization   = 'random',
+                 cahotic_scouts   = 'full',
+                 scout_priority   = 'index',
+                 warm_start       = None,
+                 warm_values      = None,
                  tournament_size  = None,
                  stagnation_tol   = np.NINF,
                  sf               = 1.0,
                  self_adaptive_sf = False,
                  mr               = 1.0,
                  verbose          = False,
-                 random_seed      = None):
+                 random_seed      = None,
+                 n_jobs           = None,
+                 executor         = None,
+                 n_workers        = None,
+                 history          = 'full',
+                 history_dtype    = np.float64,
+                 history_path     = None,
+                 checkpoint_every = None,
+                 checkpoint_path  = None,
+                 resume           = False,
+                 stats            = False,
+                 profiler         = None):
         """
         Runs the optimization process.
 
         Args:
             max_iters (int, optional)        : The maximum number of iterations. Defaults to 1000.
             limit (int or str, optional)     : The trial limit for scout bees. If 'default', it is set to 0.6 * n_employed_bees * dimensionality. Defaults to 'default'.
-            selection (str, optional)        : The selection strategy for onlooker bees. Must be one among 'RouletteWheel' and 'Tournament'. Defaults to 'RouletteWheel'.
+            selection (str, optional)        : The selection strategy for onlooker bees. Must be one among 'RouletteWheel', 'Tournament' and 'StochasticUniversalSampling'. Defaults to 'RouletteWheel'.
+            mutation (str, optional)         : The mutation strategy. Must be one among 'StandardABC', 'ModifiedABC', 'ABC/best/1' and 'ABC/best/2'. Defaults to 'StandardABC'.
+            initialization (str, optional)   : The initialization strategy for the bee population. Must be one among 'random' and 'cahotic'. Defaults to 'random'.
+            cahotic_scouts (str, optional)   : How scouts are reinitialized with the 'cahotic' initialization. Must be one among 'full' (each scout evaluates
+                                               its own pool of chaotic and opposite positions), 'pool' (the scouts of each iteration share a single pool of chaotic and opposite positions)
+                                               and 'pair' (each scout evaluates one chaotic position and its opposite). Defaults to 'full'.
+            scout_priority (str, optional)   : Which exhausted food sources are abandoned first when they are more than `max_scouts`.
+                                               Must be one among 'index' (lowest indices first) and 'stalest' (highest trial counters first). Defaults to 'index'.
+            warm_start (optional)            : Positions seeding the employed bees instead of the initialization strategy: a numpy array of shape `(M,D)`,
+                                               a previous `ArtificialBeeColony` or the path of a checkpoint (see `save_checkpoint`). Defaults to None.
+            warm_values (optional)           : The known objective values of `warm_start`, with shape `(M,)`, or True to reuse the values stored in the
+                                               colony or checkpoint. Defaults to None (the positions are evaluated).
+            tournament_size (int, optional)  : The size of the tournament for the 'Tournament' selection strategy. Defaults to None.
+            stagnation_tol (float, optional) : The tolerance for stagnation in fitness values to trigger early termination. Defaults to np.NINF (i.e. stagnation disabled).
+            sf (float, optional)             : The scaling factor for mutations. Defaults to 1.0.
+            self_adaptive_sf (bool, optional): Whether to use a self-adaptive scaling factor. Defaults to False.
+            mr (float, optional)             : The mutation rate for 'ModifiedABC' strategy. Defaults to 1.0.
+            verbose (bool, optional)         : Whether to display optimization progress. Defaults to False.
+            random_seed (int, optional)      : The seed for random number generation: an integer, a `np.random.SeedSequence` or a `np.random.Generator`.
+                                               Defaults to None (the current `rng` is used).
+            n_jobs (int, optional)           : The number of worker processes used to evaluate the candidates of each phase (-1 to use all the cores).
+                                               Defaults to None (serial evaluation).
+            executor (Executor, optional)    : A `concurrent.futures` executor (e.g. a process or thread pool) used to evaluate the candidates of each phase.
+                                               It is not shut down at the end of the optimization. Defaults to None.
+            n_workers (int, optional)        : The number of workers of `executor`, used to split each phase into one chunk per worker.
+                                               Defaults to None (the `_max_workers` of the standard library pools, if available).
+            history (str or int, optional)   : What is recorded along the optimization. Must be one among 'none', 'best' (optimal bee only),
+                                               'full' (optimal bee and whole colony) or a positive integer `k` (optimal bee, and whole colony every `k` iterations).
+                                               Defaults to 'full'.
+            history_dtype (dtype, optional)  : The floating point type used to store the recorded positions (e.g. np.float32 to halve memory).
+                                               Defaults to np.float64.
+            history_path (str, optional)     : A directory where the history is streamed as memory-mapped `.npy` files (see `ColonyHistory.load`).
+                                               Defaults to None (history kept in memory).
+            checkpoint_every (int, optional) : Saves a checkpoint to `checkpoint_path` every `checkpoint_every` iterations (see `save_checkpoint`).
+                                               Defaults to None (no checkpoints).
+            checkpoint_path (str, optional)  : The file where checkpoints are saved and resumed from. Defaults to None.
+            resume (bool, optional)          : Whether to resume the optimization from `checkpoint_path`, if it exists. The configuration stored in
+                                               the checkpoint is used, and the remaining arguments are ignored. Defaults to False.
+            stats (bool, optional)           : Whether to record the time spent in each phase, in the history and in the objective function at each iteration
+                                               (see `ColonyStats`), exposed as `stats`. Defaults to False.
+            profiler (optional)              : A `cProfile.Profile` enabled during the optimization loop, or True to create a new one. It is exposed as
+                                               `profiler` (e.g. for `pstats.Stats(abc.profiler)`). Defaults to None (no profiling).
+        
+        Raises:
+            TypeError : If `verbose` is not a boolean.
+            ValueError: If `n_jobs` is not a positive integer or -1.
+            TypeError : If `executor` is not a `concurrent.futures.Executor`.
+            ValueError: If both `n_jobs` and `executor` are provided.
+            ValueError: If `n_workers` is provided without `executor`, or it is not a positive integer.
+            ValueError: If the colony is vectorized and the number of workers of `executor` cannot be determined (see `n_workers`).
+            ValueError: If `checkpoint_every` is not a positive integer.
+            ValueError: If `checkpoint_every` or `resume` are provided without `checkpoint_path`.
+            TypeError : If `profiler` is not a `cProfile.Profile` or True.
+            ValueError: If any of the remaining arguments is invalid (see `setup`).
+        
+        .. note::
+            The optimization is a loop over `ask` and `tell`, where the candidates are evaluated in between.
+            With `n_jobs` or `executor`, the evaluations of each phase are distributed among the workers and the greedy selection waits for all of them.
+            Random numbers are only drawn by the main process from `rng`, hence results are identical to the serial ones for a given seed.
+            Process pools require `function` to be picklable (e.g. defined at module level).
+            A resumed optimization is bit-identical to an uninterrupted one.
+        """
+        
+        if not isinstance(verbose,bool):
+            raise TypeError("`verbose` must be bool")
+        
+        if n_jobs is not None:
+            if not (isinstance(n_jobs,int) and ((n_jobs >= 1) or (n_jobs == -1))):
+                raise ValueError(f"`n_jobs` must be a positive integer or -1, but got {n_jobs}")
+            if executor is not None:
+                raise ValueError("Please provide either `n_jobs` or `executor`, not both.")
+        if (executor is not None) and (not isinstance(executor,Executor)):
+            raise TypeError("`executor` must be a `concurrent.futures.Executor`.")
+        if n_workers is not None:
+            if executor is None:
+                raise ValueError("`n_workers` can only be provided together with `executor`.")
+            if not (isinstance(n_workers,int) and (n_workers >= 1)):
+                raise ValueError(f"`n_workers` must be a positive integer, but got {n_workers}")
+        elif executor is not None:
+            n_workers = getattr(executor,'_max_workers',None)
+            # Vectorized batches are split into one chunk per worker, which requires the number of workers
+            if self.vectorized and (n_workers is None):
+                raise ValueError("The number of workers of `executor` cannot be determined: please provide `n_workers`.")
+        self.profiler = self.get_profiler_(profiler)
+        
+        self.start_(checkpoint_every = checkpoint_every,
+                    checkpoint_path  = checkpoint_path,
+                    resume           = resume,
+                    max_iters        = max_iters,
+                    limit            = limit,
+                    selection        = selection,
+                    mutation         = mutation,
+                    initialization   = initialization,
+                    cahotic_scouts   = cahotic_scouts,
+                    scout_priority   = scout_priority,
+                    warm_start       = warm_start,
+                    warm_values      = warm_values,
+                    tournament_size  = tournament_size,
+                    stagnation_tol   = stagnation_tol,
+                    sf               = sf,
+                    self_adaptive_sf = self_adaptive_sf,
+                    mr               = mr,
+                    random_seed      = random_seed,
+                    history          = history,
+                    history_dtype    = history_dtype,
+                    history_path     = history_path,
+                    stats            = stats)
+        
+        # Evaluation pool (multiprocessing is only imported when needed, to keep `import beeoptimal` fast)
+        n_processes   = (os.cpu_count() if n_jobs == -1 else n_jobs)
+        owns_executor = (n_processes is not None) and (n_processes > 1)
+        if owns_executor:
+            from concurrent.futures import ProcessPoolExecutor
+        self.executor  = ProcessPoolExecutor(max_workers=n_processes) if owns_executor else executor
+        self.n_workers = n_processes if owns_executor else n_workers
+        
+        progress_bar = get_progress_bar(total=self.max_iters,desc='Running Optimization',initial=self.actual_iters,disable= not verbose)
+        try:
+            if self.profiler is not None:
+                self.profiler.enable()
+            # Optimization Loop
+            while not self.finished:
+                completed_iters = self.actual_iters
+                if self.stats is None:
+                    self.tell(self.evaluate_(self.ask()))
+                else:
+                    candidates = self.ask()
+                    start      = time.perf_counter()
+                    values     = self.evaluate_(candidates)
+                    self.stats.evaluation_time[self.stats_row_()] += time.perf_counter() - start
+                    self.tell(values)
+                progress_bar.update(self.actual_iters - progress_bar.n)
+                if checkpoint_every and (self.actual_iters > completed_iters) and (self.actual_iters % checkpoint_every == 0):
+                    self.save_checkpoint(checkpoint_path)
+            
+            if verbose and self.stagnated:
+                progress_bar.write(f"Early termination: Optimization stagnated at iteration {self.actual_iters} / {self.max_iters}")
+        finally:
+            if self.profiler is not None:
+                self.profiler.disable()
+            progress_bar.close()
+            if owns_executor:
+                self.executor.shutdown()
+            self.executor  = None
+            self.n_workers = None
+            self.history.flush()
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    async def optimize_async(self,
+                             max_iters        = 1000,
+                             limit            = 'default',
+                             selection        = 'RouletteWheel',
+                             mutation         = 'StandardABC',
+                             initialization   = 'random',
+                             cahotic_scouts   = 'full',
+                             scout_priority   = 'index',
+                             warm_start       = None,
+                             warm_values      = None,
+                             tournament_size  = None,
+                             stagnation_tol   = np.NINF,
+                             sf               = 1.0,
+                             self_adaptive_sf = False,
+                             mr               = 1.0,
+                             verbose          = False,
+                             random_seed      = None,
+                             max_concurrency  = None,
+                             history          = 'full',
+                             history_dtype    = np.float64,
+                             history_path     = None,
+                             checkpoint_every = None,
+                             checkpoint_path  = None,
+                             resume           = False,
+                             stats            = False,
+                             profiler         = None):
+        """
+        Runs the optimization process with a coroutine objective function (i.e. `async def function(position)`).
+        The candidates of each phase are evaluated concurrently.
+
+        Args:
+            max_iters (int, optional)        : The maximum number of iterations. Defaults to 1000.
+            limit (int or str, optional)     : The trial limit for scout bees. If 'default', it is set to 0.6 * n_employed_bees * dimensionality. Defaults to 'default'.
+            selection (str, optional)        : The selection strategy for onlooker bees. Must be one among 'RouletteWheel', 'Tournament' and 'StochasticUniversalSampling'. Defaults to 'RouletteWheel'.
             mutation (str, optional)         : The mutation strategy. Must be one among 'StandardABC', 'ModifiedABC', 'ABC/best/1' and 'ABC/best/2'. Defaults to 'StandardABC'.
             initialization (str, optional)   : The initialization strategy for the bee population. Must be one among 'random' and 'cahotic'. Defaults to 'random'.
+            cahotic_scouts (str, optional)   : How scouts are reinitialized with the 'cahotic' initialization. Must be one among 'full' (each scout evaluates
+                                               its own pool of chaotic and opposite positions), 'pool' (the scouts of each iteration share a single pool of chaotic and opposite positions)
+                                               and 'pair' (each scout evaluates one chaotic position and its opposite). Defaults to 'full'.
+            scout_priority (str, optional)   : Which exhausted food sources are abandoned first when they are more than `max_scouts`.
+                                               Must be one among 'index' (lowest indices first) and 'stalest' (highest trial counters first). Defaults to 'index'.
+            warm_start (optional)            : Positions seeding the employed bees instead of the initialization strategy: a numpy array of shape `(M,D)`,
+                                               a previous `ArtificialBeeColony` or the path of a checkpoint (see `save_checkpoint`). Defaults to None.
+            warm_values (optional)           : The known objective values of `warm_start`, with shape `(M,)`, or True to reuse the values stored in the
+                                               colony or checkpoint. Defaults to None (the positions are evaluated).
             tournament_size (int, optional)  : The size of the tournament for the 'Tournament' selection strategy. Defaults to None.
             stagnation_tol (float, optional) : The tolerance for stagnation in fitness values to trigger early termination. Defaults to np.NINF (i.e. stagnation disabled).
             sf (float, optional)             : The scaling factor for mutations. Defaults to 1.0.
             self_adaptive_sf (bool, optional): Whether to use a self-adaptive scaling factor. Defaults to False.
             mr (float, optional)             : The mutation rate for 'ModifiedABC' strategy. Defaults to 1.0.
             verbose (bool, optional)         : Whether to display optimization progress. Defaults to False.
-            random_seed (int, optional)      : The seed for random number generation. Defaults to None.
+            random_seed (int, optional)      : The seed for random number generation: an integer, a `np.random.SeedSequence` or a `np.random.Generator`.
+                                               Defaults to None (the current `rng` is used).
+            max_concurrency (int, optional)  : The maximum number of evaluations awaited at the same time. Defaults to None (a whole phase at once).
+            history (str or int, optional)   : What is recorded along the optimization. Must be one among 'none', 'best', 'full' or a positive integer. Defaults to 'full'.
+            history_dtype (dtype, optional)  : The floating point type used to store the recorded positions. Defaults to np.float64.
+            history_path (str, optional)     : A directory where the history is streamed as memory-mapped `.npy` files. Defaults to None.
+            checkpoint_every (int, optional) : Saves a checkpoint to `checkpoint_path` every `checkpoint_every` iterations (see `save_checkpoint`).
+                                               Defaults to None (no checkpoints).
+            checkpoint_path (str, optional)  : The file where checkpoints are saved and resumed from. Defaults to None.
+            resume (bool, optional)          : Whether to resume the optimization from `checkpoint_path`, if it exists. The configuration stored in
+                                               the checkpoint is used, and the remaining arguments are ignored. Defaults to False.
+            stats (bool, optional)           : Whether to record the time spent in each phase, in the history and in the objective function at each iteration
+                                               (see `ColonyStats`), exposed as `stats`. Defaults to False.
+            profiler (optional)              : A `cProfile.Profile` enabled during the optimization loop, or True to create a new one. It is exposed as
+                                               `profiler` (e.g. for `pstats.Stats(abc.profiler)`). Defaults to None (no profiling).
+        
+        Raises:
+            TypeError : If `verbose` is not a boolean.
+            ValueError: If `max_concurrency` is not a positive integer.
+            ValueError: If `checkpoint_every` is not a positive integer.
+            ValueError: If `checkpoint_every` or `resume` are provided without `checkpoint_path`.
+            TypeError : If `profiler` is not a `cProfile.Profile` or True.
+            ValueError: If any of the remaining arguments is invalid (see `setup`).
+        
+        Examples:
+            >>> async def objective(position):
+            ...     return await model_server.predict(position)
+            >>> abc = ArtificialBeeColony(colony_size=50,function=objective,bounds=np.array([(-5.0,5.0)]*10))
+            >>> asyncio.run(abc.optimize_async(max_iters=500,max_concurrency=16))
+        
+        .. note::
+            Selection, scouts and stagnation behave exactly as in `optimize`, and results are identical for a given seed.
+            With a vectorized colony, `function` is awaited once per phase with the whole batch of positions.
+            Plain (non-coroutine) functions are accepted too, but they block the event loop.
+        """
+        
+        if not isinstance(verbose,bool):
+            raise TypeError("`verbose` must be bool")
+        if (max_concurrency is not None) and not (isinstance(max_concurrency,int) and (max_concurrency >= 1)):
+            raise ValueError(f"`max_concurrency` must be a positive integer, but got {max_concurrency}")
+        self.profiler = self.get_profiler_(profiler)
+        
+        self.start_(checkpoint_every = checkpoint_every,
+                    checkpoint_path  = checkpoint_path,
+                    resume           = resume,
+                    max_iters        = max_iters,
+                    limit            = limit,
+                    selection        = selection,
+                    mutation         = mutation,
+                    initialization   = initialization,
+                    cahotic_scouts   = cahotic_scouts,
+                    scout_priority   = scout_priority,
+                    warm_start       = warm_start,
+                    warm_values      = warm_values,
+                    tournament_size  = tournament_size,
+                    stagnation_tol   = stagnation_tol,
+                    sf               = sf,
+                    self_adaptive_sf = self_adaptive_sf,
+                    mr               = mr,
+                    random_seed      = random_seed,
+                    history          = history,
+                    history_dtype    = history_dtype,
+                    history_path     = history_path,
+                    stats            = stats)
+        
+        import asyncio
+        semaphore    = asyncio.Semaphore(max_concurrency) if max_concurrency is not None else None
+        progress_bar = get_progress_bar(total=self.max_iters,desc='Running Optimization',initial=self.actual_iters,disable= not verbose)
+        try:
+            if self.profiler is not None:
+                self.profiler.enable()
+            # Optimization Loop
+            while not self.finished:
+                completed_iters = self.actual_iters
+                if self.stats is None:
+                    self.tell(await self.evaluate_async_(self.ask(),semaphore=semaphore))
+                else:
+                    candidates = self.ask()
+                    start      = time.perf_counter()
+                    values     = await self.evaluate_async_(candidates,semaphore=semaphore)
+                    self.stats.evaluation_time[self.stats_row_()] += time.perf_counter() - start
+                    self.tell(values)
+                progress_bar.update(self.actual_iters - progress_bar.n)
+                if checkpoint_every and (self.actual_iters > completed_iters) and (self.actual_iters % checkpoint_every == 0):
+                    self.save_checkpoint(checkpoint_path)
+            
+            if verbose and self.stagnated:
+                progress_bar.write(f"Early termination: Optimization stagnated at iteration {self.actual_iters} / {self.max_iters}")
+        finally:
+            if self.profiler is not None:
+                self.profiler.disable()
+            progress_bar.close()
+            self.history.flush()
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def start_(self,checkpoint_every,checkpoint_path,resume,**setup_args):
+        """
+        Validates the checkpointing arguments, then either resumes the optimization from `checkpoint_path` or sets up a new one.
+
+        Args:
+            checkpoint_every (int) : The number of iterations between checkpoints (None for no checkpoints).
+            checkpoint_path (str)  : The file where checkpoints are saved and resumed from.
+            resume (bool)          : Whether to resume the optimization from `checkpoint_path`, if it exists.
+            **setup_args           : The arguments of `setup`, used when the optimization is not resumed.
+        """
+        
+        if (checkpoint_every is not None) and not (isinstance(checkpoint_every,int) and (checkpoint_every >= 1)):
+            raise ValueError(f"`checkpoint_every` must be a positive integer, but got {checkpoint_every}")
+        if not isinstance(resume,bool):
+            raise TypeError("`resume` must be bool")
+        if ((checkpoint_every is not None) or resume) and (checkpoint_path is None):
+            raise ValueError("Please provide a `checkpoint_path` to save or resume checkpoints.")
+        
+        if resume and os.path.exists(checkpoint_path):
+            self.load_checkpoint(checkpoint_path)
+            if not isinstance(setup_args['stats'],bool):
+                raise TypeError("`stats` must be bool")
+            # Timings are not checkpointed: the rows of the iterations before the checkpoint stay zero
+            self.stats = ColonyStats(self.max_iters) if setup_args['stats'] else None
+        else:
+            self.setup(**setup_args)
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    @staticmethod
+    def get_profiler_(profiler):
+        """
+        Validates the `profiler` argument of the optimization (cProfile is only imported when profiling is requested).
+
+        Args:
+            profiler: A `cProfile.Profile`, True to create a new one, or None.
+
+        Returns:
+            cProfile.Profile: The profiler of the optimization loop (None if profiling is disabled).
+        """
+        
+        if profiler is None:
+            return None
+        import cProfile
+        if profiler is True:
+            return cProfile.Profile()
+        if not isinstance(profiler,cProfile.Profile):
+            raise TypeError("`profiler` must be a `cProfile.Profile` or True.")
+        return profiler
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def save_checkpoint(self,path):
+        """
+        Saves the whole state of the optimization (configuration, colony, history, random number generator and pending candidates)
+        to a `.npz` file, so that it can be resumed with `load_checkpoint`.
+
+        Args:
+            path (str): The file where the checkpoint is saved.
+
+        Raises:
+            RuntimeError: If the optimization was not set up (see `setup`).
+        
+        .. note::
+            The objective function is not saved: the checkpoint is loaded into a colony built with the same function and bounds.
+            Histories streamed to disk (`history_path`) are flushed and referenced, while in-memory histories are stored in the checkpoint.
+            The file is written atomically, so an interrupted save never corrupts the previous checkpoint.
+        """
+        
+        if self.phase is None:
+            raise RuntimeError("Please call `setup` before `save_checkpoint`.")
+        
+        state = {'n_employed_bees'  : self.n_employed_bees,
+                 'dim'              : self.dim,
+                 'max_iters'        : self.max_iters,
+                 'limit'            : self.limit,
+                 'selection'        : self.selection,
+                 'mutation'         : self.mutation,
+                 'initialization'   : self.initialization,
+                 'cahotic_scouts'   : self.cahotic_scouts,
+                 'scout_priority'   : self.scout_priority,
+                 'tournament_size'  : getattr(self,'tournament_size',None),
+                 'stagnation_tol'   : self.stagnation_tol,
+                 'sf'               : self.sf,
+                 'initial_sf'       : self.initial_sf,
+                 'self_adaptive_sf' : self.self_adaptive_sf,
+                 'mr'               : self.mr,
+                 'phase'            : self.phase,
+                 'actual_iters'     : self.actual_iters,
+                 'n_evaluations'    : self.n_evaluations,
+                 'stagnated'        : self.stagnated,
+                 'rng_state'        : self.rng.bit_generator.state,
+                 'history_mode'     : self.history.mode,
+                 'history_dtype'    : self.history.dtype.str,
+                 'history_path'     : self.history.path,
+                 'history_records'  : self.history.n_records,
+                 'history_snapshots': self.history.n_snapshots}
+        
+        # Arrays of the generator state (e.g. the key of MT19937) are stored as lists
+        arrays = {'state'              : np.array(json.dumps(state,default=lambda value: value.tolist())),
+                  'positions'          : self.positions,
+                  'values'             : self.values,
+                  'fitness'            : self.fitness,
+                  'trials'             : self.trials,
+                  'onlooker_positions' : self.onlooker_positions,
+                  'onlooker_values'    : self.onlooker_values}
+        if self.mutation == 'DirectedABC':
+            arrays['directions'] = self.directions
+        if self.optimal_bee is not None:
+            arrays['optimal_position'] = self.optimal_bee.position
+            arrays['optimal_value']    = np.array(self.optimal_bee.value)
+        if self._pending is not None:
+            arrays.update({f'pending_{key}': value for key,value in self._pending.items() if value is not None})
+        
+        self.history.flush()
+        if self.history.path is None:
+            arrays.update({'history_best_positions' : self.history.best_positions,
+                           'history_best_values'    : self.history.best_values,
+                           'history_positions'      : self.history.positions,
+                           'history_values'         : self.history.values,
+                           'history_trials'         : self.history.trials,
+                           'history_iterations'     : self.history.iterations})
+        
+        temporary_path = f'{path}.tmp'
+        with open(temporary_path,'wb') as f:
+            np.savez(f,**arrays)
+        os.replace(temporary_path,path)
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def load_checkpoint(self,path):
+        """
+        Restores the state of an optimization saved with `save_checkpoint`. The optimization can then be continued
+        with the ask/tell interface or with `optimize(resume=True)`.
+
+        Args:
+            path (str): The checkpoint file.
+
+        Raises:
+            FileNotFoundError: If `path` does not exist.
+            ValueError       : If the checkpoint was saved by a colony with a different number of employed bees or dimensionality.
+        """
+        
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No checkpoint found at: {path}")
+        
+        with np.load(path,allow_pickle=False) as checkpoint:
+            arrays = {key: checkpoint[key] for key in checkpoint.files}
+        state = json.loads(arrays['state'].item())
+        
+        if (state['n_employed_bees'],state['dim']) != (self.n_employed_bees,self.dim):
+            raise ValueError(f"The checkpoint was saved by a colony with {state['n_employed_bees']} employed bees in {state['dim']} dimensions, "
+                             f"but this colony has {self.n_employed_bees} employed bees in {self.dim} dimensions.")
+        
+        for attribute in ['max_iters','limit','selection','mutation','initialization','cahotic_scouts','scout_priority','stagnation_tol',
+                          'sf','initial_sf','self_adaptive_sf','mr','phase','actual_iters','n_evaluations','stagnated']:
+            setattr(self,attribute,state[attribute])
+        if state['tournament_size'] is not None:
+            self.tournament_size = state['tournament_size']
+        
+        # The bit generator is rebuilt with the same type as the saved one (e.g. MT19937), then its state is restored
+        self.rng = np.random.Generator(getattr(np.random,state['rng_state']['bit_generator'])())
+        self.rng.bit_generator.state = state['rng_state']
+        
+        self.positions          = arrays['positions']
+        self.values             = arrays['values']
+        self.fitness            = arrays['fitness']
+        self.trials             = arrays['trials']
+        self.onlooker_positions = arrays['onlooker_positions']
+        self.onlooker_values    = arrays['onlooker_values']
+        self.directions         = arrays['directions'] if self.mutation == 'DirectedABC' else np.full((self.n_employed_bees,self.dim),None)
+        self.optimal_bee        = None
+        if 'optimal_position' in arrays:
+            self.optimal_bee = Bee(position = arrays['optimal_position'],
+                                   function = self.function,
+                                   bounds   = self.bounds,
+                                   value    = arrays['optimal_value'].item())
+            self.optimal_bee.trial = int(self.trials[np.argmax(self.fitness)])
+        
+        pending          = {key[len('pending_'):]: value for key,value in arrays.items() if key.startswith('pending_')}
+        self._pending    = ({'mutated_dims': None} | pending) if pending else None
+        self._cache_hits = 0
+        
+        if state['history_path'] is None:
+            self.history = ColonyHistory(mode      = state['history_mode'],
+                                         n_bees    = self.n_employed_bees,
+                                         dim       = self.dim,
+                                         max_iters = self.max_iters,
+                                         dtype     = state['history_dtype'])
+            self.history.restore(best_positions = arrays['history_best_positions'],
+                                 best_values    = arrays['history_best_values'],
+                                 positions      = arrays['history_positions'],
+                                 values         = arrays['history_values'],
+                                 trials         = arrays['history_trials'],
+                                 iterations     = arrays['history_iterations'])
+        else:
+            # Records written after the checkpoint are discarded, and overwritten as the optimization goes on
+            self.history             = ColonyHistory.load(state['history_path'],mmap_mode='r+')
+            self.history.n_records   = state['history_records']
+            self.history.n_snapshots = state['history_snapshots']
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def setup(self,
+              max_iters        = 1000,
+              limit            = 'default',
+              selection        = 'RouletteWheel',
+              mutation         = 'StandardABC',
+              initialization   = 'random',
+              cahotic_scouts   = 'full',
+              scout_priority   = 'index',
+              warm_start       = None,
+              warm_values      = None,
+              tournament_size  = None,
+              stagnation_tol   = np.NINF,
+              sf               = 1.0,
+              self_adaptive_sf = False,
+              mr               = 1.0,
+              random_seed      = None,
+              history          = 'full',
+              history_dtype    = np.float64,
+              history_path     = None,
+              stats            = False):
+        """
+        Sets the optimization parameters and prepares the colony for the ask/tell interface (`optimize` calls it internally).
+
+        Args:
+            max_iters (int, optional)        : The maximum number of iterations. Defaults to 1000.
+            limit (int or str, optional)     : The trial limit for scout bees. If 'default', it is set to 0.6 * n_employed_bees * dimensionality. Defaults to 'default'.
+            selection (str, optional)        : The selection strategy for onlooker bees. Must be one among 'RouletteWheel', 'Tournament' and 'StochasticUniversalSampling'. Defaults to 'RouletteWheel'.
+            mutation (str, optional)         : The mutation strategy. Must be one among 'StandardABC', 'ModifiedABC', 'ABC/best/1' and 'ABC/best/2'. Defaults to 'StandardABC'.
+            initialization (str, optional)   : The initialization strategy for the bee population. Must be one among 'random' and 'cahotic'. Defaults to 'random'.
+            cahotic_scouts (str, optional)   : How scouts are reinitialized with the 'cahotic' initialization. Must be one among 'full' (each scout evaluates
+                                               its own pool of chaotic and opposite positions), 'pool' (the scouts of each iteration share a single pool of chaotic and opposite positions)
+                                               and 'pair' (each scout evaluates one chaotic position and its opposite). Defaults to 'full'.
+            scout_priority (str, optional)   : Which exhausted food sources are abandoned first when they are more than `max_scouts`.
+                                               Must be one among 'index' (lowest indices first) and 'stalest' (highest trial counters first). Defaults to 'index'.
+            warm_start (optional)            : Positions seeding the employed bees instead of the initialization strategy: a numpy array of shape `(M,D)`,
+                                               a previous `ArtificialBeeColony` or the path of a checkpoint (see `save_checkpoint`). Defaults to None.
+            warm_values (optional)           : The known objective values of `warm_start`, with shape `(M,)`, or True to reuse the values stored in the
+                                               colony or checkpoint. Defaults to None (the positions are evaluated).
+            tournament_size (int, optional)  : The size of the tournament for the 'Tournament' selection strategy. Defaults to None.
+            stagnation_tol (float, optional) : The tolerance for stagnation in fitness values to trigger early termination. Defaults to np.NINF (i.e. stagnation disabled).
+            sf (float, optional)             : The scaling factor for mutations. Defaults to 1.0.
+            self_adaptive_sf (bool, optional): Whether to use a self-adaptive scaling factor. Defaults to False.
+            mr (float, optional)             : The mutation rate for 'ModifiedABC' strategy. Defaults to 1.0.
+            random_seed (int, optional)      : The seed for random number generation: an integer, a `np.random.SeedSequence` or a `np.random.Generator`.
+                                               Defaults to None (the current `rng` is used).
+            history (str or int, optional)   : What is recorded along the optimization. Must be one among 'none', 'best', 'full' or a positive integer. Defaults to 'full'.
+            history_dtype (dtype, optional)  : The floating point type used to store the recorded positions. Defaults to np.float64.
+            history_path (str, optional)     : A directory where the history is streamed as memory-mapped `.npy` files. Defaults to None.
+            stats (bool, optional)           : Whether to record the time spent in each phase and in the history at each iteration (see `ColonyStats`). Defaults to False.
         
         Raises:
             ValueError: If `max_iters` is not a positive integer.
             ValueError: If `mutation` is not one of ['StandardABC', 'ModifiedABC', 'ABC/best/1', 'ABC/best/2', 'DirectedABC'].
             ValueError: If `initialization` is not one of ['random', 'cahotic'].
-            ValueError: If `selection` is not one of ['RouletteWheel', 'Tournament'].
+            ValueError: If `cahotic_scouts` is not one of ['full', 'pool', 'pair'].
+            ValueError: If `scout_priority` is not one of ['index', 'stalest'].
+            ValueError: If `warm_start` is not a non-empty array of shape `(M,D)`, or `warm_values` does not contain one value per position.
+            ValueError: If `selection` is not one of ['RouletteWheel', 'Tournament', 'StochasticUniversalSampling'].
             ValueError: If `mr` is not a float value between 0.0 and 1.0.
             ValueError: If `selection` is 'Tournament' and `tournament_size` is not an integer between 1 and `n_employed_bees`.
             ValueError: If `sf` is not a float value greater than 0.
             ValueError: If `limit` is less than or equal to 0.
             TypeError : If `self_adaptive_sf` is not a boolean.
             TypeError : If `stagnation_tol` is not a float.
+            ValueError: If `history` is not one among 'none', 'best', 'full' or a positive integer.
+            TypeError : If `history_dtype` is not a floating point type.
+            TypeError : If `stats` is not a boolean.
+        
+        Examples:
+            >>> abc = ArtificialBeeColony(colony_size=50,function=Sphere10d.fun,bounds=Sphere10d.bounds)
+            >>> abc.setup(max_iters=500,random_seed=42)
+            >>> while not abc.finished:
+            ...     candidates = abc.ask()
+            ...     abc.tell(my_scheduler.evaluate(candidates))   # values may come from anywhere
+        
+        .. note::
+            With `warm_start`, the employed bees are the fittest `n_employed_bees` among the warm start positions and, if these are less than
+            `n_employed_bees`, the positions generated by the initialization strategy for the remaining bees.
         """
     
         # Sanity checks and setting optimization parameters
@@ -182,7 +794,17 @@ class ArtificialBeeColony():
             raise ValueError(f"{initialization} is an invalid intialization. Choose one among {', '.join(valid_initializations_)}.")
         self.initialization = initialization
         
-        valid_selections_ = ['RouletteWheel','Tournament']
+        valid_cahotic_scouts_ = ['full','pool','pair']
+        if cahotic_scouts not in valid_cahotic_scouts_:
+            raise ValueError(f"{cahotic_scouts} is an invalid scouts reinitialization. Choose one among {', '.join(valid_cahotic_scouts_)}.")
+        self.cahotic_scouts = cahotic_scouts
+        
+        valid_scout_priorities_ = ['index','stalest']
+        if scout_priority not in valid_scout_priorities_:
+            raise ValueError(f"{scout_priority} is an invalid scout priority. Choose one among {', '.join(valid_scout_priorities_)}.")
+        self.scout_priority = scout_priority
+        
+        valid_selections_ = ['RouletteWheel','Tournament','StochasticUniversalSampling']
         if selection not in valid_selections_:
             raise ValueError(f"{selection} is an invalid selection. Choose one among {', '.join(valid_selections_)}.")
         self.selection = selection
@@ -218,95 +840,415 @@ class ArtificialBeeColony():
             raise TypeError('`stagnation_tol` must be float')
         self.stagnation_tol   = stagnation_tol
         
-        if not isinstance(verbose,bool):
-            raise TypeError("`verbose` must be bool")
+        self.history = ColonyHistory(mode      = history,
+                                     n_bees    = self.n_employed_bees,
+                                     dim       = self.dim,
+                                     max_iters = self.max_iters,
+                                     dtype     = history_dtype,
+                                     path      = history_path)
         
-        #.....................................................................................................................................          
+        if not isinstance(stats,bool):
+            raise TypeError("`stats` must be bool")
+        self.stats = ColonyStats(self.max_iters) if stats else None
+        #.....................................................................................................................................
+        
+        if random_seed is not None:
+            self.rng = np.random.default_rng(random_seed)
+        
+        self.n_evaluations = 0
+        self._cache_hits   = 0
+        self.stagnated     = False
+        self.phase         = 'initialization'
+        start              = time.perf_counter()
+        self._pending      = self.initialization_ask_(*self.warm_start_(warm_start,warm_values))
+        if self.stats is not None:
+            self.stats.add_phase_('initialization',0,time.perf_counter() - start)
+        
+        # A warm start with known values may not need any evaluation
+        if len(self._pending['candidates']) == 0:
+            self.tell(np.empty(0))
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    @property
+    def finished(self):
+        """
+        Whether the optimization is over, i.e. `max_iters` iterations were performed or the colony stagnated.
+
+        Returns:
+            bool: True if the optimization is finished.
+        """
+        return self.phase == 'finished'
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def spawn(self,n_children):
+        """
+        Spawns independent random number generators from the one of the colony, e.g. to seed colonies running in parallel.
+
+        Args:
+            n_children (int): The number of generators to spawn.
+
+        Returns:
+            list[Generator]: The child generators, statistically independent from `rng` and from each other.
+        
+        Examples:
+            >>> parent = ArtificialBeeColony(colony_size=50,function=Sphere10d.fun,bounds=Sphere10d.bounds)
+            >>> parent.rng = np.random.default_rng(42)
+            >>> colonies = [ArtificialBeeColony(colony_size=50,function=Sphere10d.fun,bounds=Sphere10d.bounds) for _ in range(4)]
+            >>> for colony,rng in zip(colonies,parent.spawn(4)):
+            ...     colony.optimize(random_seed=rng)   # reproducible, even when the colonies run in separate threads
+        
+        .. note::
+            Equivalently, child seeds can be obtained without a colony from `np.random.SeedSequence(seed).spawn(n_children)`.
+        """
+        return self.rng.spawn(n_children)
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def ask(self):
+        """
+        Returns the candidate positions of the current phase ('initialization', 'employees', 'onlookers' or 'scouts'),
+        whose objective values must be passed to `tell`.
+
+        Returns:
+            numpy-array: The candidate positions, with shape `(N,D)`.
+        
+        Raises:
+            RuntimeError: If the optimization was not set up (see `setup`) or it is already finished.
+        
+        .. note::
+            Calling `ask` again before `tell` returns the same candidates.
+            The scouts phase is skipped (i.e. never asked) when no food source is exhausted.
+        """
+        
+        if self.phase is None:
+            raise RuntimeError("Please call `setup` before `ask`.")
+        if self.phase == 'finished':
+            raise RuntimeError("The optimization is finished: call `setup` to start a new one.")
+        
+        if self._pending is None:
+            ask_phase = {'initialization' : self.initialization_ask_,
+                         'employees'      : self.employees_ask_,
+                         'onlookers'      : self.onlookers_ask_,
+                         'scouts'         : self.scouts_ask_}[self.phase]
+            if self.stats is None:
+                self._pending = ask_phase()
+            else:
+                start         = time.perf_counter()
+                self._pending = ask_phase()
+                self.stats.add_phase_(self.phase,self.stats_row_(),time.perf_counter() - start)
+        return self._pending['candidates'].copy()
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def tell(self,values):
+        """
+        Applies the greedy selection of the current phase given the objective values of the candidates returned by `ask`,
+        and moves on to the next phase.
+
+        Args:
+            values (array-like): The objective values of the candidates, in the same order, with shape `(N,)`.
+        
+        Raises:
+            RuntimeError: If there are no pending candidates (see `ask`).
+            ValueError  : If `values` does not contain one value per candidate.
+        
+        .. note::
+            At the end of each iteration the optimal bee is updated, the colony is recorded in the history and the stagnation is checked.
+        """
+        
+        if self._pending is None:
+            raise RuntimeError("There are no pending candidates: please call `ask` before `tell`.")
+        values = np.array(values,dtype=float).reshape(-1)
+        if values.shape[0] != len(self._pending['candidates']):
+            raise ValueError(f"`values` must contain one value per candidate, but got {values.shape[0]} values for {len(self._pending['candidates'])} candidates.")
+        
+        # Values served by an `EvaluationCache` (see `evaluate_`) are not objective function evaluations
+        pending,self._pending = self._pending,None
+        n_values              = len(values) - self._cache_hits
+        self.n_evaluations   += n_values
+        self._cache_hits      = 0
+        
+        if self.stats is not None:
+            start = time.perf_counter()
+            row   = self.stats_row_()
+            phase = self.phase
+        
+        if self.phase == 'initialization':
+            self.initialization_tell_(pending,values)
+            self.end_iteration_()
+        elif self.phase == 'employees':
+            self.employees_tell_(pending,values)
+            self.phase = 'onlookers'
+        elif self.phase == 'onlookers':
+            self.onlookers_tell_(pending,values)
+            if (self.max_scouts > 0) and np.any(self.trials > self.limit):
+                if self.stats is not None:
+                    # The scouts ask is timed with the scouts phase
+                    self.stats.add_phase_(phase,row,time.perf_counter() - start,n_values)
+                    start,phase,n_values = time.perf_counter(),'scouts',0
+                self.phase    = 'scouts'
+                self._pending = self.scouts_ask_()
+            else:
+                self.end_iteration_()
+        elif self.phase == 'scouts':
+            self.scouts_tell_(pending,values)
+            self.end_iteration_()
+        
+        if self.stats is not None:
+            self.stats.add_phase_(phase,row,time.perf_counter() - start,n_values)
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def stats_row_(self):
+        """
+        Returns the row of `stats` of the current phase: 0 for the initialization, and the number of the ongoing iteration otherwise.
+        """
+        return 0 if self.phase == 'initialization' else self.actual_iters + 1
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def end_iteration_(self):
+        """
+        Closes the current iteration (or the initialization): updates the optimal bee, checks the termination criteria and sets the next phase.
+        """
+        
+        if self.phase != 'initialization':
+            self.actual_iters += 1
+        
+        self.update_optimal_bee_()
+        
+        # Stagnation
+        if (self.phase != 'initialization') and (np.std(self.fitness) < self.stagnation_tol):
+            self.stagnated = True
+        
+        self.phase = 'finished' if (self.stagnated or self.actual_iters >= self.max_iters) else 'employees'
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def update_optimal_bee_(self):
+        """
+        Updates the optimal bee and records the current state of the colony in the history.
+        """
+        
+        best_idx         = np.argmax(self.fitness)
+        self.optimal_bee = self.get_bee_(best_idx)
+        start            = time.perf_counter()
+        self.history.record(iteration = self.actual_iters,
+                            positions = self.positions,
+                            values    = self.values,
+                            trials    = self.trials,
+                            best_idx  = best_idx)
+        if self.stats is not None:
+            self.stats.add_history_(self.actual_iters,time.perf_counter() - start)
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def warm_start_(self,warm_start,warm_values):
+        """
+        Reads the warm start positions (and their known values, if any).
+
+        Args:
+            warm_start (numpy-array, ArtificialBeeColony or str) : The warm start positions, a previous colony or the path of a checkpoint.
+            warm_values (numpy-array or bool)                    : The known objective values, or True to reuse the stored ones.
+
+        Returns:
+            tuple: The warm start positions, clipped to the bounds, and their values (None if they must be evaluated).
+        """
+        
+        if warm_start is None:
+            if warm_values is not None:
+                raise ValueError("`warm_values` requires `warm_start`.")
+            return None,None
+        
+        stored_values = None
+        if isinstance(warm_start,ArtificialBeeColony):
+            positions,stored_values = warm_start.positions,warm_start.values
+        elif isinstance(warm_start,(str,os.PathLike)):
+            with np.load(warm_start,allow_pickle=False) as checkpoint:
+                positions,stored_values = checkpoint['positions'],checkpoint['values']
+        else:
+            positions = warm_start
+        
+        positions = np.array(positions,dtype=float)
+        if not ((positions.ndim == 2) and (positions.shape[0] > 0) and (positions.shape[1] == self.dim)):
+            raise ValueError(f"`warm_start` must contain at least one position of dimension {self.dim}, but got shape {positions.shape}.")
+        np.clip(positions,self.bounds[:,0],self.bounds[:,1],out=positions)
+        
+        if warm_values is None:
+            return positions,None
+        if warm_values is True:
+            if stored_values is None:
+                raise ValueError("`warm_values=True` requires a colony or a checkpoint as `warm_start`.")
+            warm_values = stored_values
+        values = np.array(warm_values,dtype=float).reshape(-1)
+        if values.shape[0] != positions.shape[0]:
+            raise ValueError(f"`warm_values` must contain one value per position, but got {values.shape[0]} values for {positions.shape[0]} positions.")
+        return positions,values
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def initialization_ask_(self,warm_positions=None,warm_values=None):
+        """
+        Generates the initial positions according to the initialization strategy, for the bees that are not seeded by a warm start.
+
+        Args:
+            warm_positions (numpy-array, optional) : The warm start positions. Defaults to None.
+            warm_values (numpy-array, optional)    : The known objective values of the warm start positions. Defaults to None.
+
+        Returns:
+            dict: The pending candidates of the initialization, together with the positions whose values are already known.
+        """
+        
+        if warm_positions is None:
+            warm_positions = np.empty((0,self.dim))
+        n_missing = max(self.n_employed_bees - len(warm_positions),0)
         
-        # Initialization
-        if random_seed:
-            np.random.seed(random_seed)
-            
         if self.initialization == 'random':
-            self.employed_bees = [Bee(position = np.random.uniform(self.bounds[:,0],self.bounds[:,1],self.dim),
-                                      function = self.function,
-                                      bounds   = self.bounds) for _ in range(self.n_employed_bees) ]
+            new_positions = self.random_positions_(n_positions=n_missing)
         elif self.initialization == 'cahotic':
-            # Define cahotic map and iterate over it
-            cahotic_map = np.random.rand(self.n_employed_bees,self.dim)
-            for _ in range(300):
-                cahotic_map = np.sin(cahotic_map * np.pi)    
-                
-            cahotic_pop  = [Bee(position = self.bounds[:,0] + (self.bounds[:,1] - self.bounds[:,0]) * cahotic_map[i,:],
-                                function = self.function,
-                                bounds   = self.bounds) for i in range(self.n_employed_bees) ]
-            opposite_pop = [Bee(position = self.bounds[:,0] + self.bounds[:,1] - cahotic_pop[i].position,
-                                function = self.function,
-                                bounds   = self.bounds) for i in range(self.n_employed_bees) ]
-            
-            self.employed_bees = sorted(cahotic_pop+opposite_pop, key=lambda bee: bee.fitness, reverse=True)[:self.n_employed_bees]
-            
-        self.colony_history.append(copy.deepcopy(self.employed_bees))
-        self.optimal_bee = copy.deepcopy(max(self.employed_bees,key=lambda bee: bee.fitness))
-        self.optimal_bee_history.append(copy.deepcopy(self.optimal_bee))
+            new_positions = self.cahotic_positions_(n_positions=n_missing)
         
-        #.....................................................................................................................................
+        if warm_values is None:
+            return {'candidates'      : np.vstack([warm_positions,new_positions]),
+                    'known_positions' : np.empty((0,self.dim)),
+                    'known_values'    : np.empty(0)}
+        return {'candidates'      : new_positions,
+                'known_positions' : warm_positions,
+                'known_values'    : warm_values}
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def initialization_tell_(self,pending,values):
+        """
+        Initializes the employed bees from the evaluated initial positions.
+
+        Args:
+            pending (dict)       : The pending candidates of the initialization.
+            values (numpy-array) : The objective values of the candidates.
         
-        # Optimization Loop
-        for _ in trange(self.max_iters,desc='Running Optimization',disable= not verbose,bar_format='{l_bar}{bar}|[{elapsed}<{remaining}]'):
-            
-            self.actual_iters += 1
-            
-            self.employees_phase_()
-            self.onlookers_phase_()
-            self.scouts_phase_()
-            
-            self.colony_history.append(copy.deepcopy(self.employed_bees))
-            self.optimal_bee = copy.deepcopy(max(self.employed_bees,key=lambda bee: bee.fitness))
-            self.optimal_bee_history.append(copy.deepcopy(self.optimal_bee))
-            
-            # Stagnation
-            if (np.std([bee.fitness for bee in self.employed_bees]) < self.stagnation_tol):
-                if verbose:
-                    tqdm.write(f"Early termination: Optimization stagnated at iteration {self.actual_iters} / {self.max_iters}")
-                break
-        #.....................................................................................................................................
+        .. note::
+            When there are more initial positions than employed bees (e.g. cahotic and opposite bees), the fittest ones are kept.
+        """
+        
+        positions = np.vstack([pending['known_positions'],pending['candidates']])
+        values    = np.concatenate([pending['known_values'],values])
+        
+        if len(values) > self.n_employed_bees:
+            fittest_idx = np.argsort(-self.compute_fitness_(values),kind='stable')[:self.n_employed_bees]
+            positions   = positions[fittest_idx]
+            values      = values[fittest_idx]
+        
+        self.positions = positions
+        self.values    = values
+        self.fitness   = self.compute_fitness_(self.values)
+        self.trials    = np.zeros(self.n_employed_bees,dtype=int)
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    @property
+    def colony_history(self):
+        """
+        The employed bees at each recorded iteration, built on access from `history`.
+
+        Returns:
+            BeeHistoryView: A read-only sequence of `list[Bee]` (empty if the colony was not recorded).
+        """
+        if self.history is None:
+            return []
+        return self.history.colony_bees(function=self.function,bounds=self.bounds)
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    @property
+    def optimal_bee_history(self):
+        """
+        The optimal bee at each iteration, built on access from `history`.
+
+        Returns:
+            BeeHistoryView: A read-only sequence of `Bee` (empty if the optimal bee was not recorded).
+        """
+        if self.history is None:
+            return []
+        return self.history.best_bees(function=self.function,bounds=self.bounds)
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    @property
+    def employed_bees(self):
+        """
+        The employed bees in the colony, built on demand from the colony arrays.
+
+        Returns:
+            list[Bee]: The employed bees (as independent Bee instances).
+        """
+        return [self.get_bee_(bee_idx) for bee_idx in range(len(self.positions))]
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    @property
+    def onlooker_bees(self):
+        """
+        The onlooker bees of the last onlooker phase, built on demand from the colony arrays.
+
+        Returns:
+            list[Bee]: The onlooker bees (as independent Bee instances).
+        """
+        return [Bee(position = position.copy(),
+                    function = self.function,
+                    bounds   = self.bounds,
+                    value    = value) for position,value in zip(self.onlooker_positions,self.onlooker_values)]
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def employees_ask_(self):
+        """
+        Generates the candidates of the employed bees phase, where each employed bee explores the neighborhood of its food source.
+
+        Returns:
+            dict: The pending candidates of the employed bees, together with their mutated dimensions.
+        
+        .. note::
+            Candidates are generated for the whole colony at once, starting from the food sources at the beginning of the phase.
+        """
+        
+        candidates,mutated_dims = self.get_candidates_(population=self.positions,directions=self.directions)
+        return {'candidates': candidates, 'mutated_dims': mutated_dims}
     
     #------------------------------------------------------------------------------------------------------------------
     
-    def employees_phase_(self):
+    def employees_tell_(self,pending,values):
         """
-        Performs the employed bees phase, where each employed bee explores the search space by generating candidate solutions.
+        Completes the employed bees phase.
 
+        Args:
+            pending (dict)       : The pending candidates of the employed bees.
+            values (numpy-array) : The objective values of the candidates.
+        
         .. note::
             Updates the employed bees with better candidate solutions based on the greedy selection.
             Adjusts the scaling factor if self-adaptive scaling is enabled.
         """
         
-        succesful_mutations = 0
-        for bee_idx, bee in enumerate(self.employed_bees):
-            candidate_bee = self.get_candidate_neighbor_(bee=bee,bee_idx=bee_idx,population=self.employed_bees)
-            # Greedy Selection
-            if candidate_bee.fitness >= bee.fitness:
-                self.employed_bees[bee_idx] = candidate_bee
-                succesful_mutations += 1
+        candidates        = pending['candidates']
+        candidate_fitness = self.compute_fitness_(values)
         
-                if self.mutation == 'DirectedABC':
-                    if (bee.position != candidate_bee.position).any(): # this is needed when candidate_bee.fitness == bee.fitness
-                        # Retrieve the index mutated and update the direction
-                        j = np.where(bee.position != candidate_bee.position)[0][0]
-                        self.directions[bee_idx,j] = np.sign(candidate_bee.position[j] - bee.position[j])
-                
-            else:
-                bee.trial += 1
-                
-                if self.mutation == 'DirectedABC':
-                    # Retrieve the index mutated and update the direction
-                    j = np.where(bee.position != candidate_bee.position)[0][0]
-                    self.directions[bee_idx,j] = 0
+        # Greedy Selection
+        improved = candidate_fitness >= self.fitness
+        if self.mutation == 'DirectedABC':
+            self.update_directions_(bee_indices  = np.arange(self.n_employed_bees),
+                                    mutated_dims = pending['mutated_dims'],
+                                    candidates   = candidates,
+                                    improved     = improved)
+        
+        self.positions[improved] = candidates[improved]
+        self.values[improved]    = values[improved]
+        self.fitness[improved]   = candidate_fitness[improved]
+        self.trials[~improved]  += 1
                 
         if self.self_adaptive_sf:
-            self.update_SF_(succesful_mutations_ratio= (succesful_mutations / self.n_employed_bees) )
+            self.update_SF_(succesful_mutations_ratio= (np.sum(improved) / self.n_employed_bees) )
             
     #------------------------------------------------------------------------------------------------------------------        
         
@@ -316,186 +1258,463 @@ class ArtificialBeeColony():
 
         Returns:
             array: Indices of the selected employed bees (based on the chosen selection strategy).
+        
+        .. note::
+            All the onlookers are selected at once. 'RouletteWheel' draws one pointer per onlooker on the cumulative fitness,
+            'StochasticUniversalSampling' uses evenly spaced pointers with a single random offset (same expected counts, lower variance),
+            and 'Tournament' draws the contestants of all the tournaments together and keeps the fittest of each row.
         """
         
-        fitness_values = np.array([bee.fitness for bee in self.employed_bees])
+        fitness_values = self.fitness
         
-        if self.selection == 'RouletteWheel':
-            selection_probabilities  = fitness_values / np.sum(fitness_values)
-            dance_winners = np.random.choice(range(self.n_employed_bees),size=self.n_onlooker_bees,p=selection_probabilities,replace=True)
-            return dance_winners
+        if self.selection in ['RouletteWheel','StochasticUniversalSampling']:
+            cumulative_fitness = np.cumsum(fitness_values)
+            if self.selection == 'RouletteWheel':
+                pointers = self.rng.random(self.n_onlooker_bees) * cumulative_fitness[-1]
+            else:
+                spacing  = cumulative_fitness[-1] / self.n_onlooker_bees
+                pointers = (self.rng.random() + np.arange(self.n_onlooker_bees)) * spacing
+            dance_winners = np.searchsorted(cumulative_fitness,pointers,side='right')
+            return np.minimum(dance_winners,self.n_employed_bees - 1)
         
         if self.selection == 'Tournament':
-            dance_winners = []
-            for _ in range(self.n_onlooker_bees):
-                tournament_indices = np.random.choice(range(self.n_employed_bees),size=self.tournament_size,replace=False)
-                tournament_fitness = fitness_values[tournament_indices]
-                winner_idx = tournament_indices[np.argmax(tournament_fitness)]
-                dance_winners.append(winner_idx)
-            return dance_winners
+            tournament_indices = self.sample_without_replacement_(n_items   = self.n_employed_bees,
+                                                                  n_samples = self.tournament_size,
+                                                                  excluded  = np.empty((self.n_onlooker_bees,0),dtype=int))
+            winner_idx = np.argmax(fitness_values[tournament_indices],axis=1)
+            return tournament_indices[np.arange(self.n_onlooker_bees),winner_idx]
+    
+    #------------------------------------------------------------------------------------------------------------------    
+    
+    def onlookers_ask_(self):
+        """
+        Generates the candidates of the onlooker bees phase, where onlookers exploit the information shared by employed bees.
+
+        Returns:
+            dict: The pending candidates of the onlookers, together with their food sources and mutated dimensions.
+        """
+        
+        dance_winners = self.waggle_dance_()
+        
+        # Onlookers start from already evaluated positions, so their values are inherited rather than recomputed
+        self.onlooker_positions = self.positions[dance_winners]
+        self.onlooker_values    = self.values[dance_winners]
+        
+        candidates,mutated_dims = self.get_candidates_(population=self.onlooker_positions,directions=self.directions[dance_winners])
+        return {'candidates': candidates, 'mutated_dims': mutated_dims, 'dance_winners': dance_winners}
     
     #------------------------------------------------------------------------------------------------------------------    
     
-    def onlookers_phase_(self):
+    def onlookers_tell_(self,pending,values):
         """
-        Performs the onlooker bees phase, where onlookers exploit the information shared by employed bees to explore the search space.
+        Completes the onlooker bees phase.
+
+        Args:
+            pending (dict)       : The pending candidates of the onlookers.
+            values (numpy-array) : The objective values of the candidates.
 
         .. note::
             Updates employed bees with better solutions discovered by onlookers.
+            If several onlookers improve the same food source, the last one prevails.
             Adjusts the scaling factor if self-adaptive scaling is enabled.
         """
         
-        dance_winners = self.waggle_dance_()
+        candidates        = pending['candidates']
+        dance_winners     = pending['dance_winners']
+        candidate_fitness = self.compute_fitness_(values)
         
-        self.onlooker_bees = [Bee(position = self.employed_bees[winner_idx].position,
-                                  function = self.function,
-                                  bounds   = self.bounds) for winner_idx in dance_winners
-                              ]
-        
-        succesful_mutations = 0
-        for bee_idx, winner_idx in enumerate(dance_winners):
-            bee = self.onlooker_bees[bee_idx]
-            # Get Candidate Neighbor
-            candidate_bee = self.get_candidate_neighbor_(bee=bee,bee_idx=bee_idx,population=self.onlooker_bees)
-            # Greedy Selection
-            if candidate_bee.fitness >= bee.fitness:
-                self.employed_bees[winner_idx] = candidate_bee
-                succesful_mutations += 1
-                
-                if self.mutation == 'DirectedABC':
-                    if (bee.position != candidate_bee.position).any(): # this is needed when candidate_bee.fitness == bee.fitness
-                        # Retrieve the index mutated and update the direction
-                        j = np.where(bee.position != candidate_bee.position)[0][0]
-                        self.directions[winner_idx,j] = np.sign(candidate_bee.position[j] - bee.position[j])
-                
-            else:
-                
-                if self.mutation == 'DirectedABC':
-                    # Retrieve the index mutated and update the direction
-                    j = np.where(bee.position != candidate_bee.position)[0][0]
-                    self.directions[winner_idx,j] = 0
+        # Greedy Selection
+        improved = candidate_fitness >= self.fitness[dance_winners]
+        if self.mutation == 'DirectedABC':
+            self.update_directions_(bee_indices  = dance_winners,
+                                    mutated_dims = pending['mutated_dims'],
+                                    candidates   = candidates,
+                                    improved     = improved)
+        
+        # Keep only the last succesful onlooker for each food source
+        succesful_onlookers = np.flatnonzero(improved)
+        _,last_occurrences  = np.unique(dance_winners[succesful_onlookers][::-1],return_index=True)
+        succesful_onlookers = succesful_onlookers[::-1][last_occurrences]
+        winners             = dance_winners[succesful_onlookers]
+        
+        self.positions[winners] = candidates[succesful_onlookers]
+        self.values[winners]    = values[succesful_onlookers]
+        self.fitness[winners]   = candidate_fitness[succesful_onlookers]
+        self.trials[winners]    = 0
                 
         if self.self_adaptive_sf:
-            self.update_SF_(succesful_mutations_ratio= (succesful_mutations / self.n_onlooker_bees) )
+            self.update_SF_(succesful_mutations_ratio= (np.sum(improved) / self.n_onlooker_bees) )
             
     #------------------------------------------------------------------------------------------------------------------
     
-    def scouts_phase_(self):
+    def scouts_ask_(self):
         """
-        Performs the scout bees phase, where employed bees that exceed the trial limit are forced to explore a new solution
+        Generates the candidates of the scout bees phase, where employed bees that exceed the trial limit are forced to explore a new solution.
 
+        Returns:
+            dict: The pending candidates of the scouts, together with the indices of the scouts.
+        
         .. note::
             Depending on the initialization strategy, scouts are reinitialized either randomly or using a chaotic map.
+            With the chaotic map, the candidates depend on `cahotic_scouts`: a pool of chaotic and opposite positions per scout ('full'),
+            a single pool of chaotic and opposite positions shared by all the scouts of the iteration ('pool'), or a chaotic position and its opposite per scout ('pair').
         """
-        n_scouts = 0
         
-        for bee_idx, bee in enumerate(self.employed_bees):
-            
-            if n_scouts > self.max_scouts:
-                break
-    
-            if bee.trial > self.limit:
-                n_scouts += 1
-                if self.initialization == 'random':
-                    self.employed_bees[bee_idx] = Bee(position = np.random.uniform(self.bounds[:,0],self.bounds[:,1],self.dim),
-                                                      function = self.function,
-                                                      bounds   = self.bounds)
-                elif self.initialization == 'cahotic':
-                    cahotic_map = np.random.rand(self.n_employed_bees,self.dim)
-                    for _ in range(300):
-                        cahotic_map = np.sin(cahotic_map * np.pi)    
-                        
-                    cahotic_pop  = [Bee(position = self.bounds[:,0] + (self.bounds[:,1] - self.bounds[:,0]) * cahotic_map[i,:],
-                                        function = self.function,
-                                        bounds   = self.bounds) for i in range(self.n_employed_bees) ]
-                    opposite_pop = [Bee(position = self.bounds[:,0] + self.bounds[:,1] - cahotic_pop[i].position,
-                                        function = self.function,
-                                        bounds   = self.bounds) for i in range(self.n_employed_bees) ]
-            
-                    self.employed_bees[bee_idx] = sorted(cahotic_pop+opposite_pop,
-                                                         key=lambda bee: bee.fitness, reverse=True)[0]
+        # At most `max_scouts` exhausted food sources are abandoned, in the order given by `scout_priority`
+        scouts = np.flatnonzero(self.trials > self.limit)
+        if self.scout_priority == 'stalest':
+            scouts = scouts[np.argsort(-self.trials[scouts],kind='stable')]
+        scouts   = scouts[:self.max_scouts]
+        n_scouts = len(scouts)
+        
+        if self.initialization == 'random':
+            candidates = self.random_positions_(n_positions=n_scouts)
+        elif self.cahotic_scouts == 'full':
+            candidates = np.vstack([self.cahotic_positions_(n_positions=self.n_employed_bees) for _ in range(n_scouts)])
+        elif self.cahotic_scouts == 'pool':
+            candidates = self.cahotic_positions_(n_positions=self.n_employed_bees)
+        elif self.cahotic_scouts == 'pair':
+            candidates = self.cahotic_positions_(n_positions=n_scouts)
+        
+        return {'candidates': candidates, 'scouts': scouts}
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def scouts_tell_(self,pending,values):
+        """
+        Completes the scout bees phase, moving each scout to its new food source.
+
+        Args:
+            pending (dict)       : The pending candidates of the scouts.
+            values (numpy-array) : The objective values of the candidates.
+        """
+        
+        scouts     = pending['scouts']
+        candidates = pending['candidates']
+        n_scouts   = len(scouts)
+        
+        if self.initialization == 'cahotic':
+            if self.cahotic_scouts == 'full':
+                # Each scout keeps the fittest position of its own pool
+                pool_size   = 2 * self.n_employed_bees
+                fittest_idx = np.arange(n_scouts) * pool_size + np.argmax(self.compute_fitness_(values.reshape(n_scouts,pool_size)),axis=1)
+            elif self.cahotic_scouts == 'pool':
+                # Scouts take the fittest positions of the pool of the iteration (the rest is discarded)
+                fittest_idx = np.argsort(-self.compute_fitness_(values),kind='stable')[:n_scouts]
+            elif self.cahotic_scouts == 'pair':
+                # Each scout keeps the fittest between its chaotic position and the opposite one
+                opposite    = self.compute_fitness_(values[n_scouts:]) > self.compute_fitness_(values[:n_scouts])
+                fittest_idx = np.arange(n_scouts) + n_scouts * opposite
+            candidates = candidates[fittest_idx]
+            values     = values[fittest_idx]
+        
+        self.positions[scouts] = candidates
+        self.values[scouts]    = values
+        self.fitness[scouts]   = self.compute_fitness_(values)
+        self.trials[scouts]    = 0
 
     
     #------------------------------------------------------------------------------------------------------------------            
     
-    def get_candidate_neighbor_(self,bee,bee_idx,population):
+    def get_candidates_(self,population,directions=None):
         """
-        Generates a candidate neighbor solution for a given bee based on the chosen mutation strategy.
+        Generates a candidate neighbor solution for each bee of a population, based on the chosen mutation strategy.
 
         Parameters:
-            bee (Bee)         : The bee for which a candidate neighbor is generated.
-            bee_idx (int)     : The index of the bee in the population.
-            population (list) : The population of bees from which donors are selected (i.e., employed or onlooker bees).
+            population (numpy-array)           : The positions of the bees, provided as a numpy array of shape `(N,D)`. Donors are selected among them.
+            directions (numpy-array, optional) : The directions of the food sources of the bees (only used by 'DirectedABC'). Defaults to None.
 
         Returns:
-            Bee: A new candidate bee solution.
+            tuple: The candidate positions, as a numpy array of shape `(N,D)`, and the mutated dimension of each candidate
+            (None for 'ModifiedABC', which can mutate several dimensions at once).
         """
         
+        n_bees       = population.shape[0]
+        bee_indices  = np.arange(n_bees)
+        candidates   = population.copy()
+        mutated_dims = None
+        
         if self.mutation == 'StandardABC':
-            phi = np.random.uniform(-self.sf,self.sf)
-            donor_bee = self.get_donor_bees_(n_donors=1,bee_idx=bee_idx,population=population)[0]
-            candidate_bee = copy.deepcopy(bee)
-            j = np.random.randint(0,self.dim)
-            candidate_bee.position[j] = bee.position[j] + phi*(bee.position[j] - donor_bee.position[j])
-            candidate_bee.position[j] = np.clip(candidate_bee.position[j],self.bounds[j][0],self.bounds[j][1])
+            phi          = self.rng.uniform(-self.sf,self.sf,n_bees)
+            donors       = self.get_donor_bees_(n_donors=1,population=population)
+            mutated_dims = self.rng.integers(0,self.dim,n_bees)
+            x_j          = population[bee_indices,mutated_dims]
+            candidates[bee_indices,mutated_dims] = x_j + phi*(x_j - population[donors[:,0],mutated_dims])
             
         if self.mutation == 'ModifiedABC':
-            donor_bee = self.get_donor_bees_(n_donors=1,bee_idx=bee_idx,population=population)[0]
-            candidate_bee = copy.deepcopy(bee)
-            phi = np.random.uniform(-self.sf,self.sf,self.dim)
-            mutation_mask = np.random.uniform(size=self.dim) <= self.mr
-            candidate_bee.position[mutation_mask] = bee.position[mutation_mask] + phi[mutation_mask] * (bee.position[mutation_mask] - donor_bee.position[mutation_mask])
-            candidate_bee.position = np.clip(candidate_bee.position,self.bounds[:,0],self.bounds[:,1])
+            donors        = self.get_donor_bees_(n_donors=1,population=population)
+            phi           = self.rng.uniform(-self.sf,self.sf,(n_bees,self.dim))
+            mutation_mask = self.rng.random((n_bees,self.dim)) <= self.mr
+            candidates[mutation_mask] = (population + phi * (population - population[donors[:,0]]))[mutation_mask]
             
         if self.mutation == 'ABC/best/1':
-            phi = np.random.uniform(-self.sf,self.sf)
-            donor1,donor2 = self.get_donor_bees_(n_donors=2,bee_idx=bee_idx,population=population)
-            candidate_bee = copy.deepcopy(bee)
-            j = np.random.randint(0,self.dim)
-            candidate_bee.position[j] = self.optimal_bee.position[j] + phi*(donor1.position[j] - donor2.position[j])
-            candidate_bee.position[j] = np.clip(candidate_bee.position[j],self.bounds[j][0],self.bounds[j][1])
+            phi          = self.rng.uniform(-self.sf,self.sf,n_bees)
+            donors       = self.get_donor_bees_(n_donors=2,population=population)
+            mutated_dims = self.rng.integers(0,self.dim,n_bees)
+            candidates[bee_indices,mutated_dims] = self.optimal_bee.position[mutated_dims] \
+                                                   + phi*(population[donors[:,0],mutated_dims] - population[donors[:,1],mutated_dims])
             
         if self.mutation == 'ABC/best/2':
-            phi = np.random.uniform(-self.sf,self.sf)
-            donor1,donor2,donor3,donor4 = self.get_donor_bees_(n_donors=4,bee_idx=bee_idx,population=population)
-            candidate_bee = copy.deepcopy(bee)
-            j = np.random.randint(0,self.dim)
-            candidate_bee.position[j] = self.optimal_bee.position[j] + phi*(donor1.position[j] - donor2.position[j]) \
-                                        + phi*(donor3.position[j] - donor4.position[j])
-            candidate_bee.position[j] = np.clip(candidate_bee.position[j],self.bounds[j][0],self.bounds[j][1])
+            phi          = self.rng.uniform(-self.sf,self.sf,n_bees)
+            donors       = self.get_donor_bees_(n_donors=4,population=population)
+            mutated_dims = self.rng.integers(0,self.dim,n_bees)
+            candidates[bee_indices,mutated_dims] = self.optimal_bee.position[mutated_dims] \
+                                                   + phi*(population[donors[:,0],mutated_dims] - population[donors[:,1],mutated_dims]) \
+                                                   + phi*(population[donors[:,2],mutated_dims] - population[donors[:,3],mutated_dims])
         
         if self.mutation == 'DirectedABC':
-            donor_bee = self.get_donor_bees_(n_donors=1,bee_idx=bee_idx,population=population)[0]
-            candidate_bee = copy.deepcopy(bee)
-            directions = self.directions[bee_idx,:]
-            j = np.random.randint(0,self.dim)
-            r = (directions[j] == 0)  * np.random.uniform(-self.sf,self.sf) + \
-                (directions[j] == 1)  * np.random.uniform(0,self.sf)        + \
-                (directions[j] == -1) * np.random.uniform(-self.sf,0)
-                
-            candidate_bee.position[j] = bee.position[j] + r * np.abs(bee.position[j] - donor_bee.position[j])
-            candidate_bee.position[j] = np.clip(candidate_bee.position[j],self.bounds[j][0],self.bounds[j][1])
+            donors       = self.get_donor_bees_(n_donors=1,population=population)
+            mutated_dims = self.rng.integers(0,self.dim,n_bees)
+            directions   = directions[bee_indices,mutated_dims]
+            # r ~ U(-sf,sf) if no direction is known, otherwise r ~ U(0,sf) or r ~ U(-sf,0) following the direction
+            u            = self.rng.uniform(0,self.sf,n_bees)
+            r            = np.where(directions == 0, 2*u - self.sf, directions * u)
+            x_j          = population[bee_indices,mutated_dims]
+            candidates[bee_indices,mutated_dims] = x_j + r * np.abs(x_j - population[donors[:,0],mutated_dims])
+        
+        np.clip(candidates,self.bounds[:,0],self.bounds[:,1],out=candidates)
+        
+        return candidates,mutated_dims
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def get_donor_bees_(self,n_donors=1,population=None):
+        """
+        Selects donor bees from the population (for each bee of the population)
+
+        Args:
+            n_donors (int, optional)                 : The number of donor bees to select for each bee. Defaults to 1.
+            population (numpy-array, optional)       : The positions of the bees from which donors are selected. Defaults to None.
+
+        Returns:
+            numpy-array: The indices of the donor bees in `population`, with shape `(N,n_donors)`.
+        
+        .. note::
+            The donors of each bee are distinct and different from the bee itself, and they are drawn for the whole population at once.
+        """
+        
+        n_bees = len(population)
+        return self.sample_without_replacement_(n_items=n_bees,n_samples=n_donors,excluded=np.arange(n_bees)[:,np.newaxis])
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def sample_without_replacement_(self,n_items,n_samples,excluded):
+        """
+        Samples distinct indices in `[0,n_items)` for several rows at once, avoiding a set of excluded indices for each row.
+
+        Args:
+            n_items (int)            : The number of indices to sample from.
+            n_samples (int)          : The number of distinct indices to sample for each row.
+            excluded (numpy-array)   : The indices that each row must avoid, with shape `(n_rows,n_excluded)` (distinct within each row).
+
+        Returns:
+            numpy-array: The sampled indices, with shape `(n_rows,n_samples)`.
+        
+        .. note::
+            The k-th index is sampled uniformly among the `n_items-n_excluded-k` indices still available, then shifted past the indices already excluded.
+        """
+        
+        n_rows  = excluded.shape[0]
+        samples = np.empty((n_rows,n_samples),dtype=int)
+        
+        for k in range(n_samples):
+            sampled_indices = self.rng.integers(0,n_items-excluded.shape[1],n_rows)
+            # Excluded indices are visited in increasing order, so that each shift accounts for the previous ones
+            for excluded_indices in np.sort(excluded,axis=1).T:
+                sampled_indices += (sampled_indices >= excluded_indices)
+            samples[:,k] = sampled_indices
+            excluded     = np.column_stack([excluded,sampled_indices])
+        
+        return samples
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def update_directions_(self,bee_indices,mutated_dims,candidates,improved):
+        """
+        Updates the directions of the food sources for the 'DirectedABC' mutation strategy.
 
-        return candidate_bee
+        Args:
+            bee_indices (numpy-array)  : The indices of the food sources the candidates were generated from.
+            mutated_dims (numpy-array) : The dimension mutated by each candidate.
+            candidates (numpy-array)   : The candidate positions.
+            improved (numpy-array)     : Boolean mask of the candidates accepted by the greedy selection.
+        
+        .. note::
+            The direction is reset to 0 when the mutation fails, and set to the sign of the step when it succeeds.
+            Succesful mutations that did not move the bee (i.e. equal fitness) leave the direction unchanged.
+        """
+        
+        steps = candidates[np.arange(len(bee_indices)),mutated_dims] - self.positions[bee_indices,mutated_dims]
+        self.directions[bee_indices[~improved],mutated_dims[~improved]] = 0
+        moved = improved & (steps != 0)
+        self.directions[bee_indices[moved],mutated_dims[moved]] = np.sign(steps[moved])
     
     #------------------------------------------------------------------------------------------------------------------
     
-    def get_donor_bees_(self,n_donors=1,bee_idx=None,population=None):
+    def random_positions_(self,n_positions):
         """
-        Selects donor bees from the population (for a given bee)
+        Samples positions uniformly at random within the bounds.
 
         Args:
-            n_donors (int, optional)         : The number of donor bees to return. Defaults to 1.
-            bee_idx (int, optional)          : The index of the bee for which donors are selected. Defaults to None.
-            population (list[Bee], optional) : The population of bees from which donors are selected. Defaults to None.
+            n_positions (int): The number of positions to sample.
 
         Returns:
-            list: A list of donor bees (as Bee instances).
+            numpy-array: The sampled positions, with shape `(n_positions,D)`.
         """
         
-        available_indices = np.delete(np.arange(len(population)), bee_idx)
-        k_list = np.random.choice(available_indices,size=n_donors,replace=False)
-        return [copy.deepcopy(population[k]) for k in k_list]
+        return self.rng.uniform(self.bounds[:,0],self.bounds[:,1],(n_positions,self.dim))
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def cahotic_positions_(self,n_positions):
+        """
+        Samples positions with a chaotic map, together with their opposite positions.
+
+        Args:
+            n_positions (int): The number of chaotic positions to sample.
+
+        Returns:
+            numpy-array: The chaotic positions followed by their opposites, with shape `(2*n_positions,D)`.
+        """
+        
+        # Define cahotic map and iterate over it
+        cahotic_map = self.rng.random((n_positions,self.dim))
+        for _ in range(300):
+            cahotic_map = np.sin(cahotic_map * np.pi)
+        
+        cahotic_pop  = self.bounds[:,0] + (self.bounds[:,1] - self.bounds[:,0]) * cahotic_map
+        opposite_pop = self.bounds[:,0] + self.bounds[:,1] - cahotic_pop
+        return np.vstack([cahotic_pop,opposite_pop])
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def evaluate_(self,positions,function=None):
+        """
+        Evaluates the objective function at the given positions.
+
+        Args:
+            positions (numpy-array)       : The positions to evaluate, with shape `(N,D)`.
+            function (callable, optional) : The function to evaluate. Defaults to None (the objective function of the colony).
+
+        Returns:
+            numpy-array: The objective values, with shape `(N,)`.
+        
+        Raises:
+            ValueError: If a vectorized `function` does not return one value per position.
+        
+        .. note::
+            When the colony is vectorized, all the positions are passed to `function` in a single call.
+            When `function` is an `EvaluationCache`, only the positions missing from the cache are evaluated,
+            and the values served by the cache are discounted from `n_evaluations` by the following `tell`.
+        """
+        
+        if len(positions) == 0:
+            return np.empty(0)
+        
+        function = self.function if function is None else function
+        if isinstance(function,EvaluationCache):
+            hits   = function.hits
+            values = function.evaluate(positions,evaluate_missing=lambda missing: self.evaluate_(missing,function=function.function))
+            self._cache_hits += function.hits - hits
+            return values
+        
+        if self.vectorized:
+            if self.executor is not None:
+                # Each worker evaluates a contiguous chunk of the batch
+                n_chunks = min(len(positions),self.n_workers)
+                values   = np.concatenate([np.asarray(chunk_values,dtype=float).reshape(-1)
+                                           for chunk_values in self.executor.map(function,np.array_split(positions,n_chunks))])
+            else:
+                values = np.asarray(function(positions),dtype=float).reshape(-1)
+            if values.shape[0] != len(positions):
+                raise ValueError(f"A vectorized `function` must return one value per position, but got {values.shape[0]} values for {len(positions)} positions.")
+            return values
+        if self.executor is not None:
+            # Positions are sent in chunks, so that process pools do not pickle one position per task
+            chunksize = max(1,len(positions) // self.n_workers) if self.n_workers else 1
+            return np.fromiter(self.executor.map(function,positions,chunksize=chunksize),dtype=float,count=len(positions))
+        return np.array([function(position) for position in positions],dtype=float)
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    async def evaluate_async_(self,positions,semaphore=None,function=None):
+        """
+        Evaluates a coroutine objective function at the given positions, awaiting all the evaluations concurrently.
+
+        Args:
+            positions (numpy-array)          : The positions to evaluate, with shape `(N,D)`.
+            semaphore (Semaphore, optional)  : An `asyncio.Semaphore` bounding the number of concurrent evaluations. Defaults to None.
+            function (callable, optional)    : The function to evaluate. Defaults to None (the objective function of the colony).
+
+        Returns:
+            numpy-array: The objective values, with shape `(N,)`.
+        
+        Raises:
+            ValueError: If a vectorized `function` does not return one value per position.
+        """
+        
+        import asyncio,inspect
+        
+        if len(positions) == 0:
+            return np.empty(0)
+        
+        function = self.function if function is None else function
+        if isinstance(function,EvaluationCache):
+            hits   = function.hits
+            values = await function.evaluate_async(positions,evaluate_missing=lambda missing: self.evaluate_async_(missing,semaphore=semaphore,function=function.function))
+            self._cache_hits += function.hits - hits
+            return values
+        
+        async def evaluate_position(position):
+            if semaphore is None:
+                value = function(position)
+                return (await value) if inspect.isawaitable(value) else value
+            async with semaphore:
+                value = function(position)
+                return (await value) if inspect.isawaitable(value) else value
+        
+        if self.vectorized:
+            values = np.asarray(await evaluate_position(positions),dtype=float).reshape(-1)
+            if values.shape[0] != len(positions):
+                raise ValueError(f"A vectorized `function` must return one value per position, but got {values.shape[0]} values for {len(positions)} positions.")
+            return values
+        return np.array(await asyncio.gather(*[evaluate_position(position) for position in positions]),dtype=float)
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    @staticmethod
+    def compute_fitness_(values):
+        """
+        Computes the fitness associated with the given objective values (consistently with `Bee.fitness`).
+
+        Args:
+            values (numpy-array or float): The objective values.
+
+        Returns:
+            numpy-array or float: The fitness values.
+        """
+        
+        return np.where(values >= 0, 1/(1+np.abs(values)), 1 + np.abs(values))
+    
+    #------------------------------------------------------------------------------------------------------------------
+    
+    def get_bee_(self,bee_idx):
+        """
+        Builds a Bee instance for a given employed bee from the colony arrays.
+
+        Args:
+            bee_idx (int): The index of the employed bee.
+
+        Returns:
+            Bee: A Bee instance with its own copy of the position and its objective value already cached.
+        """
+        
+        bee = Bee(position = self.positions[bee_idx].copy(),
+                  function = self.function,
+                  bounds   = self.bounds,
+                  value    = self.values[bee_idx])
+        bee.trial = int(self.trials[bee_idx])
+        return bee
     
     #------------------------------------------------------------------------------------------------------------------
     
@@ -520,12 +1739,22 @@ class ArtificialBeeColony():
         """
         Resets the ABC object to its initial state.
         """
-        self.employed_bees       = []
-        self.onlooker_bees       = []
-        self.colony_history      = []
+        self.positions           = np.empty((0,self.dim))
+        self.values              = np.empty(0)
+        self.fitness             = np.empty(0)
+        self.trials              = np.empty(0,dtype=int)
+        self.onlooker_positions  = np.empty((0,self.dim))
+        self.onlooker_values     = np.empty(0)
+        self.history             = None
         self.optimal_bee         = None
-        self.optimal_bee_history = []
         self.actual_iters        = 0
+        self.n_evaluations       = 0
+        self.phase               = None
+        self.stagnated           = False
+        self._pending            = None
+        self._cache_hits         = 0
+        self.stats               = None
+        self.profiler            = None
         self.sf                  = self.initial_sf
     #------------------------------------------------------------------------------------------------------------------
-        
\ No newline at end of file
+        
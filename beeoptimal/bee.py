@@ -17,17 +17,21 @@ class Bee():
         function (callable)    : The objective function to evaluate the position.
         bounds (numpy-array)   : Bounds for each dimension of the search space,provided as a numpy array of shape `(D,2)` or `(2,D)`.
         trial (int)            : Counter to track the number of trials or unsuccessful updates for the bee.
+
+    .. note::
+            The objective value is computed once per position and then cached. Assigning a new `position` invalidates the cache,
+            whereas in-place modifications (e.g. `bee.position[j] = x`) are not detected: assign a new array instead.
     """
     #--------------------------------------------------------------------------------
-    def __init__(self,position,function,bounds):
+    def __init__(self,position,function,bounds,value=None):
         """
         Initializes a Bee instance with a position, an objective function, and search space bounds.
 
         Args:
-            position (numpy-array): The initial position of the bee in the search space, provided as numpy array of shape `(D,)`, `(D,1)` or `(1,D)`.
-            function (callable)   : The objective function to evaluate the position
-            bounds (numpy-array)  : Bounds for each dimension of the search space, provided as a numpy array of shape `(D,2)` or `(2,D)`.
-            trial (int)           : Counter to track the number of trials or unsuccessful updates for the bee.
+            position (numpy-array)  : The initial position of the bee in the search space, provided as numpy array of shape `(D,)`, `(D,1)` or `(1,D)`.
+            function (callable)     : The objective function to evaluate the position
+            bounds (numpy-array)    : Bounds for each dimension of the search space, provided as a numpy array of shape `(D,2)` or `(2,D)`.
+            value (float, optional) : The objective value at `position`, if already known. Defaults to None (computed on first access).
         
         Raises:
             TypeError  : If `function` is not callable.
@@ -55,18 +59,43 @@ class Bee():
         if position.reshape(-1, 1).shape[0] != self.bounds.shape[0]:
             raise ValueError(f"`position` dimensionality ({position.reshape(-1, 1).shape[0]}) is not compatible with the bounds provided.")
         self.position = position
+        self._value   = value
         
         self.trial = 0
     #--------------------------------------------------------------------------------
     @property
+    def position(self):
+        """
+        The current position of the bee in the search space.
+
+        Returns:
+            numpy-array: The position of the bee.
+        """
+        return self._position
+    #--------------------------------------------------------------------------------
+    @position.setter
+    def position(self,position):
+        """
+        Moves the bee to a new position, invalidating the cached objective value.
+
+        Args:
+            position (numpy-array): The new position of the bee.
+        """
+        self._position = position
+        self._value    = None
+    #--------------------------------------------------------------------------------
+    @property
     def value(self):
         """
         Computes the value of the objective function at the bee's current position.
+        The function is evaluated on first access only, and the result is cached until the position changes.
 
         Returns:
             float: The objective function value for the current position.
         """
-        return self.function(self.position) 
+        if self._value is None:
+            self._value = self.function(self.position)
+        return self._value
     #--------------------------------------------------------------------------------
     @property
     def fitness(self):
@@ -76,8 +105,9 @@ class Bee():
         Returns:
             float: The fitness value at the bee's current position.
         """
-        if self.value >= 0:
-            return 1/(1+self.value)
+        value = self.value
+        if value >= 0:
+            return 1/(1+value)
         else:
-            return 1 + np.abs(self.value)
+            return 1 + np.abs(value)
     #--------------------------------------------------------------------------------
\ No newline at end of file
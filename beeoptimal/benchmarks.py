@@ -17,20 +17,25 @@ class BenchmarkFunction:
         bounds (numpy-array)          : The bounds of the function, provided as a numpy array of shape `(D,2)` or `(2,D)`.
         optimal_solution (numpy-array): The known solution achieving the optimal value, provided as numpy array of shape `(D,)`, `(D,1)` or `(1,D)`.
         name (str, optional)          : The name of the function. Defaults to empty string.
+        batch_fun (callable, optional): The batch version of `fun`, mapping a numpy array of shape `(N,D)` to a numpy array of shape `(N,)`. Defaults to None.
         
     Examples:
         >>> from beeoptimal.benchmarks import BenchmarkFunction
         >>> import numpy as np
         >>> sphere = lambda point: np.sum(np.array(point)**2)
+        >>> sphere_batch = lambda points: np.sum(points**2,axis=1)
         >>> Sphere2d = BenchmarkFunction(
                 name             = "Sphere-2d",
                 fun              = sphere,
+                batch_fun        = sphere_batch,
                 bounds           = np.array([(-5.12, 5.12)]*2),
                 optimal_solution = np.zeros(2)
             )
+        >>> Sphere2d.evaluate_batch(np.array([[0.0, 0.0], [1.0, 2.0]]))
+        array([0., 5.])
     """
     
-    def __init__(self, fun, bounds, optimal_solution, name = ''):
+    def __init__(self, fun, bounds, optimal_solution, name = '', batch_fun = None):
         """
         Initialize a benchmark function.
         
@@ -39,9 +44,12 @@ class BenchmarkFunction:
             bounds (numpy-array)          : The bounds of the function, provided as a numpy array of shape `(D,2)` or (2,D)
             optimal_solution (numpy-array): The known solution achieving the optimal value, provided as numpy array of shape `(D,)`, `(D,1)` or `(1,D)`
             name (str)                    : The name of the function. Defaults to empty string.
+            batch_fun (callable, optional): The batch version of `fun`, mapping a numpy array of shape `(N,D)` to a numpy array of shape `(N,)`.
+                                            Defaults to None (batches are evaluated one point at a time with `fun`).
             
         Raises:
             TypeError  : If `function` is not callable.
+            TypeError  : If `batch_fun` is provided but it is not callable.
             TypeError  : If `bounds` is not a numpy array.
             ValueError : If `bounds` does not have shape `(D, 2)` or `(2, D)`.
             ValueError : If any dimension has its lower bound greater than the upper bound.
@@ -51,6 +59,10 @@ class BenchmarkFunction:
         if not callable(fun):
             raise TypeError("`function` must be callable.")
         self.fun = fun
+        
+        if (batch_fun is not None) and (not callable(batch_fun)):
+            raise TypeError("`batch_fun` must be callable.")
+        self.batch_fun = batch_fun
 
         if not isinstance(name, str):
             raise TypeError("`name` must be provided as a string.")
@@ -92,6 +104,33 @@ class BenchmarkFunction:
         
         return self.fun(point)
     
+    def evaluate_batch(self, points):
+        """
+        Evaluate the function at each of the given points.
+        
+        Args:
+            points (numpy-array) : The points at which to evaluate the function, provided as numpy array of shape `(N,D)`.
+        
+        Returns:
+            numpy-array: The values of the function computed at the given points, with shape `(N,)`.
+            
+        Raises:
+            TypeError  : If the points are not provided as a numpy array.
+            ValueError : If the points do not have shape `(N,D)`, with D consistent with the bounds.
+        
+        .. note::
+            If no `batch_fun` is available, the points are evaluated one at a time with `fun`.
+        """
+        
+        if not isinstance(points,np.ndarray):
+            raise TypeError("`points` must be provided as a numpy array")
+        if (points.ndim != 2) or (points.shape[1] != self.bounds.shape[0]):
+            raise ValueError(f"`points` must have shape (N, {self.bounds.shape[0]}), but got {points.shape}")
+        
+        if self.batch_fun is not None:
+            return np.asarray(self.batch_fun(points),dtype=float)
+        return np.array([self.fun(point.reshape(self.optimal_solution.shape)) for point in points],dtype=float)
+    
     @property
     def optimal_value(self):
         """Return the optimal value of the function."""
@@ -111,8 +150,7 @@ def sphere(point):
     Returns:
         float: The value of the function computed at the given point.
     """
-    point = np.array(point).flatten()
-    return np.sum(point**2)
+    return sphere_batch(np.array(point).reshape(1,-1))[0]
 
 def rosenbrock(point):
     """
@@ -124,8 +162,7 @@ def rosenbrock(point):
     Returns:
         float: The value of the function computed at the given point.
     """
-    point = np.array(point).flatten()
-    return np.sum(100*(point[1:] - point[:-1]**2)**2 + (point[:-1]-1)**2)
+    return rosenbrock_batch(np.array(point).reshape(1,-1))[0]
         
 def ackley(point):
     """
@@ -137,9 +174,7 @@ def ackley(point):
     Returns:
         float: The value of the function computed at the given point.
     """
-    point = np.array(point).flatten()
-    D = len(point)
-    return -20 * np.exp(-0.2 * np.sqrt(np.sum(point**2) / D)) - np.exp(np.sum(np.cos(2 * np.pi * point)) / D) + 20 + np.e
+    return ackley_batch(np.array(point).reshape(1,-1))[0]
 
 def rastrigin(point):
     """
@@ -151,8 +186,7 @@ def rastrigin(point):
     Returns:
         float: The value of the function computed at the given point.
     """
-    point = np.array(point).flatten()
-    return (10*len(point) + np.sum((point**2 - 10*np.cos(2*np.pi*point))))
+    return rastrigin_batch(np.array(point).reshape(1,-1))[0]
 
 def weierstrass(point,a=0.5,b=3,k_max=20):
     """
@@ -164,11 +198,7 @@ def weierstrass(point,a=0.5,b=3,k_max=20):
     Returns:
         float: The value of the function computed at the given point.
     """
-    point = np.array(point).flatten()
-    k = np.arange(k_max + 1)
-    term1 = np.sum(a**k[:, None] * np.cos(2 * np.pi * b**k[:, None] * (point + 0.5)), axis=0)
-    term2 = np.sum(a**k * np.cos(2 * np.pi * b**k * 0.5))
-    return np.sum(term1) - len(point) * term2
+    return weierstrass_batch(np.array(point).reshape(1,-1),a=a,b=b,k_max=k_max)[0]
 
 def griewank(point):
     """
@@ -180,8 +210,7 @@ def griewank(point):
     Returns:
         float: The value of the function computed at the given point.
     """
-    point = np.array(point).flatten()
-    return 1 + np.sum(point**2)/4000 - np.prod(np.cos(point/np.sqrt(np.arange(1, len(point)+1))))
+    return griewank_batch(np.array(point).reshape(1,-1))[0]
 
 def schwefel(point):
     """
@@ -193,8 +222,7 @@ def schwefel(point):
     Returns:
         float: The value of the function computed at the given point.
     """
-    point = np.array(point).flatten()
-    return 418.9829*len(point) - np.sum(point*np.sin(np.sqrt(np.abs(point))))
+    return schwefel_batch(np.array(point).reshape(1,-1))[0]
 
 def sumsquares(point):
     """
@@ -206,8 +234,7 @@ def sumsquares(point):
     Returns:
         float: The value of the function computed at the given point.
     """
-    point = np.array(point).flatten()
-    return np.sum(np.arange(1, len(point)+1)* (point**2) )
+    return sumsquares_batch(np.array(point).reshape(1,-1))[0]
 
 def eggholder(point):
     """
@@ -220,11 +247,135 @@ def eggholder(point):
         float: The value of the function computed at the given point.
     
     Raises:
-        AssertionError: If the point is not provided as a numpy array
+        AssertionError: If the point is not 2-dimensional.
     """
-    point = np.array(point).flatten()
-    assert len(point) == 2, "The Eggholder function is only defined for 2 dimensions"
-    return -(point[1] + 47)*np.sin(np.sqrt(np.abs(point[0]/2 + point[1] + 47))) - point[0]*np.sin(np.sqrt(np.abs(point[0]-(point[1]+47))))
+    return eggholder_batch(np.array(point).reshape(1,-1))[0]
+
+#++++++++++++++++++++++++++++++++++++
+#  Batch benchmark functions
+#++++++++++++++++++++++++++++++++++++
+
+def sphere_batch(points):
+    """
+    Compute the value of the sphere function at each of the given points.
+    
+    Args:
+        points (numpy-array): The points at which to evaluate the function, provided as numpy array of shape `(N,D)`.
+    
+    Returns:
+        numpy-array: The values of the function computed at the given points, with shape `(N,)`.
+    """
+    return np.sum(points**2,axis=1)
+
+def rosenbrock_batch(points):
+    """
+    Compute the value of the rosenbrock function at each of the given points.
+    
+    Args:
+        points (numpy-array): The points at which to evaluate the function, provided as numpy array of shape `(N,D)`.
+    
+    Returns:
+        numpy-array: The values of the function computed at the given points, with shape `(N,)`.
+    """
+    return np.sum(100*(points[:,1:] - points[:,:-1]**2)**2 + (points[:,:-1]-1)**2,axis=1)
+
+def ackley_batch(points):
+    """
+    Compute the value of the ackley function at each of the given points.
+    
+    Args:
+        points (numpy-array): The points at which to evaluate the function, provided as numpy array of shape `(N,D)`.
+    
+    Returns:
+        numpy-array: The values of the function computed at the given points, with shape `(N,)`.
+    """
+    D = points.shape[1]
+    return -20 * np.exp(-0.2 * np.sqrt(np.sum(points**2,axis=1) / D)) - np.exp(np.sum(np.cos(2 * np.pi * points),axis=1) / D) + 20 + np.e
+
+def rastrigin_batch(points):
+    """
+    Compute the value of the rastrigin function at each of the given points.
+    
+    Args:
+        points (numpy-array): The points at which to evaluate the function, provided as numpy array of shape `(N,D)`.
+    
+    Returns:
+        numpy-array: The values of the function computed at the given points, with shape `(N,)`.
+    """
+    return (10*points.shape[1] + np.sum((points**2 - 10*np.cos(2*np.pi*points)),axis=1))
+
+def weierstrass_batch(points,a=0.5,b=3,k_max=20):
+    """
+    Compute the value of the weierstrass function at each of the given points.
+    
+    Args:
+        points (numpy-array): The points at which to evaluate the function, provided as numpy array of shape `(N,D)`.
+    
+    Returns:
+        numpy-array: The values of the function computed at the given points, with shape `(N,)`.
+    
+    .. note::
+        The powers of `a` and `b` (and the constant term) are computed once and shared by the whole batch.
+    """
+    k     = np.arange(k_max + 1)
+    a_k   = a**k
+    b_k   = b**k
+    term1 = np.cos(2 * np.pi * (points[:,:,np.newaxis] + 0.5) * b_k) @ a_k
+    term2 = np.sum(a_k * np.cos(2 * np.pi * b_k * 0.5))
+    return np.sum(term1,axis=1) - points.shape[1] * term2
+
+def griewank_batch(points):
+    """
+    Compute the value of the griewank function at each of the given points.
+    
+    Args:
+        points (numpy-array): The points at which to evaluate the function, provided as numpy array of shape `(N,D)`.
+    
+    Returns:
+        numpy-array: The values of the function computed at the given points, with shape `(N,)`.
+    """
+    return 1 + np.sum(points**2,axis=1)/4000 - np.prod(np.cos(points/np.sqrt(np.arange(1, points.shape[1]+1))),axis=1)
+
+def schwefel_batch(points):
+    """
+    Compute the value of the schwefel function at each of the given points.
+    
+    Args:
+        points (numpy-array): The points at which to evaluate the function, provided as numpy array of shape `(N,D)`.
+    
+    Returns:
+        numpy-array: The values of the function computed at the given points, with shape `(N,)`.
+    """
+    return 418.9829*points.shape[1] - np.sum(points*np.sin(np.sqrt(np.abs(points))),axis=1)
+
+def sumsquares_batch(points):
+    """
+    Compute the value of the sumsquares function at each of the given points.
+    
+    Args:
+        points (numpy-array): The points at which to evaluate the function, provided as numpy array of shape `(N,D)`.
+    
+    Returns:
+        numpy-array: The values of the function computed at the given points, with shape `(N,)`.
+    """
+    return np.sum(np.arange(1, points.shape[1]+1)* (points**2),axis=1)
+
+def eggholder_batch(points):
+    """
+    Compute the value of the eggholder function at each of the given points.
+    
+    Args:
+        points (numpy-array): The points at which to evaluate the function, provided as numpy array of shape `(N,2)`.
+    
+    Returns:
+        numpy-array: The values of the function computed at the given points, with shape `(N,)`.
+    
+    Raises:
+        AssertionError: If the points are not 2-dimensional.
+    """
+    assert points.shape[1] == 2, "The Eggholder function is only defined for 2 dimensions"
+    x1,x2 = points[:,0],points[:,1]
+    return -(x2 + 47)*np.sin(np.sqrt(np.abs(x1/2 + x2 + 47))) - x1*np.sin(np.sqrt(np.abs(x1-(x2+47))))
 
     
     
@@ -232,183 +383,233 @@ def eggholder(point):
 # Benchmark functions for testing
 #++++++++++++++++++++++++++++++++++++
 
-# 2d functions
-
-Sphere2d = BenchmarkFunction(
-    name             = "Sphere-2d",
-    fun              = sphere,
-    bounds           = np.array([(-5.12, 5.12)]*2),
-    optimal_solution = np.zeros(2)
-)
-
-Rosenbrock2d = BenchmarkFunction(
-    name             = "Rosenbrock-2d",
-    fun              = rosenbrock,
-    bounds           = np.array([(-2.048, 2.048)]*2),
-    optimal_solution = np.ones(2)
-)
-
-Ackley2d = BenchmarkFunction(
-    name             = "Ackley-2d",
-    fun              = ackley,
-    bounds           = np.array([(-5, 5)]*2),
-    optimal_solution = np.zeros(2)
-)
-
-Rastrigin2d = BenchmarkFunction(
-    name             = "Rastrigin-2d",
-    fun              = rastrigin,
-    bounds           = np.array([(-5.12, 5.12)]*2),
-    optimal_solution = np.zeros(2)
-)
-
-Weierstrass2d = BenchmarkFunction(
-    name             = "Weierstrass-2d",
-    fun              = weierstrass,
-    bounds           = np.array([(-0.5, 0.5)]*2),
-    optimal_solution = np.zeros(2)
-)
-
-Griewank2d = BenchmarkFunction(
-    name             = "Griewank-2d",
-    fun              = griewank,
-    bounds           = np.array([(-600, 600)]*2),
-    optimal_solution = np.zeros(2)
-)
-
-Schwefel2d = BenchmarkFunction(
-    name             = "Schwefel-2d",
-    fun              = schwefel,
-    bounds           = np.array([(-500, 500)]*2),
-    optimal_solution = np.full(2,420.9687)
-)
-
-Sumsquares2d = BenchmarkFunction(
-    name             = "Sumsquares-2d",
-    fun              = sumsquares,
-    bounds           = np.array([(-10, 10)]*2),
-    optimal_solution = np.zeros(2)
-)    
-
-Eggholder = BenchmarkFunction(
-    name             = "Eggholder",
-    fun              = eggholder,
-    bounds           = np.array([(-512, 512)]*2),
-    optimal_solution = np.array([512,404.2319])
-)
-
-# 10d functions
-
-Sphere10d = BenchmarkFunction(
-    name             = "Sphere-10d",
-    fun              = sphere,
-    bounds           = np.array([(-5.12, 5.12)]*10),
-    optimal_solution = np.zeros(10)
-)
-
-Rosenbrock10d = BenchmarkFunction(
-    name             = "Rosenbrock-10d",
-    fun              = rosenbrock,
-    bounds           = np.array([(-2.048, 2.048)]*10),
-    optimal_solution = np.ones(10)
-)
-
-Ackley10d = BenchmarkFunction(
-    name             = "Ackley-10d",
-    fun              = ackley,
-    bounds           = np.array([(-5, 5)]*10),
-    optimal_solution = np.zeros(10)
-)
-
-Rastrigin10d = BenchmarkFunction(
-    name             = "Rastrigin-10d",
-    fun              = rastrigin,
-    bounds           = np.array([(-5.12, 5.12)]*10),
-    optimal_solution = np.zeros(10)
-)
-
-Weierstrass10d = BenchmarkFunction(
-    name             = "Weierstrass-10d",
-    fun              = weierstrass,
-    bounds           = np.array([(-0.5, 0.5)]*10),
-    optimal_solution = np.zeros(10)
-)
-
-Griewank10d = BenchmarkFunction(
-    name             = "Griewank-10d",
-    fun              = griewank,
-    bounds           = np.array([(-600, 600)]*10),
-    optimal_solution = np.zeros(10)
-)
-
-Schwefel10d = BenchmarkFunction(
-    name             = "Schwefel-10d",
-    fun              = schwefel,
-    bounds           = np.array([(-500, 500)]*10),
-    optimal_solution = np.full(10,420.9687)
-)
-
-Sumsquares10d = BenchmarkFunction(
-    name             = "Sumsquares-10d",
-    fun              = sumsquares,
-    bounds           = np.array([(-10, 10)]*10),
-    optimal_solution = np.zeros(10)
-)    
-
-# 30d functions
-
-Sphere30d = BenchmarkFunction(
-    name             = "Sphere-30d",
-    fun              = sphere,
-    bounds           = np.array([(-5.12, 5.12)]*30),
-    optimal_solution = np.zeros(30)
-)
-
-Rosenbrock30d = BenchmarkFunction(
-    name             = "Rosenbrock-30d",
-    fun              = rosenbrock,
-    bounds           = np.array([(-2.048, 2.048)]*30),
-    optimal_solution = np.ones(30)
-)
-
-Ackley30d = BenchmarkFunction(
-    name             = "Ackley-30d",
-    fun              = ackley,
-    bounds           = np.array([(-5, 5)]*30),
-    optimal_solution = np.zeros(30)
-)
-
-Rastrigin30d = BenchmarkFunction(
-    name             = "Rastrigin-30d",
-    fun              = rastrigin,
-    bounds           = np.array([(-5.12, 5.12)]*30),
-    optimal_solution = np.zeros(30)
-)
-
-Weierstrass30d = BenchmarkFunction(
-    name             = "Weierstrass-30d",
-    fun              = weierstrass,
-    bounds           = np.array([(-0.5, 0.5)]*30),
-    optimal_solution = np.zeros(30)
-)
-
-Griewank30d = BenchmarkFunction(
-    name             = "Griewank-30d",
-    fun              = griewank,
-    bounds           = np.array([(-600, 600)]*30),
-    optimal_solution = np.zeros(30)
-)
-
-Schwefel30d = BenchmarkFunction(
-    name             = "Schwefel-30d",
-    fun              = schwefel,
-    bounds           = np.array([(-500, 500)]*30),
-    optimal_solution = np.full(30,420.9687)
-)
-
-Sumsquares30d = BenchmarkFunction(
-    name             = "Sumsquares-30d",
-    fun              = sumsquares,
-    bounds           = np.array([(-10, 10)]*30),
-    optimal_solution = np.zeros(30)
-)    
+# The catalogue is built lazily: each benchmark function is created on first access (see `__getattr__`)
+BENCHMARKS_ = {
+    # 2d functions
+
+    'Sphere2d': lambda: BenchmarkFunction(
+        name             = "Sphere-2d",
+        fun              = sphere,
+        batch_fun        = sphere_batch,
+        bounds           = np.array([(-5.12, 5.12)]*2),
+        optimal_solution = np.zeros(2)
+    ),
+
+    'Rosenbrock2d': lambda: BenchmarkFunction(
+        name             = "Rosenbrock-2d",
+        fun              = rosenbrock,
+        batch_fun        = rosenbrock_batch,
+        bounds           = np.array([(-2.048, 2.048)]*2),
+        optimal_solution = np.ones(2)
+    ),
+
+    'Ackley2d': lambda: BenchmarkFunction(
+        name             = "Ackley-2d",
+        fun              = ackley,
+        batch_fun        = ackley_batch,
+        bounds           = np.array([(-5, 5)]*2),
+        optimal_solution = np.zeros(2)
+    ),
+
+    'Rastrigin2d': lambda: BenchmarkFunction(
+        name             = "Rastrigin-2d",
+        fun              = rastrigin,
+        batch_fun        = rastrigin_batch,
+        bounds           = np.array([(-5.12, 5.12)]*2),
+        optimal_solution = np.zeros(2)
+    ),
+
+    'Weierstrass2d': lambda: BenchmarkFunction(
+        name             = "Weierstrass-2d",
+        fun              = weierstrass,
+        batch_fun        = weierstrass_batch,
+        bounds           = np.array([(-0.5, 0.5)]*2),
+        optimal_solution = np.zeros(2)
+    ),
+
+    'Griewank2d': lambda: BenchmarkFunction(
+        name             = "Griewank-2d",
+        fun              = griewank,
+        batch_fun        = griewank_batch,
+        bounds           = np.array([(-600, 600)]*2),
+        optimal_solution = np.zeros(2)
+    ),
+
+    'Schwefel2d': lambda: BenchmarkFunction(
+        name             = "Schwefel-2d",
+        fun              = schwefel,
+        batch_fun        = schwefel_batch,
+        bounds           = np.array([(-500, 500)]*2),
+        optimal_solution = np.full(2,420.9687)
+    ),
+
+    'Sumsquares2d': lambda: BenchmarkFunction(
+        name             = "Sumsquares-2d",
+        fun              = sumsquares,
+        batch_fun        = sumsquares_batch,
+        bounds           = np.array([(-10, 10)]*2),
+        optimal_solution = np.zeros(2)
+    ),
+
+    'Eggholder': lambda: BenchmarkFunction(
+        name             = "Eggholder",
+        fun              = eggholder,
+        batch_fun        = eggholder_batch,
+        bounds           = np.array([(-512, 512)]*2),
+        optimal_solution = np.array([512,404.2319])
+    ),
+
+    # 10d functions
+
+    'Sphere10d': lambda: BenchmarkFunction(
+        name             = "Sphere-10d",
+        fun              = sphere,
+        batch_fun        = sphere_batch,
+        bounds           = np.array([(-5.12, 5.12)]*10),
+        optimal_solution = np.zeros(10)
+    ),
+
+    'Rosenbrock10d': lambda: BenchmarkFunction(
+        name             = "Rosenbrock-10d",
+        fun              = rosenbrock,
+        batch_fun        = rosenbrock_batch,
+        bounds           = np.array([(-2.048, 2.048)]*10),
+        optimal_solution = np.ones(10)
+    ),
+
+    'Ackley10d': lambda: BenchmarkFunction(
+        name             = "Ackley-10d",
+        fun              = ackley,
+        batch_fun        = ackley_batch,
+        bounds           = np.array([(-5, 5)]*10),
+        optimal_solution = np.zeros(10)
+    ),
+
+    'Rastrigin10d': lambda: BenchmarkFunction(
+        name             = "Rastrigin-10d",
+        fun              = rastrigin,
+        batch_fun        = rastrigin_batch,
+        bounds           = np.array([(-5.12, 5.12)]*10),
+        optimal_solution = np.zeros(10)
+    ),
+
+    'Weierstrass10d': lambda: BenchmarkFunction(
+        name             = "Weierstrass-10d",
+        fun              = weierstrass,
+        batch_fun        = weierstrass_batch,
+        bounds           = np.array([(-0.5, 0.5)]*10),
+        optimal_solution = np.zeros(10)
+    ),
+
+    'Griewank10d': lambda: BenchmarkFunction(
+        name             = "Griewank-10d",
+        fun              = griewank,
+        batch_fun        = griewank_batch,
+        bounds           = np.array([(-600, 600)]*10),
+        optimal_solution = np.zeros(10)
+    ),
+
+    'Schwefel10d': lambda: BenchmarkFunction(
+        name             = "Schwefel-10d",
+        fun              = schwefel,
+        batch_fun        = schwefel_batch,
+        bounds           = np.array([(-500, 500)]*10),
+        optimal_solution = np.full(10,420.9687)
+    ),
+
+    'Sumsquares10d': lambda: BenchmarkFunction(
+        name             = "Sumsquares-10d",
+        fun              = sumsquares,
+        batch_fun        = sumsquares_batch,
+        bounds           = np.array([(-10, 10)]*10),
+        optimal_solution = np.zeros(10)
+    ),
+
+    # 30d functions
+
+    'Sphere30d': lambda: BenchmarkFunction(
+        name             = "Sphere-30d",
+        fun              = sphere,
+        batch_fun        = sphere_batch,
+        bounds           = np.array([(-5.12, 5.12)]*30),
+        optimal_solution = np.zeros(30)
+    ),
+
+    'Rosenbrock30d': lambda: BenchmarkFunction(
+        name             = "Rosenbrock-30d",
+        fun              = rosenbrock,
+        batch_fun        = rosenbrock_batch,
+        bounds           = np.array([(-2.048, 2.048)]*30),
+        optimal_solution = np.ones(30)
+    ),
+
+    'Ackley30d': lambda: BenchmarkFunction(
+        name             = "Ackley-30d",
+        fun              = ackley,
+        batch_fun        = ackley_batch,
+        bounds           = np.array([(-5, 5)]*30),
+        optimal_solution = np.zeros(30)
+    ),
+
+    'Rastrigin30d': lambda: BenchmarkFunction(
+        name             = "Rastrigin-30d",
+        fun              = rastrigin,
+        batch_fun        = rastrigin_batch,
+        bounds           = np.array([(-5.12, 5.12)]*30),
+        optimal_solution = np.zeros(30)
+    ),
+
+    'Weierstrass30d': lambda: BenchmarkFunction(
+        name             = "Weierstrass-30d",
+        fun              = weierstrass,
+        batch_fun        = weierstrass_batch,
+        bounds           = np.array([(-0.5, 0.5)]*30),
+        optimal_solution = np.zeros(30)
+    ),
+
+    'Griewank30d': lambda: BenchmarkFunction(
+        name             = "Griewank-30d",
+        fun              = griewank,
+        batch_fun        = griewank_batch,
+        bounds           = np.array([(-600, 600)]*30),
+        optimal_solution = np.zeros(30)
+    ),
+
+    'Schwefel30d': lambda: BenchmarkFunction(
+        name             = "Schwefel-30d",
+        fun              = schwefel,
+        batch_fun        = schwefel_batch,
+        bounds           = np.array([(-500, 500)]*30),
+        optimal_solution = np.full(30,420.9687)
+    ),
+
+    'Sumsquares30d': lambda: BenchmarkFunction(
+        name             = "Sumsquares-30d",
+        fun              = sumsquares,
+        batch_fun        = sumsquares_batch,
+        bounds           = np.array([(-10, 10)]*30),
+        optimal_solution = np.zeros(30)
+    ),
+}
+
+__all__ = ['BenchmarkFunction',
+           'sphere','rosenbrock','ackley','rastrigin','weierstrass','griewank','schwefel','sumsquares','eggholder',
+           'sphere_batch','rosenbrock_batch','ackley_batch','rastrigin_batch','weierstrass_batch','griewank_batch','schwefel_batch','sumsquares_batch','eggholder_batch',
+           *BENCHMARKS_]
+
+#--------------------------------------------------------------------------------
+
+def __getattr__(name):
+    """
+    Builds a benchmark function of the catalogue on first access (e.g. `beeoptimal.benchmarks.Sphere2d`) and caches it in the module.
+    """
+    if name in BENCHMARKS_:
+        benchmark = BENCHMARKS_[name]()
+        globals()[name] = benchmark
+        return benchmark
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+#--------------------------------------------------------------------------------
+
+def __dir__():
+    return sorted(set(globals()) | set(BENCHMARKS_))
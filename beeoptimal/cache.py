@@ -0,0 +1,210 @@
+#++++++++++++++++++++++++++++++++++++
+# Libraries and modules
+#++++++++++++++++++++++++++++++++++++
+
+import numpy as np
+from collections import OrderedDict,namedtuple
+
+#++++++++++++++++++++++++++++++++++++
+# EvaluationCache class
+#++++++++++++++++++++++++++++++++++++
+
+CacheInfo = namedtuple('CacheInfo',['hits','misses','maxsize','currsize'])
+
+class EvaluationCache():
+    """
+    Wraps an objective function with a bounded LRU cache of its values, keyed on the bytes of the (optionally rounded) positions.
+
+    Attributes:
+        function (callable) : The wrapped objective function.
+        maxsize (int)       : The maximum number of cached values (None for an unbounded cache). The least recently used values are discarded first.
+        decimals (int)      : The number of decimals the positions are rounded to when building the keys (None for exact keys).
+        vectorized (bool)   : Whether `function` evaluates a whole batch of positions at once (see `ArtificialBeeColony`).
+        hits (int)          : The number of evaluations served by the cache (including duplicates within the same batch).
+        misses (int)        : The number of evaluations forwarded to `function`.
+
+    .. note::
+            With `decimals`, positions that round to the same key share the value of the first one evaluated (approximate memoization).
+            When the cache is the `function` of an `ArtificialBeeColony`, lookups happen in the main process and only the missing positions
+            are sent to the evaluation pool (or awaited, for coroutine functions).
+
+    Examples:
+        >>> cached_objective = EvaluationCache(expensive_simulation,maxsize=10000,decimals=8)
+        >>> abc = ArtificialBeeColony(colony_size=50,function=cached_objective,bounds=bounds)
+        >>> abc.optimize(max_iters=500)
+        >>> cached_objective.cache_info()
+        CacheInfo(hits=3812, misses=46238, maxsize=10000, currsize=10000)
+    """
+    #--------------------------------------------------------------------------------
+    def __init__(self,function,maxsize=100000,decimals=None,vectorized=False):
+        """
+        Initializes the cache.
+
+        Args:
+            function (callable)         : The objective function to wrap.
+            maxsize (int, optional)     : The maximum number of cached values (None for an unbounded cache). Defaults to 100000.
+            decimals (int, optional)    : The number of decimals the positions are rounded to when building the keys. Defaults to None (exact keys).
+            vectorized (bool, optional) : Whether `function` maps a numpy array of shape `(N,D)` to a numpy array of shape `(N,)`. Defaults to False.
+
+        Raises:
+            TypeError  : If `function` is not callable.
+            ValueError : If `maxsize` is not a positive integer or None.
+            ValueError : If `decimals` is not an integer or None.
+            TypeError  : If `vectorized` is not a boolean.
+        """
+
+        if not callable(function):
+            raise TypeError("`function` must be callable.")
+        self.function = function
+
+        if not ((maxsize is None) or (isinstance(maxsize,int) and maxsize > 0)):
+            raise ValueError(f"`maxsize` must be a positive integer or None, but got {maxsize}")
+        self.maxsize = maxsize
+
+        if not ((decimals is None) or isinstance(decimals,int)):
+            raise ValueError(f"`decimals` must be an integer or None, but got {decimals}")
+        self.decimals = decimals
+
+        if not isinstance(vectorized,bool):
+            raise TypeError("`vectorized` must be bool")
+        self.vectorized = vectorized
+
+        self._cache = OrderedDict()
+        self.hits   = 0
+        self.misses = 0
+    #--------------------------------------------------------------------------------
+    def __call__(self,position):
+        """
+        Evaluates the objective function, using the cached value when available.
+
+        Args:
+            position (numpy-array): A position with shape `(D,)` (or a batch of positions with shape `(N,D)` if the cache is vectorized).
+
+        Returns:
+            float or numpy-array: The objective value (or the objective values of the batch).
+        """
+        if self.vectorized:
+            return self.evaluate(position)
+        return self.evaluate(np.asarray(position).reshape(1,-1))[0]
+    #--------------------------------------------------------------------------------
+    def key_(self,position):
+        """
+        Builds the cache key of a position.
+        """
+        position = np.asarray(position,dtype=float).reshape(-1)
+        if self.decimals is not None:
+            # Adding 0.0 turns -0.0 into 0.0, so that both round to the same key
+            position = np.round(position,self.decimals) + 0.0
+        return position.tobytes()
+    #--------------------------------------------------------------------------------
+    def lookup_(self,positions):
+        """
+        Looks up a batch of positions in the cache.
+
+        Args:
+            positions (numpy-array): The positions, with shape `(N,D)`.
+
+        Returns:
+            tuple: The keys of the positions, their values (only meaningful for cached positions), the index of the position
+            each value is taken from, and the indices of the positions that must be evaluated (one per missing key).
+        """
+        keys              = [self.key_(position) for position in positions]
+        values            = np.empty(len(keys))
+        sources           = np.arange(len(keys))
+        first_occurrences = {}
+
+        for idx,key in enumerate(keys):
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                values[idx] = self._cache[key]
+                self.hits  += 1
+            elif key in first_occurrences:
+                # Duplicate within the batch: evaluated once, then copied
+                sources[idx] = first_occurrences[key]
+                self.hits   += 1
+            else:
+                first_occurrences[key] = idx
+                self.misses += 1
+
+        missing = np.fromiter(first_occurrences.values(),dtype=int,count=len(first_occurrences))
+        return keys,values,sources,missing
+    #--------------------------------------------------------------------------------
+    def store_(self,keys,values,sources,missing,missing_values):
+        """
+        Stores the values of the missing positions and completes the values of the batch.
+
+        Returns:
+            numpy-array: The objective values of the batch, with shape `(N,)`.
+        """
+        values[missing] = missing_values
+        for idx in missing:
+            self._cache[keys[idx]] = values[idx]
+        if self.maxsize is not None:
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return values[sources]
+    #--------------------------------------------------------------------------------
+    def evaluate_missing_(self,positions):
+        """
+        Evaluates the wrapped function at the given positions, with shape `(N,D)`.
+        """
+        if self.vectorized:
+            return np.asarray(self.function(positions),dtype=float).reshape(-1)
+        return np.array([self.function(position) for position in positions],dtype=float)
+    #--------------------------------------------------------------------------------
+    def evaluate(self,positions,evaluate_missing=None):
+        """
+        Evaluates a batch of positions, forwarding only the positions that are not cached.
+
+        Args:
+            positions (numpy-array)              : The positions, with shape `(N,D)`.
+            evaluate_missing (callable, optional): Maps the missing positions (with shape `(M,D)`) to their values (with shape `(M,)`).
+                                                   Defaults to None (the wrapped function is called directly).
+
+        Returns:
+            numpy-array: The objective values, with shape `(N,)`.
+        """
+        positions = np.asarray(positions,dtype=float)
+        keys,values,sources,missing = self.lookup_(positions)
+        missing_values = (evaluate_missing or self.evaluate_missing_)(positions[missing]) if len(missing) > 0 else np.empty(0)
+        return self.store_(keys,values,sources,missing,missing_values)
+    #--------------------------------------------------------------------------------
+    async def evaluate_async(self,positions,evaluate_missing):
+        """
+        Same as `evaluate`, where the missing positions are evaluated by a coroutine.
+
+        Args:
+            positions (numpy-array)      : The positions, with shape `(N,D)`.
+            evaluate_missing (coroutine) : Maps the missing positions (with shape `(M,D)`) to their values (with shape `(M,)`).
+
+        Returns:
+            numpy-array: The objective values, with shape `(N,)`.
+        """
+        positions = np.asarray(positions,dtype=float)
+        keys,values,sources,missing = self.lookup_(positions)
+        missing_values = (await evaluate_missing(positions[missing])) if len(missing) > 0 else np.empty(0)
+        return self.store_(keys,values,sources,missing,missing_values)
+    #--------------------------------------------------------------------------------
+    @property
+    def hit_rate(self):
+        """The fraction of evaluations served by the cache (0.0 if nothing was evaluated yet)."""
+        n_calls = self.hits + self.misses
+        return (self.hits / n_calls) if n_calls > 0 else 0.0
+    #--------------------------------------------------------------------------------
+    def cache_info(self):
+        """
+        Reports the cache statistics, in the style of `functools.lru_cache`.
+
+        Returns:
+            CacheInfo: A named tuple with the hits, the misses, the maximum size and the current size of the cache.
+        """
+        return CacheInfo(hits=self.hits,misses=self.misses,maxsize=self.maxsize,currsize=len(self._cache))
+    #--------------------------------------------------------------------------------
+    def clear(self):
+        """
+        Empties the cache and resets the statistics.
+        """
+        self._cache.clear()
+        self.hits   = 0
+        self.misses = 0
+    #--------------------------------------------------------------------------------
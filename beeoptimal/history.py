@@ -0,0 +1,347 @@
+#++++++++++++++++++++++++++++++++++++
+# Libraries and modules
+#++++++++++++++++++++++++++++++++++++
+
+import numpy as np
+import os
+import json
+from collections.abc import Sequence
+from .bee import Bee
+
+#++++++++++++++++++++++++++++++++++++
+# ColonyHistory class
+#++++++++++++++++++++++++++++++++++++
+
+# Number of records after which the metadata of a history stored on disk is rewritten
+METADATA_EVERY_ = 10
+
+class ColonyHistory():
+    """
+    Records the evolution of the colony in preallocated numpy arrays.
+
+    Attributes:
+        mode (str or int)           : What is recorded. 'none' records nothing, 'best' records the optimal bee at each iteration,
+                                      'full' records the optimal bee and the whole colony at each iteration, and an integer `k` records
+                                      the optimal bee at each iteration and the whole colony every `k` iterations.
+        dtype (numpy-dtype)         : The floating point type used to store the positions.
+        positions (numpy-array)     : The recorded colony positions, with shape `(n_snapshots,n_bees,D)`.
+        values (numpy-array)        : The recorded colony objective values, with shape `(n_snapshots,n_bees)`.
+        trials (numpy-array)        : The recorded colony trial counters, with shape `(n_snapshots,n_bees)`.
+        iterations (numpy-array)    : The iteration of each colony snapshot, with shape `(n_snapshots,)`.
+        best_positions (numpy-array): The recorded positions of the optimal bee, with shape `(n_records,D)`.
+        best_values (numpy-array)   : The recorded objective values of the optimal bee, with shape `(n_records,)`.
+        path (str)                  : The directory where the history is stored on disk (None if it is kept in memory).
+
+    .. note::
+        All the arrays are exposed as read-only views on the records collected so far.
+        Objective values are always stored in double precision, regardless of `dtype`.
+        With `path`, the record counts read by `load` are rewritten every 10 records (and by `flush`), hence a run that dies
+        mid-way can still be loaded, losing at most its last 10 records.
+
+    Examples:
+        >>> history = ColonyHistory.load('runs/schwefel')   # a history previously recorded with `path='runs/schwefel'`
+        >>> colonies = history.colony_bees(function=Schwefel2d.fun,bounds=Schwefel2d.bounds)
+        >>> colonies[100]                                   # only this snapshot is read from disk
+    """
+    #--------------------------------------------------------------------------------
+    def __init__(self,mode,n_bees,dim,max_iters,dtype=np.float64,path=None):
+        """
+        Allocates the history arrays for a whole optimization run.
+
+        Args:
+            mode (str or int)             : What is recorded. Must be one among 'none', 'best', 'full' or a positive integer.
+            n_bees (int)                  : The number of employed bees in the colony.
+            dim (int)                     : The dimensionality of the search space.
+            max_iters (int)               : The maximum number of iterations of the run.
+            dtype (numpy-dtype, optional) : The floating point type used to store the positions. Defaults to np.float64.
+            path (str, optional)          : A directory where the arrays are stored as memory-mapped `.npy` files, so that records are streamed
+                                            to disk instead of being kept in memory. Defaults to None (in-memory history).
+
+        Raises:
+            ValueError : If `mode` is not one among 'none', 'best', 'full' or a positive integer.
+            TypeError  : If `dtype` is not a floating point type.
+        """
+
+        valid_modes_ = ['none','best','full']
+        if not ((mode in valid_modes_) or (isinstance(mode,int) and not isinstance(mode,bool) and mode > 0)):
+            raise ValueError(f"{mode} is an invalid history. Choose one among {', '.join(valid_modes_)} or a positive integer.")
+        self.mode = mode
+
+        if not np.issubdtype(np.dtype(dtype),np.floating):
+            raise TypeError(f"`history_dtype` must be a floating point type, but got {dtype}")
+        self.dtype = np.dtype(dtype)
+
+        self.keep_best    = (mode != 'none')
+        self.colony_every = {'none': None, 'best': None, 'full': 1}.get(mode,mode)
+
+        n_records   = (max_iters + 1) if self.keep_best else 0
+        n_snapshots = (max_iters // self.colony_every + 1) if self.colony_every else 0
+
+        self.path = path
+        if self.path is not None:
+            os.makedirs(self.path,exist_ok=True)
+
+        self._best_positions = self.allocate_('best_positions',(n_records,dim),self.dtype)
+        self._best_values    = self.allocate_('best_values',(n_records,),np.float64)
+        self._positions      = self.allocate_('positions',(n_snapshots,n_bees,dim),self.dtype)
+        self._values         = self.allocate_('values',(n_snapshots,n_bees),np.float64)
+        self._trials         = self.allocate_('trials',(n_snapshots,n_bees),np.int64)
+        self._iterations     = self.allocate_('iterations',(n_snapshots,),np.int64)
+        self.n_records       = 0
+        self.n_snapshots     = 0
+        self._unsaved        = 0
+        self.flush()
+    #--------------------------------------------------------------------------------
+    def allocate_(self,name,shape,dtype):
+        """
+        Allocates a history array, either in memory or as a memory-mapped `.npy` file in `path`.
+
+        Args:
+            name (str)          : The name of the array (and of the file).
+            shape (tuple)       : The shape of the array.
+            dtype (numpy-dtype) : The type of the array.
+
+        Returns:
+            numpy-array: The allocated (uninitialized) array.
+        """
+
+        # Empty arrays cannot be memory-mapped, and are simply not written to disk
+        if (self.path is None) or (np.prod(shape) == 0):
+            return np.empty(shape,dtype=dtype)
+        return np.lib.format.open_memmap(os.path.join(self.path,f'{name}.npy'),mode='w+',dtype=dtype,shape=shape)
+    #--------------------------------------------------------------------------------
+    def flush(self):
+        """
+        Writes pending records to disk, together with the metadata needed by `ColonyHistory.load`. Does nothing for in-memory histories.
+        """
+
+        if self.path is None:
+            return
+        for array in (self._best_positions,self._best_values,self._positions,self._values,self._trials,self._iterations):
+            if isinstance(array,np.memmap):
+                array.flush()
+        self.write_metadata_()
+    #--------------------------------------------------------------------------------
+    def write_metadata_(self):
+        """
+        Writes the metadata needed by `ColonyHistory.load` (mode, dtype and record counts) to `history.json`, atomically.
+        """
+
+        metadata = {'mode'        : self.mode,
+                    'dtype'       : self.dtype.str,
+                    'n_records'   : self.n_records,
+                    'n_snapshots' : self.n_snapshots}
+        metadata_path = os.path.join(self.path,'history.json')
+        with open(f'{metadata_path}.tmp','w') as f:
+            json.dump(metadata,f)
+        os.replace(f'{metadata_path}.tmp',metadata_path)
+        self._unsaved = 0
+    #--------------------------------------------------------------------------------
+    @classmethod
+    def load(cls,path,mmap_mode='r'):
+        """
+        Opens a history stored on disk (in read-only mode by default). Arrays are memory-mapped, so records are only read when accessed.
+
+        Args:
+            path (str)                : The directory where the history was stored.
+            mmap_mode (str, optional) : The mode used to memory-map the arrays ('r' for read-only, 'r+' to keep recording). Defaults to 'r'.
+
+        Returns:
+            ColonyHistory: The history stored in `path`.
+
+        Raises:
+            FileNotFoundError: If `path` does not contain a recorded history.
+        """
+
+        metadata_path = os.path.join(path,'history.json')
+        if not os.path.exists(metadata_path):
+            raise FileNotFoundError(f"No history found at: {path}")
+        with open(metadata_path) as f:
+            metadata = json.load(f)
+
+        def open_array(name,dtype,ndim):
+            file_path = os.path.join(path,f'{name}.npy')
+            if os.path.exists(file_path):
+                return np.load(file_path,mmap_mode=mmap_mode)
+            return np.empty((0,)*ndim,dtype=dtype)
+
+        history = cls.__new__(cls)
+        history.mode            = metadata['mode']
+        history.dtype           = np.dtype(metadata['dtype'])
+        history.keep_best       = (history.mode != 'none')
+        history.colony_every    = {'none': None, 'best': None, 'full': 1}.get(history.mode,history.mode)
+        history.path            = path
+        history._best_positions = open_array('best_positions',history.dtype,2)
+        history._best_values    = open_array('best_values',np.float64,1)
+        history._positions      = open_array('positions',history.dtype,3)
+        history._values         = open_array('values',np.float64,2)
+        history._trials         = open_array('trials',np.int64,2)
+        history._iterations     = open_array('iterations',np.int64,1)
+        history.n_records       = metadata['n_records']
+        history.n_snapshots     = metadata['n_snapshots']
+        history._unsaved        = 0
+        return history
+    #--------------------------------------------------------------------------------
+    def record(self,iteration,positions,values,trials,best_idx):
+        """
+        Records the state of the colony at a given iteration.
+
+        Args:
+            iteration (int)          : The current iteration (0 for the initial colony).
+            positions (numpy-array)  : The positions of the employed bees.
+            values (numpy-array)     : The objective values of the employed bees.
+            trials (numpy-array)     : The trial counters of the employed bees.
+            best_idx (int)           : The index of the optimal bee.
+        """
+
+        if self.keep_best:
+            self._best_positions[self.n_records] = positions[best_idx]
+            self._best_values[self.n_records]    = values[best_idx]
+            self.n_records += 1
+
+        if self.colony_every and (iteration % self.colony_every == 0):
+            self._positions[self.n_snapshots]  = positions
+            self._values[self.n_snapshots]     = values
+            self._trials[self.n_snapshots]     = trials
+            self._iterations[self.n_snapshots] = iteration
+            self.n_snapshots += 1
+
+        # The counts are only rewritten after the records, so that `load` never reports records that were not written yet
+        if self.path is not None:
+            self._unsaved += 1
+            if self._unsaved >= METADATA_EVERY_:
+                self.write_metadata_()
+    #--------------------------------------------------------------------------------
+    def restore(self,best_positions,best_values,positions,values,trials,iterations):
+        """
+        Restores records collected by a previous run (e.g. from a checkpoint), so that the recording can go on.
+
+        Args:
+            best_positions (numpy-array) : The recorded positions of the optimal bee, with shape `(n_records,D)`.
+            best_values (numpy-array)    : The recorded objective values of the optimal bee, with shape `(n_records,)`.
+            positions (numpy-array)      : The recorded colony positions, with shape `(n_snapshots,n_bees,D)`.
+            values (numpy-array)         : The recorded colony objective values, with shape `(n_snapshots,n_bees)`.
+            trials (numpy-array)         : The recorded colony trial counters, with shape `(n_snapshots,n_bees)`.
+            iterations (numpy-array)     : The iteration of each colony snapshot, with shape `(n_snapshots,)`.
+        """
+
+        self.n_records   = len(best_values)
+        self.n_snapshots = len(iterations)
+        self._best_positions[:self.n_records] = best_positions
+        self._best_values[:self.n_records]    = best_values
+        self._positions[:self.n_snapshots]    = positions
+        self._values[:self.n_snapshots]       = values
+        self._trials[:self.n_snapshots]       = trials
+        self._iterations[:self.n_snapshots]   = iterations
+    #--------------------------------------------------------------------------------
+    @staticmethod
+    def read_only_(array):
+        """
+        Returns a read-only view of an array.
+        """
+        view = array.view()
+        view.flags.writeable = False
+        return view
+    #--------------------------------------------------------------------------------
+    @property
+    def positions(self):
+        """The recorded colony positions, with shape `(n_snapshots,n_bees,D)`."""
+        return self.read_only_(self._positions[:self.n_snapshots])
+    #--------------------------------------------------------------------------------
+    @property
+    def values(self):
+        """The recorded colony objective values, with shape `(n_snapshots,n_bees)`."""
+        return self.read_only_(self._values[:self.n_snapshots])
+    #--------------------------------------------------------------------------------
+    @property
+    def trials(self):
+        """The recorded colony trial counters, with shape `(n_snapshots,n_bees)`."""
+        return self.read_only_(self._trials[:self.n_snapshots])
+    #--------------------------------------------------------------------------------
+    @property
+    def iterations(self):
+        """The iteration of each colony snapshot, with shape `(n_snapshots,)`."""
+        return self.read_only_(self._iterations[:self.n_snapshots])
+    #--------------------------------------------------------------------------------
+    @property
+    def best_positions(self):
+        """The recorded positions of the optimal bee, with shape `(n_records,D)`."""
+        return self.read_only_(self._best_positions[:self.n_records])
+    #--------------------------------------------------------------------------------
+    @property
+    def best_values(self):
+        """The recorded objective values of the optimal bee, with shape `(n_records,)`."""
+        return self.read_only_(self._best_values[:self.n_records])
+    #--------------------------------------------------------------------------------
+    def colony_bees(self,function,bounds):
+        """
+        Lazy sequence of the recorded colonies, each one as a list of Bee instances.
+
+        Args:
+            function (callable)  : The objective function to attach to the bees.
+            bounds (numpy-array) : The bounds to attach to the bees.
+
+        Returns:
+            BeeHistoryView: A read-only sequence of `list[Bee]`, built on access.
+        """
+
+        def get_colony(snapshot_idx):
+            colony = []
+            for position,value,trial in zip(self._positions[snapshot_idx],self._values[snapshot_idx],self._trials[snapshot_idx]):
+                bee = Bee(position=position.copy(),function=function,bounds=bounds,value=value)
+                bee.trial = int(trial)
+                colony.append(bee)
+            return colony
+
+        return BeeHistoryView(length=self.n_snapshots,getter=get_colony)
+    #--------------------------------------------------------------------------------
+    def best_bees(self,function,bounds):
+        """
+        Lazy sequence of the recorded optimal bees.
+
+        Args:
+            function (callable)  : The objective function to attach to the bees.
+            bounds (numpy-array) : The bounds to attach to the bees.
+
+        Returns:
+            BeeHistoryView: A read-only sequence of `Bee`, built on access.
+        """
+
+        def get_best(record_idx):
+            return Bee(position=self._best_positions[record_idx].copy(),function=function,bounds=bounds,value=self._best_values[record_idx])
+
+        return BeeHistoryView(length=self.n_records,getter=get_best)
+    #--------------------------------------------------------------------------------
+
+#++++++++++++++++++++++++++++++++++++
+# BeeHistoryView class
+#++++++++++++++++++++++++++++++++++++
+
+class BeeHistoryView(Sequence):
+    """
+    Read-only sequence that builds its items on access (supports `len`, indexing, slicing and iteration).
+
+    Attributes:
+        length (int)      : The number of items in the sequence.
+        getter (callable) : The function building the item at a given (non-negative) index.
+    """
+    #--------------------------------------------------------------------------------
+    def __init__(self,length,getter):
+        """
+        Initializes the view.
+
+        Args:
+            length (int)      : The number of items in the sequence.
+            getter (callable) : The function building the item at a given (non-negative) index.
+        """
+        self.length = length
+        self.getter = getter
+    #--------------------------------------------------------------------------------
+    def __len__(self):
+        return self.length
+    #--------------------------------------------------------------------------------
+    def __getitem__(self,idx):
+        if isinstance(idx,slice):
+            return [self.getter(i) for i in range(self.length)[idx]]
+        return self.getter(range(self.length)[idx])
+    #--------------------------------------------------------------------------------
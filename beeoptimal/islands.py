@@ -0,0 +1,320 @@
+#++++++++++++++++++++++++++++++++++++
+# Libraries and modules
+#++++++++++++++++++++++++++++++++++++
+
+import numpy as np
+import multiprocessing
+import traceback
+from .abc import ArtificialBeeColony
+from .runs import RESERVED_PARAMS_
+from .utils import get_progress_bar
+
+#++++++++++++++++++++++++++++++++++++
+# Island ABC class
+#++++++++++++++++++++++++++++++++++++
+
+class IslandABC():
+    """
+    Island model of the Artificial Bee Colony: several independent colonies (islands) that periodically exchange their best bees.
+
+    Attributes:
+        n_islands (int)                     : The number of islands.
+        islands (list[ArtificialBeeColony]) : The colonies of the islands.
+        topology (str)                      : The migration topology. Must be one among 'ring' (each island sends its best bees to the next one)
+                                              and 'fully_connected' (each island receives the best bees among all the other islands).
+        migration_interval (int)            : The number of iterations between two migrations.
+        migration_size (int)                : The number of bees received by each island at each migration. They replace its worst bees.
+        optimal_bee (Bee)                   : The optimal bee among all the islands.
+        n_evaluations (int)                 : The number of objective function evaluations performed by all the islands.
+        n_migrations (int)                  : The number of migrations performed during the last optimization.
+
+    .. note::
+            With `parallel=True`, each island runs in its own process and only the migrating bees are exchanged (through pipes).
+            Islands draw random numbers from their own independent streams, hence results do not depend on `parallel` for a given seed.
+    """
+    #--------------------------------------------------------------------------------
+    def __init__(self,n_islands,colony_size,function,bounds,n_employed_bees=None,max_scouts=None,vectorized=False):
+        """
+        Initializes the islands.
+
+        Args:
+            n_islands (int)                 : The number of islands.
+            colony_size (int)               : The total number of bees in each colony.
+            function (callable)             : The objective function to optimize (it must be picklable to run the islands in parallel).
+            bounds (array-like)             : The bounds for each dimension of the search space, provided as a 2D array [(lower1, upper1), ..., (lowerD, upperD)].
+            n_employed_bees (int, optional) : The number of employed bees of each colony. Defaults to half the total number of bees.
+            max_scouts (int, optional)      : The maximum number of scout bees per iteration of each colony. Defaults to None.
+            vectorized (bool, optional)     : Whether `function` evaluates a whole batch of positions at once. Defaults to False.
+
+        Raises:
+            ValueError : If `n_islands` is not an integer greater than 1.
+            ValueError : If any of the remaining arguments is invalid (see `ArtificialBeeColony`).
+        """
+
+        if not (isinstance(n_islands,int) and (n_islands >= 2)):
+            raise ValueError(f"`n_islands` must be an integer greater than 1, but got {n_islands}")
+        self.n_islands = n_islands
+
+        self.islands = [ArtificialBeeColony(colony_size     = colony_size,
+                                            function        = function,
+                                            bounds          = bounds,
+                                            n_employed_bees = n_employed_bees,
+                                            max_scouts      = max_scouts,
+                                            vectorized      = vectorized) for _ in range(self.n_islands)]
+        self.optimal_bee   = None
+        self.n_evaluations = 0
+        self.n_migrations  = 0
+    #--------------------------------------------------------------------------------
+    def optimize(self,
+                 max_iters          = 1000,
+                 migration_interval = 50,
+                 migration_size     = 1,
+                 topology           = 'ring',
+                 island_params      = None,
+                 parallel           = True,
+                 random_seed        = None,
+                 verbose            = False,
+                 **params):
+        """
+        Runs the optimization process on all the islands, with a migration every `migration_interval` iterations.
+
+        Args:
+            max_iters (int, optional)            : The maximum number of iterations of each island. Defaults to 1000.
+            migration_interval (int, optional)   : The number of iterations between two migrations. Defaults to 50.
+            migration_size (int, optional)       : The number of bees received by each island at each migration. Defaults to 1.
+            topology (str, optional)             : The migration topology. Must be one among 'ring' and 'fully_connected'. Defaults to 'ring'.
+            island_params (list[dict], optional) : The parameters of each island (e.g. `[{'mutation': 'StandardABC'}, {'mutation': 'DirectedABC'}]`),
+                                                   overriding the common ones. Defaults to None.
+            parallel (bool, optional)            : Whether to run each island in its own process. Defaults to True.
+            random_seed (int, optional)          : The seed from which the independent random streams of the islands are spawned. Defaults to None.
+            verbose (bool, optional)             : Whether to display optimization progress. Defaults to False.
+            **params                             : The parameters shared by all the islands (see `ArtificialBeeColony.setup`).
+                                                   The history defaults to 'best' (only the optimal bee is recorded), since parallel islands
+                                                   are sent back to the main process at the end of the optimization.
+
+        Raises:
+            ValueError : If `migration_interval` is not a positive integer.
+            ValueError : If `migration_size` is not an integer between 1 and the number of employed bees.
+            ValueError : If `topology` is not one among 'ring' and 'fully_connected'.
+            ValueError : If `island_params` is not a list with one dictionary per island.
+            ValueError : If `params` or `island_params` contain a parameter that cannot be shared by the islands (e.g. `random_seed` or `history_path`).
+            TypeError  : If `parallel` or `verbose` are not booleans.
+            RuntimeError: If an island fails while running in parallel.
+        """
+
+        if not (isinstance(migration_interval,int) and (migration_interval >= 1)):
+            raise ValueError(f"`migration_interval` must be a positive integer, but got {migration_interval}")
+        self.migration_interval = migration_interval
+
+        n_employed_bees = min(island.n_employed_bees for island in self.islands)
+        if not (isinstance(migration_size,int) and (1 <= migration_size <= n_employed_bees)):
+            raise ValueError(f"`migration_size` must be an integer between 1 and {n_employed_bees}, but got {migration_size}")
+        self.migration_size = migration_size
+
+        valid_topologies_ = ['ring','fully_connected']
+        if topology not in valid_topologies_:
+            raise ValueError(f"{topology} is an invalid topology. Choose one among {', '.join(valid_topologies_)}.")
+        self.topology = topology
+
+        if island_params is None:
+            island_params = [{} for _ in range(self.n_islands)]
+        if not (isinstance(island_params,list) and (len(island_params) == self.n_islands) and all(isinstance(p,dict) for p in island_params)):
+            raise ValueError(f"`island_params` must be a list of {self.n_islands} dictionaries.")
+        reserved_params = [param for param in RESERVED_PARAMS_ if (param in params) or any(param in own_params for own_params in island_params)]
+        if len(reserved_params) > 0:
+            raise ValueError(f"The islands cannot set {', '.join(reserved_params)}: each island is seeded with its own stream and runs independently.")
+
+        if not isinstance(parallel,bool):
+            raise TypeError("`parallel` must be bool")
+        if not isinstance(verbose,bool):
+            raise TypeError("`verbose` must be bool")
+
+        # Each island gets its own independent random stream
+        seeds = np.random.SeedSequence(random_seed).spawn(self.n_islands)
+        for island,seed,own_params in zip(self.islands,seeds,island_params):
+            island.setup(**{'max_iters': max_iters, 'history': 'best', **params, **own_params, 'random_seed': seed})
+
+        runners = [ProcessIsland(island) if parallel else LocalIsland(island) for island in self.islands]
+        self.n_migrations = 0
+        progress_bar = get_progress_bar(total=max_iters,desc='Running Optimization',disable= not verbose)
+        try:
+            while True:
+                for runner in runners:
+                    runner.run(n_iters=self.migration_interval,migration_size=self.migration_size)
+                reports = [runner.report() for runner in runners]
+                progress_bar.update(max(report['actual_iters'] for report in reports) - progress_bar.n)
+                if all(report['finished'] for report in reports):
+                    break
+                for runner,immigrants in zip(runners,self.route_(reports)):
+                    runner.immigrate(*immigrants)
+                self.n_migrations += 1
+            self.islands = [runner.stop() for runner in runners]
+        finally:
+            progress_bar.close()
+            for runner in runners:
+                runner.close()
+
+        best_island        = max(self.islands,key=lambda island: island.optimal_bee.fitness)
+        self.optimal_bee   = best_island.optimal_bee
+        self.n_evaluations = sum(island.n_evaluations for island in self.islands)
+    #--------------------------------------------------------------------------------
+    def route_(self,reports):
+        """
+        Routes the emigrants of each island to their destinations, according to the topology.
+
+        Args:
+            reports (list[dict]): The reports of the islands, including the positions and values of their best bees.
+
+        Returns:
+            list[tuple]: The positions and values of the immigrants of each island.
+        """
+
+        routes = []
+        for island_idx in range(self.n_islands):
+            if self.topology == 'ring':
+                sources = [(island_idx - 1) % self.n_islands]
+            elif self.topology == 'fully_connected':
+                sources = [source for source in range(self.n_islands) if source != island_idx]
+            positions   = np.vstack([reports[source]['positions'] for source in sources])
+            values      = np.concatenate([reports[source]['values'] for source in sources])
+            fittest_idx = np.argsort(-ArtificialBeeColony.compute_fitness_(values),kind='stable')[:self.migration_size]
+            routes.append((positions[fittest_idx],values[fittest_idx]))
+        return routes
+    #--------------------------------------------------------------------------------
+
+#++++++++++++++++++++++++++++++++++++
+# Island runners
+#++++++++++++++++++++++++++++++++++++
+
+def run_island_(island,n_iters,migration_size):
+    """
+    Runs an island for (at most) `n_iters` iterations with the ask/tell interface, then reports on its state and its best bees.
+
+    Args:
+        island (ArtificialBeeColony) : The colony of the island (already set up).
+        n_iters (int)                : The number of iterations to run.
+        migration_size (int)         : The number of best bees to report.
+
+    Returns:
+        dict: Whether the island is finished, its number of iterations and the positions and values of its best bees.
+    """
+    target_iters = island.actual_iters + n_iters
+    while (not island.finished) and (island.actual_iters < target_iters):
+        island.tell(island.evaluate_(island.ask()))
+
+    fittest_idx = np.argsort(-island.fitness,kind='stable')[:migration_size]
+    return {'finished'     : island.finished,
+            'actual_iters' : island.actual_iters,
+            'positions'    : island.positions[fittest_idx].copy(),
+            'values'       : island.values[fittest_idx].copy()}
+
+#--------------------------------------------------------------------------------
+
+def immigrate_(island,positions,values):
+    """
+    Replaces the worst bees of an island with immigrants, whose objective values are already known.
+
+    Args:
+        island (ArtificialBeeColony) : The colony of the island.
+        positions (numpy-array)      : The positions of the immigrants.
+        values (numpy-array)         : The objective values of the immigrants.
+    """
+    if island.finished:
+        return
+    worst_idx = np.argsort(island.fitness,kind='stable')[:len(values)]
+    island.positions[worst_idx] = positions
+    island.values[worst_idx]    = values
+    island.fitness[worst_idx]   = island.compute_fitness_(values)
+    island.trials[worst_idx]    = 0
+    if island.mutation == 'DirectedABC':
+        island.directions[worst_idx] = 0
+    island.optimal_bee = island.get_bee_(np.argmax(island.fitness))
+
+#--------------------------------------------------------------------------------
+
+def island_worker_(connection,island):
+    """
+    Runs an island in a separate process, following the commands received through `connection`.
+
+    Args:
+        connection (Connection)      : The worker end of the pipe.
+        island (ArtificialBeeColony) : The colony of the island (already set up).
+    """
+    try:
+        while True:
+            command,payload = connection.recv()
+            if command == 'run':
+                connection.send(('ok',run_island_(island,**payload)))
+            elif command == 'immigrate':
+                immigrate_(island,*payload)
+            elif command == 'stop':
+                connection.send(('ok',island))
+                break
+    except Exception:
+        connection.send(('error',traceback.format_exc()))
+    finally:
+        connection.close()
+
+#--------------------------------------------------------------------------------
+
+class LocalIsland():
+    """
+    Runs an island in the current process.
+    """
+    #--------------------------------------------------------------------------------
+    def __init__(self,island):
+        self.island  = island
+        self.report_ = None
+    #--------------------------------------------------------------------------------
+    def run(self,n_iters,migration_size):
+        self.report_ = run_island_(self.island,n_iters=n_iters,migration_size=migration_size)
+    #--------------------------------------------------------------------------------
+    def report(self):
+        return self.report_
+    #--------------------------------------------------------------------------------
+    def immigrate(self,positions,values):
+        immigrate_(self.island,positions,values)
+    #--------------------------------------------------------------------------------
+    def stop(self):
+        return self.island
+    #--------------------------------------------------------------------------------
+    def close(self):
+        pass
+    #--------------------------------------------------------------------------------
+
+class ProcessIsland():
+    """
+    Runs an island in a separate process. Runs are asynchronous: all the islands run concurrently until their reports are collected.
+    """
+    #--------------------------------------------------------------------------------
+    def __init__(self,island):
+        self.connection,worker_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=island_worker_,args=(worker_connection,island),daemon=True)
+        self.process.start()
+        worker_connection.close()
+    #--------------------------------------------------------------------------------
+    def receive_(self):
+        status,payload = self.connection.recv()
+        if status == 'error':
+            raise RuntimeError(f"An island failed with the following error:\n{payload}")
+        return payload
+    #--------------------------------------------------------------------------------
+    def run(self,n_iters,migration_size):
+        self.connection.send(('run',{'n_iters': n_iters, 'migration_size': migration_size}))
+    #--------------------------------------------------------------------------------
+    def report(self):
+        return self.receive_()
+    #--------------------------------------------------------------------------------
+    def immigrate(self,positions,values):
+        self.connection.send(('immigrate',(positions,values)))
+    #--------------------------------------------------------------------------------
+    def stop(self):
+        self.connection.send(('stop',None))
+        return self.receive_()
+    #--------------------------------------------------------------------------------
+    def close(self):
+        self.connection.close()
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.terminate()
+    #--------------------------------------------------------------------------------
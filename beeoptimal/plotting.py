@@ -3,48 +3,55 @@
 #++++++++++++++++++++++++++++++++++++
 
 import numpy as np
+import os
+import io
+import base64
+import shutil
+import hashlib
+import weakref
+import tempfile
+import subprocess
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 import plotly.graph_objects as go
-from PIL import Image
+from PIL import Image,GifImagePlugin
 from .utils import get_marker_path
 from .benchmarks import BenchmarkFunction
 from .bee import Bee
+from .abc import ArtificialBeeColony
 
 #++++++++++++++++++++++++++++++++++++
-# Plotting functions
+# Grid evaluation
 #++++++++++++++++++++++++++++++++++++
 
-def contourplot(function, title=None, bounds=None,zoom=1.0,figsize=(600,600)):
+# Evaluated grids, with one dictionary per benchmark function (released together with the function)
+GRID_CACHE_ = weakref.WeakKeyDictionary()
+
+def evaluate_grid(function,bounds=None,zoom=1.0,resolution=100,cache_dir=None):
     """
-    Plots a 2D benchmark function as a contour plot.
+    Evaluates a 2D benchmark function on a regular grid, in a single batch. Grids are cached in memory (and optionally on disk),
+    hence repeated plots of the same function (e.g. the frames of an animation) only evaluate it once.
     
     Args:
         function (BenchmarkFunction)     : A benchmark function object.
-        title (str,optional)             : Title of the plot. Defaults to empty string.
-        bounds (numpy.ndarray, optional) : Custom bounds for the plot (different from the default ones). Defaults to None (uses the default bounds).
-        zoom (float, optional)           : Zoom factor for the plot. Defaults to 1.0 (no zoom).
-        figsize (tuple, optional)        : Size of the figure. Defaults to (600,600).
-            
+        bounds (numpy.ndarray, optional) : Custom bounds for the grid (different from the default ones). Defaults to None (uses the default bounds).
+        zoom (float, optional)           : Zoom factor for the grid. Defaults to 1.0 (no zoom).
+        resolution (int, optional)       : Number of grid points along each axis. Defaults to 100.
+        cache_dir (str, optional)        : Directory where grids are also cached as `.npy` files, across sessions. Defaults to None (in-memory cache only).
+    
     Returns:
-        plotly.graph_objects.Figure: A Plotly figure containing the contour plot of the function.
+        tuple: The grid coordinates along x1 and x2, with shape `(resolution,)`, and the (read-only) function values, with shape `(resolution,resolution)`.
         
     Raises:
-        TypeError     : If `function` is not a `BenchmarkFunction` object.
-        TypeError     : If `bounds` is not a NumPy array (when `bounds` is provided).
-        ValueError    : If `bounds` does not have shape (2, 2) (when `bounds` is provided).
-        ValueError    : If `zoom` is not greater than zero.
+        ValueError : If `resolution` is not an integer greater than 1.
+        
+    .. note::
+            Files in `cache_dir` are named after the function name, the bounds, the zoom and the resolution: functions must have distinct names.
     """
-
-    if not isinstance(function, BenchmarkFunction):
-        raise TypeError("`function` must be a `BenchmarkFunction` object.")
-
-    if bounds is not None:
-        if not isinstance(bounds, np.ndarray):
-            raise TypeError("`bounds` must be provided as a NumPy array.")
-        if bounds.shape != (2, 2):
-            raise ValueError(f"`bounds` must have shape (2, 2), but got {bounds.shape}")
     
-    if not (isinstance(zoom, (int, float)) and zoom > 0):
-        raise ValueError(f"`zoom` must be greater than zero, but got {zoom}")
+    if not (isinstance(resolution, int) and resolution > 1):
+        raise ValueError(f"`resolution` must be an integer greater than 1, but got {resolution}")
     
     # Determine the bounds (use predefined ones if no custom bounds are provided)
     if bounds is not None:
@@ -69,12 +76,116 @@ def contourplot(function, title=None, bounds=None,zoom=1.0,figsize=(600,600)):
         y_center + (y_range / 2) * zoom
     )
     
-    # Generate grid and make contourplot
-    x = np.linspace(x_bounds[0], x_bounds[1], 100)
-    y = np.linspace(y_bounds[0], y_bounds[1], 100)
-    X, Y = np.meshgrid(x, y)
-    points = np.c_[X.ravel(), Y.ravel()]  
-    Z = np.array([function.evaluate(p) for p in points]).reshape(X.shape)
+    x = np.linspace(x_bounds[0], x_bounds[1], resolution)
+    y = np.linspace(y_bounds[0], y_bounds[1], resolution)
+    
+    # Look up the grid in memory, then on disk
+    key = np.array([*x_bounds, *y_bounds], dtype=np.float64).tobytes() + str(resolution).encode()
+    function_grids = GRID_CACHE_.setdefault(function, {})
+    if key in function_grids:
+        return x, y, function_grids[key]
+    
+    file_path = None
+    if cache_dir is not None:
+        file_stem = ''.join(char if (char.isalnum() or char in '-_') else '_' for char in function.name) or 'function'
+        file_name = f"{file_stem}_{hashlib.sha1(function.name.encode() + key).hexdigest()[:16]}.npy"
+        file_path = os.path.join(os.fspath(cache_dir), file_name)
+    
+    if (file_path is not None) and os.path.exists(file_path):
+        Z = np.load(file_path)
+    else:
+        X, Y = np.meshgrid(x, y)
+        points = np.c_[X.ravel(), Y.ravel()]
+        Z = function.evaluate_batch(points).reshape(X.shape)
+        if file_path is not None:
+            os.makedirs(os.fspath(cache_dir), exist_ok=True)
+            # Write to a temporary file first, so that concurrent renderers never read a partial grid
+            with open(file_path + '.tmp', 'wb') as file:
+                np.save(file, Z)
+            os.replace(file_path + '.tmp', file_path)
+    
+    Z.flags.writeable = False
+    function_grids[key] = Z
+    return x, y, Z
+
+#--------------------------------------------------------------------------------
+
+def clear_grid_cache():
+    """
+    Empties the in-memory cache of the evaluated grids (files in `cache_dir` are left untouched).
+    """
+    GRID_CACHE_.clear()
+
+#--------------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def bee_marker_():
+    """
+    Loads the bee marker once per process, encoded as a data URI (so that Plotly does not re-encode it for each bee).
+    """
+    with open(get_marker_path(), 'rb') as file:
+        return 'data:image/png;base64,' + base64.b64encode(file.read()).decode('ascii')
+
+#--------------------------------------------------------------------------------
+
+def bees_trace_(bee_colony,mode,color_by_fitness,bee_marker_size):
+    """
+    Builds the single marker trace of a colony (see `contourplot_bees`).
+    """
+    positions = np.array([bee.position.reshape(-1)[:2] for bee in bee_colony])
+    marker = dict(size=10 if bee_marker_size is None else bee_marker_size, color='#F3C40F', line=dict(width=1, color='black'))
+    if color_by_fitness:
+        marker.update(color=[bee.fitness for bee in bee_colony], colorscale='Viridis', showscale=True, colorbar=dict(title='Fitness', x=1.15))
+    scatter = go.Scattergl if mode == 'scattergl' else go.Scatter
+    return scatter(
+        x=positions[:,0],
+        y=positions[:,1],
+        mode='markers',
+        marker=marker,
+        name='Bees')
+
+#++++++++++++++++++++++++++++++++++++
+# Plotting functions
+#++++++++++++++++++++++++++++++++++++
+
+def contourplot(function, title=None, bounds=None,zoom=1.0,figsize=(600,600),resolution=100,cache_dir=None):
+    """
+    Plots a 2D benchmark function as a contour plot.
+    
+    Args:
+        function (BenchmarkFunction)     : A benchmark function object.
+        title (str,optional)             : Title of the plot. Defaults to empty string.
+        bounds (numpy.ndarray, optional) : Custom bounds for the plot (different from the default ones). Defaults to None (uses the default bounds).
+        zoom (float, optional)           : Zoom factor for the plot. Defaults to 1.0 (no zoom).
+        figsize (tuple, optional)        : Size of the figure. Defaults to (600,600).
+        resolution (int, optional)       : Number of grid points along each axis. Defaults to 100.
+        cache_dir (str, optional)        : Directory where the evaluated grid is also cached on disk (see `evaluate_grid`). Defaults to None.
+            
+    Returns:
+        plotly.graph_objects.Figure: A Plotly figure containing the contour plot of the function.
+        
+    Raises:
+        TypeError     : If `function` is not a `BenchmarkFunction` object.
+        TypeError     : If `bounds` is not a NumPy array (when `bounds` is provided).
+        ValueError    : If `bounds` does not have shape (2, 2) (when `bounds` is provided).
+        ValueError    : If `zoom` is not greater than zero.
+        ValueError    : If `resolution` is not an integer greater than 1.
+    """
+
+    if not isinstance(function, BenchmarkFunction):
+        raise TypeError("`function` must be a `BenchmarkFunction` object.")
+
+    if bounds is not None:
+        if not isinstance(bounds, np.ndarray):
+            raise TypeError("`bounds` must be provided as a NumPy array.")
+        if bounds.shape != (2, 2):
+            raise ValueError(f"`bounds` must have shape (2, 2), but got {bounds.shape}")
+    
+    if not (isinstance(zoom, (int, float)) and zoom > 0):
+        raise ValueError(f"`zoom` must be greater than zero, but got {zoom}")
+    
+    # Evaluate the grid (or reuse a cached one) and make contourplot
+    x, y, Z = evaluate_grid(function, bounds=bounds, zoom=zoom, resolution=resolution, cache_dir=cache_dir)
     
     fig = go.Figure(
         data=go.Contour(
@@ -101,7 +212,7 @@ def contourplot(function, title=None, bounds=None,zoom=1.0,figsize=(600,600)):
 
 
 
-def surfaceplot(function,title='',bounds=None,zoom=1.0,figsize=(600,600)):
+def surfaceplot(function,title='',bounds=None,zoom=1.0,figsize=(600,600),resolution=100,cache_dir=None):
     """
     Plots the surface of a 2D benchmark function.
     
@@ -111,6 +222,8 @@ def surfaceplot(function,title='',bounds=None,zoom=1.0,figsize=(600,600)):
         bounds (numpy.ndarray, optional) : Custom bounds for the plot (different from the default ones). Defaults to None (uses the default bounds).
         zoom (float, optional)           : Zoom factor for the plot. Defaults to 1.0 (no zoom).
         figsize (tuple,optional)         : Size of the figure. Defaults to (600, 600).
+        resolution (int, optional)       : Number of grid points along each axis. Defaults to 100.
+        cache_dir (str, optional)        : Directory where the evaluated grid is also cached on disk (see `evaluate_grid`). Defaults to None.
     
     Returns:
         plotly.graph_objects.Figure: A Plotly figure containing the surface plot of the function.
@@ -120,6 +233,7 @@ def surfaceplot(function,title='',bounds=None,zoom=1.0,figsize=(600,600)):
         TypeError     : If `bounds` is not a NumPy array (when bounds is provided).
         ValueError    : If `bounds` does not have shape (2, 2) (when `bounds` is provided).
         ValueError    : If `zoom` is not greater than zero.
+        ValueError    : If `resolution` is not an integer greater than 1.
     """
     # Input checks
     if not isinstance(function, BenchmarkFunction):
@@ -134,35 +248,8 @@ def surfaceplot(function,title='',bounds=None,zoom=1.0,figsize=(600,600)):
     if not (isinstance(zoom, (int, float)) and zoom > 0):
         raise ValueError(f"`zoom` must be greater than zero, but got {zoom}")
     
-    # Determine the bounds (use predefined ones if no custom bounds are provided)
-    if bounds is not None:
-        x_bounds = (bounds[0, 0], bounds[0, 1])
-        y_bounds = (bounds[1, 0], bounds[1, 1])
-    else:
-        x_bounds = (function.bounds[0, 0], function.bounds[0, 1])
-        y_bounds = (function.bounds[1, 0], function.bounds[1, 1])
-
-    # Apply zoom factor
-    x_range = x_bounds[1] - x_bounds[0]
-    y_range = y_bounds[1] - y_bounds[0]
-    x_center = (x_bounds[0] + x_bounds[1]) / 2
-    y_center = (y_bounds[0] + y_bounds[1]) / 2
-
-    x_bounds = (
-        x_center - (x_range / 2) * zoom,
-        x_center + (x_range / 2) * zoom
-    )
-    y_bounds = (
-        y_center - (y_range / 2) * zoom,
-        y_center + (y_range / 2) * zoom
-    )
-    
-    # Generate grid and make surfaceplot 
-    x = np.linspace(x_bounds[0], x_bounds[1], 100)
-    y = np.linspace(y_bounds[0], y_bounds[1], 100)
-    X, Y = np.meshgrid(x, y)
-    points = np.c_[X.ravel(), Y.ravel()]  
-    Z = np.array([function.evaluate(p) for p in points]).reshape(X.shape)
+    # Evaluate the grid (or reuse a cached one) and make surfaceplot
+    x, y, Z = evaluate_grid(function, bounds=bounds, zoom=zoom, resolution=resolution, cache_dir=cache_dir)
     
     fig = go.Figure(data=[go.Surface(z=Z, x=x, y=y, colorscale='Oranges')])
     
@@ -180,7 +267,8 @@ def surfaceplot(function,title='',bounds=None,zoom=1.0,figsize=(600,600)):
     return fig
     
     
-def contourplot_bees(function,bee_colony,optimal_solution=None,title='',bounds=None,zoom=1.0,bee_marker_size=None,figsize=(600,600)):
+def contourplot_bees(function,bee_colony,optimal_solution=None,title='',bounds=None,zoom=1.0,bee_marker_size=None,figsize=(600,600),resolution=100,cache_dir=None,
+                     mode='images',color_by_fitness=False):
     """
     Create a contour plot with bee markers and an optional optimal solution point.
 
@@ -191,8 +279,14 @@ def contourplot_bees(function,bee_colony,optimal_solution=None,title='',bounds=N
         title (str)                             : Title of the plot. Defaults to empty string.
         bounds (numpy.ndarray, optional)        : Custom bounds for the plot (different from the default ones). Defaults to None (uses the default bounds).
         zoom (float, optional)                  : Zoom factor for the plot. Defaults to 1.0 (no zoom).
-        bee_marker_size (int or float, optional): Size of the bee markers. Defaults to None.
+        bee_marker_size (int or float, optional): Size of the bee markers (in data units with `mode='images'`, in pixels otherwise).
+                                                  Defaults to None (5% of the search space, or 10 pixels).
         figsize (tuple)                         : Size of the figure. Defaults to (600, 600).
+        resolution (int, optional)              : Number of grid points along each axis of the contours. Defaults to 100.
+        cache_dir (str, optional)               : Directory where the evaluated grid is also cached on disk (see `evaluate_grid`). Defaults to None.
+        mode (str, optional)                    : How bees are drawn. Must be one among 'images' (one bee image per bee), 'scatter' and 'scattergl'
+                                                  (the whole colony as a single marker trace, much faster for large colonies). Defaults to 'images'.
+        color_by_fitness (bool, optional)       : Whether to color the bees by their fitness (only with 'scatter' and 'scattergl'). Defaults to False.
         
     Returns:
         plotly.graph_objects.Figure: A Plotly figure containing the contour plot with bee markers and, optionally, the optimal solution marker.
@@ -201,6 +295,9 @@ def contourplot_bees(function,bee_colony,optimal_solution=None,title='',bounds=N
         TypeError     : If `bee_colony` is not a list
         ValueError    : If `bee_colony` is empty
         TypeError     : If elements of `bee_colony` are not `Bee` objects.
+        ValueError    : If `mode` is not one among 'images', 'scatter' and 'scattergl'.
+        TypeError     : If `color_by_fitness` is not a boolean.
+        ValueError    : If `color_by_fitness` is True with `mode='images'`.
         TypeError     : If `optimal_solution` is not a NumPy array (when `optimal_solution` is provided).
         ValueError    : If `optimal_solution` is not a 2D point (when `optimal_solution` is provided).
     """
@@ -211,20 +308,26 @@ def contourplot_bees(function,bee_colony,optimal_solution=None,title='',bounds=N
         raise ValueError("Bee colony cannot be empty!")
     if not isinstance(bee_colony[0], Bee):
         raise TypeError("Elements of `bee_colony` must be Bee objects.")
+    valid_modes_ = ['images','scatter','scattergl']
+    if mode not in valid_modes_:
+        raise ValueError(f"{mode} is an invalid mode. Choose one among {', '.join(valid_modes_)}.")
+    if not isinstance(color_by_fitness, bool):
+        raise TypeError("`color_by_fitness` must be bool")
+    if color_by_fitness and (mode == 'images'):
+        raise ValueError("`color_by_fitness` requires `mode='scatter'` or `mode='scattergl'`.")
     
-    fig = contourplot(function,title,bounds=bounds,zoom=zoom,figsize=figsize)
+    fig = contourplot(function,title,bounds=bounds,zoom=zoom,figsize=figsize,resolution=resolution,cache_dir=cache_dir)
     
-    # Bee marker settings
-    bee_marker_path = get_marker_path()
-    bee_marker = Image.open(bee_marker_path)
-    if bee_marker_size is None:
-        x_range = np.abs(function.bounds[0,1]-function.bounds[0,0])
-        y_range = np.abs(function.bounds[1,1]-function.bounds[1,0])
-        bee_marker_size = min(x_range,y_range) * 0.05
-    
-    # Add bees
-    for bee in bee_colony:
-        fig.add_layout_image(
+    if mode == 'images':
+        # Bee marker settings
+        if bee_marker_size is None:
+            x_range = np.abs(function.bounds[0,1]-function.bounds[0,0])
+            y_range = np.abs(function.bounds[1,1]-function.bounds[1,0])
+            bee_marker_size = min(x_range,y_range) * 0.05
+        
+        # Add bees (all the images at once)
+        bee_marker = bee_marker_()
+        fig.update_layout(images=[
                     dict(
                         source=bee_marker,
                         xref="x",
@@ -237,8 +340,12 @@ def contourplot_bees(function,bee_colony,optimal_solution=None,title='',bounds=N
                         sizey=bee_marker_size,
                         sizing="contain",
                         opacity=1
-                    )
-                )
+                    ) for bee in bee_colony
+                ])
+    else:
+        # Add bees (as a single trace)
+        fig.add_trace(bees_trace_(bee_colony, mode, color_by_fitness, bee_marker_size))
+    
     # Add optimal solution (if specified)
     if optimal_solution is not None:
         if not isinstance(optimal_solution,np.ndarray):
@@ -254,4 +361,297 @@ def contourplot_bees(function,bee_colony,optimal_solution=None,title='',bounds=N
             name='Optimal Solution')
         )
     
-    return fig
\ No newline at end of file
+    return fig
+
+
+
+#++++++++++++++++++++++++++++++++++++
+# Animations
+#++++++++++++++++++++++++++++++++++++
+
+def animate_colony(abc,function,title='',optimal_solution=None,bounds=None,zoom=1.0,figsize=(600,600),resolution=100,cache_dir=None,
+                   max_frames=50,frame_duration=200,mode='scatter',color_by_fitness=False,bee_marker_size=None):
+    """
+    Animates the recorded colonies of an optimization as a single Plotly figure with frames (played in the browser, without rasterization).
+    The contours are drawn once: each frame only updates the bees and the title.
+
+    Args:
+        abc (ArtificialBeeColony)               : An optimized colony, whose history recorded the colony (`history='full'` or an integer).
+        function (BenchmarkFunction)            : The 2D benchmark function optimized by `abc`.
+        title (str, optional)                   : Title of the plot, followed by the iteration of each frame. Defaults to empty string.
+        optimal_solution (numpy.ndarray)        : The optimal solution point. Defaults to None.
+        bounds (numpy.ndarray, optional)        : Custom bounds for the plot (different from the default ones). Defaults to None (uses the default bounds).
+        zoom (float, optional)                  : Zoom factor for the plot. Defaults to 1.0 (no zoom).
+        figsize (tuple, optional)               : Size of the figure. Defaults to (600, 600).
+        resolution (int, optional)              : Number of grid points along each axis of the contours. Defaults to 100.
+        cache_dir (str, optional)               : Directory where the evaluated grid is also cached on disk (see `evaluate_grid`). Defaults to None.
+        max_frames (int, optional)              : Maximum number of frames, evenly spaced among the recorded colonies (the first and last ones included). Defaults to 50.
+        frame_duration (int, optional)          : Duration of each frame, in milliseconds. Defaults to 200.
+        mode (str, optional)                    : How bees are drawn. Must be one among 'scatter' and 'scattergl'. Defaults to 'scatter'.
+        color_by_fitness (bool, optional)       : Whether to color the bees by their fitness. Defaults to False.
+        bee_marker_size (int or float, optional): Size of the bee markers, in pixels. Defaults to None (10 pixels).
+
+    Returns:
+        plotly.graph_objects.Figure: A Plotly figure with one frame per selected colony, a play button and a slider.
+
+    Raises:
+        TypeError     : If `abc` is not an `ArtificialBeeColony` object.
+        ValueError    : If the history of `abc` did not record the colony.
+        ValueError    : If `max_frames` or `frame_duration` are not positive integers.
+        ValueError    : If `mode` is not one among 'scatter' and 'scattergl'.
+        ValueError    : If any of the remaining arguments is invalid (see `contourplot_bees`).
+    """
+    # Input checks
+    valid_modes_ = ['scatter','scattergl']
+    if mode not in valid_modes_:
+        raise ValueError(f"{mode} is an invalid mode. Choose one among {', '.join(valid_modes_)}.")
+    if not (isinstance(frame_duration, int) and frame_duration > 0):
+        raise ValueError(f"`frame_duration` must be a positive integer, but got {frame_duration}")
+    frames = animation_frames_(abc, function, title, max_frames)
+    
+    # First frame (contours, bees and optimal solution)
+    fig = contourplot_bees(function, frames[0]['bee_colony'], optimal_solution=optimal_solution, title=frames[0]['title'], bounds=bounds, zoom=zoom,
+                           bee_marker_size=bee_marker_size, figsize=figsize, resolution=resolution, cache_dir=cache_dir,
+                           mode=mode, color_by_fitness=color_by_fitness)
+    bees_trace = 1
+    
+    # Other frames (bees and title only)
+    fig.frames = [go.Frame(data=[bees_trace_(frame['bee_colony'], mode, color_by_fitness, bee_marker_size)],
+                           traces=[bees_trace],
+                           layout=dict(title=frame['title']),
+                           name=str(frame['iteration'])) for frame in frames]
+    
+    play_args  = dict(frame=dict(duration=frame_duration, redraw=True), transition=dict(duration=0), fromcurrent=True)
+    pause_args = dict(frame=dict(duration=0, redraw=False), mode='immediate', transition=dict(duration=0))
+    fig.update_layout(
+        updatemenus=[dict(
+            type='buttons',
+            direction='left',
+            x=0.0, y=-0.1, xanchor='left', yanchor='top',
+            buttons=[dict(label='Play', method='animate', args=[None, play_args]),
+                     dict(label='Pause', method='animate', args=[[None], pause_args])]
+        )],
+        sliders=[dict(
+            x=0.15, y=-0.1, len=0.85, xanchor='left', yanchor='top',
+            currentvalue=dict(prefix='Iteration: '),
+            steps=[dict(label=str(frame['iteration']), method='animate', args=[[str(frame['iteration'])], pause_args]) for frame in frames]
+        )]
+    )
+    
+    return fig
+
+
+def write_animation(abc,function,path,title='',optimal_solution=None,bounds=None,zoom=1.0,figsize=(600,600),resolution=100,cache_dir=None,
+                    max_frames=50,frame_duration=200,mode='images',color_by_fitness=False,bee_marker_size=None,scale=1,loop=0,n_jobs=None):
+    """
+    Renders the recorded colonies of an optimization as an animated GIF or MP4 file.
+    Frames are rendered (by `contourplot_bees`) in a pool of processes and streamed into the encoder, hence at most a few of them are in memory at once.
+
+    Args:
+        abc (ArtificialBeeColony)               : An optimized colony, whose history recorded the colony (`history='full'` or an integer).
+        function (BenchmarkFunction)            : The 2D benchmark function optimized by `abc` (it must be picklable to use `n_jobs`).
+        path (str)                              : The path of the animation. Its extension must be '.gif' or '.mp4' (which requires `ffmpeg`).
+        title (str, optional)                   : Title of the plot, followed by the iteration of each frame. Defaults to empty string.
+        optimal_solution (numpy.ndarray)        : The optimal solution point. Defaults to None.
+        bounds (numpy.ndarray, optional)        : Custom bounds for the plot (different from the default ones). Defaults to None (uses the default bounds).
+        zoom (float, optional)                  : Zoom factor for the plot. Defaults to 1.0 (no zoom).
+        figsize (tuple, optional)               : Size of the figure. Defaults to (600, 600).
+        resolution (int, optional)              : Number of grid points along each axis of the contours. Defaults to 100.
+        cache_dir (str, optional)               : Directory where the evaluated grid is also cached on disk (see `evaluate_grid`), and shared by the workers. Defaults to None.
+        max_frames (int, optional)              : Maximum number of frames, evenly spaced among the recorded colonies (the first and last ones included). Defaults to 50.
+        frame_duration (int, optional)          : Duration of each frame, in milliseconds. Defaults to 200.
+        mode (str, optional)                    : How bees are drawn (see `contourplot_bees`). Defaults to 'images'.
+        color_by_fitness (bool, optional)       : Whether to color the bees by their fitness (see `contourplot_bees`). Defaults to False.
+        bee_marker_size (int or float, optional): Size of the bee markers (see `contourplot_bees`). Defaults to None.
+        scale (int or float, optional)          : Scale factor of the rendered frames. Defaults to 1.
+        loop (int, optional)                    : Number of times a GIF loops (0 loops forever). Defaults to 0.
+        n_jobs (int, optional)                  : Number of worker processes rendering the frames (-1 to use all the cores). Defaults to None (frames are rendered serially).
+
+    Raises:
+        ValueError    : If the extension of `path` is not '.gif' nor '.mp4'.
+        ValueError    : If `n_jobs` is not a positive integer or -1.
+        ValueError    : If `frame_duration` is not a positive integer.
+        RuntimeError  : If `ffmpeg` is not available (for '.mp4' animations).
+        ValueError    : If any of the remaining arguments is invalid (see `animate_colony` and `contourplot_bees`).
+        
+    .. note::
+            Static image export relies on kaleido: each worker starts its own kaleido instance once and reuses it for all its frames.
+            The animation is streamed into a temporary file next to `path`, which replaces `path` only once all the frames are written
+            (an interrupted or failed export leaves no truncated file behind).
+    """
+    # Input checks
+    extension = os.path.splitext(os.fspath(path))[1].lower()
+    if extension not in ['.gif','.mp4']:
+        raise ValueError(f"The extension of `path` must be '.gif' or '.mp4', but got '{extension}'")
+    if n_jobs is not None:
+        if not (isinstance(n_jobs,int) and ((n_jobs >= 1) or (n_jobs == -1))):
+            raise ValueError(f"`n_jobs` must be a positive integer or -1, but got {n_jobs}")
+    if not (isinstance(frame_duration, int) and frame_duration > 0):
+        raise ValueError(f"`frame_duration` must be a positive integer, but got {frame_duration}")
+    
+    frames  = animation_frames_(abc, function, title, max_frames)
+    options = dict(optimal_solution=optimal_solution, bounds=bounds, zoom=zoom, bee_marker_size=bee_marker_size, figsize=figsize,
+                   resolution=resolution, cache_dir=cache_dir, mode=mode, color_by_fitness=color_by_fitness)
+    
+    if extension == '.gif':
+        writer = GifWriter_(path, frame_duration=frame_duration, loop=loop)
+    else:
+        writer = FFmpegWriter_(path, frame_duration=frame_duration)
+    
+    n_workers = (os.cpu_count() if n_jobs == -1 else n_jobs)
+    try:
+        # Renders the first frame in the current process, validating the options (and filling the grid cache shared by the workers)
+        writer.append(render_frame_(function, frames[0], options, scale))
+        if (n_workers is None) or (n_workers == 1):
+            for frame in frames[1:]:
+                writer.append(render_frame_(function, frame, options, scale))
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers, initializer=start_renderer_) as executor:
+                # Sliding window of pending frames: rendered concurrently, written in order
+                pending = deque()
+                for frame in frames[1:]:
+                    pending.append(executor.submit(render_frame_, function, frame, options, scale))
+                    if len(pending) >= 2*n_workers:
+                        writer.append(pending.popleft().result())
+                while pending:
+                    writer.append(pending.popleft().result())
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
+
+#--------------------------------------------------------------------------------
+
+def animation_frames_(abc,function,title,max_frames):
+    """
+    Selects the recorded colonies to animate.
+
+    Returns:
+        list[dict]: The iteration, title and colony (list of Bee) of each frame.
+    """
+    if not isinstance(abc, ArtificialBeeColony):
+        raise TypeError("`abc` must be an `ArtificialBeeColony` object.")
+    if (abc.history is None) or (abc.history.n_snapshots == 0):
+        raise ValueError("The history of `abc` did not record the colony: optimize it with `history='full'` (or an integer).")
+    if not (isinstance(max_frames, int) and max_frames > 0):
+        raise ValueError(f"`max_frames` must be a positive integer, but got {max_frames}")
+    
+    n_snapshots  = abc.history.n_snapshots
+    snapshot_idx = np.unique(np.linspace(0, n_snapshots-1, min(n_snapshots, max_frames)).round().astype(int))
+    colonies     = abc.history.colony_bees(function=function.fun, bounds=function.bounds)
+    iterations   = abc.history.iterations
+    return [{'iteration'  : int(iterations[idx]),
+             'title'      : f"{title} [Iteration {int(iterations[idx])} / {abc.actual_iters}]",
+             'bee_colony' : colonies[idx]} for idx in snapshot_idx]
+
+#--------------------------------------------------------------------------------
+
+def start_renderer_():
+    """
+    Starts a persistent kaleido instance in the current (worker) process, reused by all its static image exports.
+    Older kaleido versions keep a persistent instance by themselves.
+    """
+    try:
+        import kaleido
+        kaleido.start_sync_server(silence_warnings=True)
+    except (ImportError, AttributeError):
+        pass
+
+#--------------------------------------------------------------------------------
+
+def render_frame_(function,frame,options,scale):
+    """
+    Renders a frame of an animation as PNG bytes.
+    """
+    fig = contourplot_bees(function, frame['bee_colony'], title=frame['title'], **options)
+    return fig.to_image(format='png', width=options['figsize'][0], height=options['figsize'][1], scale=scale)
+
+#--------------------------------------------------------------------------------
+
+def temporary_path_(path):
+    """
+    Creates an empty temporary file in the directory of `path` (with the same extension), to be moved to `path` with `os.replace`.
+    """
+    root,extension = os.path.splitext(os.path.abspath(os.fspath(path)))
+    fd,temporary_path = tempfile.mkstemp(prefix=f'{os.path.basename(root)}.', suffix=f'.tmp{extension}', dir=os.path.dirname(root))
+    os.close(fd)
+    return temporary_path
+
+#--------------------------------------------------------------------------------
+
+class GifWriter_():
+    """
+    Writes an animated GIF one frame at a time (each frame with its own color table), without keeping the previous frames in memory.
+    Frames are written to a temporary file, which replaces `path` on `close` and is deleted on `abort`.
+    """
+    #--------------------------------------------------------------------------------
+    def __init__(self,path,frame_duration,loop):
+        self.path           = os.fspath(path)
+        self.temporary_path = temporary_path_(path)
+        self.file           = open(self.temporary_path, 'wb')
+        self.frame_duration = frame_duration
+        self.loop           = loop
+        self.n_frames       = 0
+    #--------------------------------------------------------------------------------
+    def append(self,png_bytes):
+        frame = Image.open(io.BytesIO(png_bytes)).convert('RGB').quantize(colors=256)
+        if self.n_frames == 0:
+            header,_ = GifImagePlugin.getheader(frame, info={'loop': self.loop, 'duration': self.frame_duration})
+            self.file.write(b''.join(header))
+        self.file.write(b''.join(GifImagePlugin.getdata(frame, duration=self.frame_duration, include_color_table=True)))
+        self.n_frames += 1
+    #--------------------------------------------------------------------------------
+    def close(self):
+        try:
+            self.file.write(b';')
+            self.file.close()
+        except BaseException:
+            self.abort()
+            raise
+        os.replace(self.temporary_path, self.path)
+    #--------------------------------------------------------------------------------
+    def abort(self):
+        self.file.close()
+        os.remove(self.temporary_path)
+    #--------------------------------------------------------------------------------
+
+class FFmpegWriter_():
+    """
+    Writes an MP4 video by piping PNG frames into an `ffmpeg` process.
+    The video is encoded into a temporary file, which replaces `path` on `close` and is deleted on `abort`.
+    """
+    #--------------------------------------------------------------------------------
+    def __init__(self,path,frame_duration):
+        ffmpeg = shutil.which('ffmpeg')
+        if ffmpeg is None:
+            raise RuntimeError("Writing MP4 animations requires `ffmpeg`, which was not found on the PATH.")
+        self.path           = os.fspath(path)
+        self.temporary_path = temporary_path_(path)
+        self.process = subprocess.Popen([ffmpeg, '-y', '-loglevel', 'error',
+                                         '-f', 'image2pipe', '-framerate', f"{1000/frame_duration:g}", '-i', '-',
+                                         '-c:v', 'libx264', '-pix_fmt', 'yuv420p', '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2',
+                                         self.temporary_path],
+                                        stdin=subprocess.PIPE)
+    #--------------------------------------------------------------------------------
+    def append(self,png_bytes):
+        self.process.stdin.write(png_bytes)
+    #--------------------------------------------------------------------------------
+    def close(self):
+        try:
+            self.process.stdin.close()
+        except BrokenPipeError:
+            pass    # ffmpeg exited early: the failure is reported by its exit code
+        if self.process.wait() != 0:
+            os.remove(self.temporary_path)
+            raise RuntimeError(f"`ffmpeg` failed with exit code {self.process.returncode}")
+        os.replace(self.temporary_path, self.path)
+    #--------------------------------------------------------------------------------
+    def abort(self):
+        self.process.kill()
+        try:
+            self.process.stdin.close()
+        except BrokenPipeError:
+            pass
+        self.process.wait()
+        os.remove(self.temporary_path)
+    #--------------------------------------------------------------------------------
@@ -0,0 +1,213 @@
+#++++++++++++++++++++++++++++++++++++
+# Libraries and modules
+#++++++++++++++++++++++++++++++++++++
+
+import numpy as np
+import os
+import time
+import inspect
+from concurrent.futures import ProcessPoolExecutor,as_completed
+from .abc import ArtificialBeeColony
+from .utils import get_progress_bar,records_to_dataframe
+
+#++++++++++++++++++++++++++++++++++++
+# Multi-run API
+#++++++++++++++++++++++++++++++++++++
+
+# Parameters of `ArtificialBeeColony.__init__` (all the other entries of a config are passed to `optimize`)
+COLONY_PARAMS_ = [name for name in inspect.signature(ArtificialBeeColony.__init__).parameters if name != 'self']
+
+# Parameters that would be shared by (and hence conflict among) independent runs
+RESERVED_PARAMS_ = ['random_seed','verbose','history_path','checkpoint_every','checkpoint_path','resume','profiler']
+
+#--------------------------------------------------------------------------------
+
+def run_many(config,n_runs=10,n_jobs=None,seeds=None,verbose=False):
+    """
+    Executes independent optimization runs of the same configuration, each one with its own random stream.
+
+    Args:
+        config (dict)                : The parameters of each run, i.e. the arguments of `ArtificialBeeColony` (`colony_size`, `function`, `bounds`, ...)
+                                       together with the arguments of `ArtificialBeeColony.optimize` (`max_iters`, `mutation`, ...).
+                                       The history defaults to 'best' (only the optimal bee is recorded).
+        n_runs (int, optional)       : The number of runs. Defaults to 10.
+        n_jobs (int, optional)       : The number of worker processes (-1 to use all the cores). Defaults to None (runs are executed serially).
+        seeds (optional)             : Either the seed from which the independent streams of the runs are spawned (an integer or a `np.random.SeedSequence`),
+                                       or a list with one seed per run. Defaults to None (fresh entropy).
+        verbose (bool, optional)     : Whether to display the progress of the runs. Defaults to False.
+
+    Returns:
+        MultiRunResults: The best values, convergence curves and evaluation counts of the runs.
+
+    Raises:
+        TypeError  : If `config` is not a dictionary, or if it lacks the `ArtificialBeeColony` arguments.
+        ValueError : If `config` contains a parameter that cannot be shared by independent runs (e.g. `random_seed` or `history_path`).
+        ValueError : If `n_runs` is not a positive integer.
+        ValueError : If `n_jobs` is not a positive integer or -1.
+        ValueError : If `seeds` is a list whose length differs from `n_runs`.
+        TypeError  : If `verbose` is not a boolean.
+
+    .. note::
+            With `n_jobs`, `function` must be picklable (e.g. defined at module level). Results do not depend on `n_jobs` for given `seeds`.
+
+    Examples:
+        >>> config  = {'colony_size': 50, 'function': Sphere10d.fun, 'bounds': Sphere10d.bounds, 'max_iters': 500, 'mutation': 'ModifiedABC'}
+        >>> results = run_many(config,n_runs=15,n_jobs=-1,seeds=1234)
+        >>> results.summary()
+        {'mean': ..., 'std': ..., 'median': ..., 'best': ..., 'worst': ...}
+    """
+
+    if not isinstance(config,dict):
+        raise TypeError("`config` must be a dictionary.")
+    reserved_params = [param for param in RESERVED_PARAMS_ if param in config]
+    if len(reserved_params) > 0:
+        raise ValueError(f"`config` cannot contain {', '.join(reserved_params)}: each run is seeded and executed independently.")
+
+    if not (isinstance(n_runs,int) and (n_runs >= 1)):
+        raise ValueError(f"`n_runs` must be a positive integer, but got {n_runs}")
+
+    if n_jobs is not None:
+        if not (isinstance(n_jobs,int) and ((n_jobs >= 1) or (n_jobs == -1))):
+            raise ValueError(f"`n_jobs` must be a positive integer or -1, but got {n_jobs}")
+
+    if not isinstance(verbose,bool):
+        raise TypeError("`verbose` must be bool")
+
+    if isinstance(seeds,(list,tuple)):
+        if len(seeds) != n_runs:
+            raise ValueError(f"`seeds` must provide one seed per run ({n_runs}), but got {len(seeds)}")
+    else:
+        seeds = np.random.SeedSequence(seeds).spawn(n_runs)
+
+    colony_config   = {param: value for param,value in config.items() if param in COLONY_PARAMS_}
+    optimize_config = {'history': 'best', **{param: value for param,value in config.items() if param not in COLONY_PARAMS_}}
+    # Builds (and discards) a colony to validate the config before dispatching the runs
+    ArtificialBeeColony(**colony_config)
+
+    n_workers = (os.cpu_count() if n_jobs == -1 else n_jobs)
+    runs      = [None]*n_runs
+    progress_bar = get_progress_bar(total=n_runs,desc='Running Simulations',disable= not verbose)
+    try:
+        if (n_workers is None) or (n_workers == 1):
+            for run_idx,seed in enumerate(seeds):
+                runs[run_idx] = run_once_(colony_config,optimize_config,seed)
+                progress_bar.update(1)
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                futures = {executor.submit(run_once_,colony_config,optimize_config,seed): run_idx for run_idx,seed in enumerate(seeds)}
+                for future in as_completed(futures):
+                    runs[futures[future]] = future.result()
+                    progress_bar.update(1)
+    finally:
+        progress_bar.close()
+
+    return MultiRunResults(runs,max_iters=optimize_config.get('max_iters',1000))
+
+#--------------------------------------------------------------------------------
+
+def run_once_(colony_config,optimize_config,seed):
+    """
+    Executes a single optimization run.
+
+    Args:
+        colony_config (dict)   : The arguments of `ArtificialBeeColony`.
+        optimize_config (dict) : The arguments of `ArtificialBeeColony.optimize`.
+        seed                   : The seed of the run.
+
+    Returns:
+        dict: The outcome of the run (only arrays and scalars, to keep inter-process transfers small).
+    """
+    start = time.perf_counter()
+    abc   = ArtificialBeeColony(**colony_config)
+    abc.optimize(**optimize_config,random_seed=seed)
+    return {'best_value'    : abc.optimal_bee.value,
+            'best_position' : abc.optimal_bee.position.copy(),
+            'n_evaluations' : abc.n_evaluations,
+            'n_iters'       : abc.actual_iters,
+            'stagnated'     : abc.stagnated,
+            'elapsed'       : time.perf_counter() - start,
+            'convergence'   : abc.history.best_values.copy() if abc.history.n_records > 0 else np.full(1,abc.optimal_bee.value)}
+
+#++++++++++++++++++++++++++++++++++++
+# MultiRunResults class
+#++++++++++++++++++++++++++++++++++++
+
+class MultiRunResults():
+    """
+    Results of independent optimization runs (see `run_many`), stored as columns with one entry per run.
+
+    Attributes:
+        n_runs (int)                  : The number of runs.
+        best_values (numpy-array)     : The objective value of the optimal bee of each run, with shape `(n_runs,)`.
+        best_positions (numpy-array)  : The position of the optimal bee of each run, with shape `(n_runs,D)`.
+        n_evaluations (numpy-array)   : The number of objective function evaluations of each run, with shape `(n_runs,)`.
+        n_iters (numpy-array)         : The number of iterations of each run, with shape `(n_runs,)`.
+        stagnated (numpy-array)       : Whether each run terminated early because of stagnation, with shape `(n_runs,)`.
+        elapsed (numpy-array)         : The wall-clock time of each run (in seconds), with shape `(n_runs,)`.
+        convergence (numpy-array)     : The objective value of the optimal bee at each iteration of each run, with shape `(n_runs,max_iters+1)`.
+                                        Runs that terminated early are padded with their final value.
+    """
+    #--------------------------------------------------------------------------------
+    def __init__(self,runs,max_iters):
+        """
+        Collects the outcomes of the runs into columns.
+
+        Args:
+            runs (list[dict]) : The outcomes of the runs.
+            max_iters (int)   : The maximum number of iterations of the runs.
+        """
+        self.n_runs         = len(runs)
+        self.best_values    = np.array([run['best_value'] for run in runs],dtype=float)
+        self.best_positions = np.vstack([run['best_position'] for run in runs])
+        self.n_evaluations  = np.array([run['n_evaluations'] for run in runs],dtype=int)
+        self.n_iters        = np.array([run['n_iters'] for run in runs],dtype=int)
+        self.stagnated      = np.array([run['stagnated'] for run in runs],dtype=bool)
+        self.elapsed        = np.array([run['elapsed'] for run in runs],dtype=float)
+        self.convergence    = np.empty((self.n_runs,max_iters+1))
+        for run_idx,run in enumerate(runs):
+            curve = run['convergence']
+            self.convergence[run_idx,:len(curve)] = curve
+            self.convergence[run_idx,len(curve):] = curve[-1]
+    #--------------------------------------------------------------------------------
+    def __len__(self):
+        return self.n_runs
+    #--------------------------------------------------------------------------------
+    def summary(self):
+        """
+        Computes aggregate statistics of the best values of the runs.
+
+        Returns:
+            dict: The mean, standard deviation, median, best (minimum) and worst (maximum) of the best values.
+        """
+        return {'mean'   : np.mean(self.best_values),
+                'std'    : np.std(self.best_values),
+                'median' : np.median(self.best_values),
+                'best'   : np.min(self.best_values),
+                'worst'  : np.max(self.best_values)}
+    #--------------------------------------------------------------------------------
+    def records(self):
+        """
+        Builds the tidy table of the runs, with one row per run.
+
+        Returns:
+            list[dict]: The run index, best value, number of evaluations, number of iterations, stagnation flag and elapsed time of each run.
+        """
+        return [{'run'           : run_idx,
+                 'best_value'    : float(self.best_values[run_idx]),
+                 'n_evaluations' : int(self.n_evaluations[run_idx]),
+                 'n_iters'       : int(self.n_iters[run_idx]),
+                 'stagnated'     : bool(self.stagnated[run_idx]),
+                 'elapsed'       : float(self.elapsed[run_idx])} for run_idx in range(self.n_runs)]
+    #--------------------------------------------------------------------------------
+    def to_dataframe(self):
+        """
+        Builds the tidy table of the runs as a pandas DataFrame (pandas is only required by this method).
+
+        Returns:
+            pandas.DataFrame: The table of the runs (see `records`).
+
+        Raises:
+            ImportError: If pandas is not installed.
+        """
+        return records_to_dataframe(self.records())
+    #--------------------------------------------------------------------------------
@@ -0,0 +1,145 @@
+#++++++++++++++++++++++++++++++++++++
+# Libraries and modules
+#++++++++++++++++++++++++++++++++++++
+
+import numpy as np
+from .utils import records_to_dataframe
+
+#++++++++++++++++++++++++++++++++++++
+# ColonyStats class
+#++++++++++++++++++++++++++++++++++++
+
+# Phases of the optimization, in the order they are executed within an iteration
+PHASES_ = ['initialization','employees','onlookers','scouts']
+
+class ColonyStats():
+    """
+    Records where the wall-clock time of an optimization goes, in preallocated numpy arrays with one row per iteration
+    (row 0 is the initialization, row `i` the `i`-th iteration).
+
+    Attributes:
+        max_iters (int)                          : The maximum number of iterations of the run.
+        initialization_time (numpy-array)        : The time (in seconds) spent by the framework in the initialization (`ask` and `tell`), with shape `(max_iters+1,)`.
+        employees_time (numpy-array)             : The time spent by the framework in the employees phase, with shape `(max_iters+1,)`.
+        onlookers_time (numpy-array)             : The time spent by the framework in the onlookers phase, with shape `(max_iters+1,)`.
+        scouts_time (numpy-array)                : The time spent by the framework in the scouts phase, with shape `(max_iters+1,)`.
+        history_time (numpy-array)               : The time spent recording the colony in the history, with shape `(max_iters+1,)`.
+        evaluation_time (numpy-array)            : The time spent in the objective function, with shape `(max_iters+1,)`.
+        initialization_evaluations (numpy-array) : The number of evaluations of the initialization, with shape `(max_iters+1,)`.
+        employees_evaluations (numpy-array)      : The number of evaluations of the employees phase, with shape `(max_iters+1,)`.
+        onlookers_evaluations (numpy-array)      : The number of evaluations of the onlookers phase, with shape `(max_iters+1,)`.
+        scouts_evaluations (numpy-array)         : The number of evaluations of the scouts phase, with shape `(max_iters+1,)`.
+
+    .. note::
+            Phase times exclude the history (see `history_time`) and the objective function (see `evaluation_time`), so that all
+            the times add up to the duration of the optimization loop. The objective function is only timed by `optimize` and
+            `optimize_async`: with the ask/tell interface, the values are computed by the caller and `evaluation_time` stays zero.
+            As for `ArtificialBeeColony.n_evaluations`, values served by an `EvaluationCache` are not counted as evaluations.
+
+    Examples:
+        >>> abc.optimize(max_iters=500,stats=True)
+        >>> abc.stats.summary()
+        {'initialization': ..., 'employees': ..., 'onlookers': ..., 'scouts': ..., 'history': ..., 'evaluation': ..., 'framework': ..., 'n_evaluations': ...}
+        >>> abc.stats.evaluation_time[1:abc.actual_iters+1]   # objective time of each iteration
+    """
+    #--------------------------------------------------------------------------------
+    def __init__(self,max_iters):
+        """
+        Allocates the arrays for a whole optimization run.
+
+        Args:
+            max_iters (int): The maximum number of iterations of the run.
+        """
+        self.max_iters = max_iters
+        for phase in PHASES_:
+            setattr(self,f'{phase}_time',np.zeros(max_iters+1))
+            setattr(self,f'{phase}_evaluations',np.zeros(max_iters+1,dtype=int))
+        self.history_time    = np.zeros(max_iters+1)
+        self.evaluation_time = np.zeros(max_iters+1)
+        self._excluded       = 0.0
+    #--------------------------------------------------------------------------------
+    def add_phase_(self,phase,row,elapsed,n_evaluations=0):
+        """
+        Accumulates the time spent in a phase, net of the history time recorded in the meantime.
+
+        Args:
+            phase (str)                   : The phase ('initialization', 'employees', 'onlookers' or 'scouts').
+            row (int)                     : The row of the iteration.
+            elapsed (float)               : The wall-clock time of the phase (in seconds), history included.
+            n_evaluations (int, optional) : The number of evaluations of the phase. Defaults to 0.
+        """
+        getattr(self,f'{phase}_time')[row]        += elapsed - self._excluded
+        getattr(self,f'{phase}_evaluations')[row] += n_evaluations
+        self._excluded = 0.0
+    #--------------------------------------------------------------------------------
+    def add_history_(self,row,elapsed):
+        """
+        Accumulates the time spent recording the colony in the history (excluded from the time of the enclosing phase).
+
+        Args:
+            row (int)       : The row of the iteration.
+            elapsed (float) : The wall-clock time of the recording (in seconds).
+        """
+        self.history_time[row] += elapsed
+        self._excluded         += elapsed
+    #--------------------------------------------------------------------------------
+    @property
+    def framework_time(self):
+        """
+        The time spent by the framework (all the phases and the history) at each iteration, with shape `(max_iters+1,)`.
+        """
+        return sum(getattr(self,f'{phase}_time') for phase in PHASES_) + self.history_time
+    #--------------------------------------------------------------------------------
+    @property
+    def n_evaluations(self):
+        """
+        The number of evaluations at each iteration, with shape `(max_iters+1,)`.
+        """
+        return sum(getattr(self,f'{phase}_evaluations') for phase in PHASES_)
+    #--------------------------------------------------------------------------------
+    def summary(self):
+        """
+        Computes the total time of each phase over the whole run.
+
+        Returns:
+            dict: The total time (in seconds) of each phase, of the history, of the objective function and of the framework,
+                  and the total number of evaluations.
+        """
+        return {**{phase: float(np.sum(getattr(self,f'{phase}_time'))) for phase in PHASES_},
+                'history'       : float(np.sum(self.history_time)),
+                'evaluation'    : float(np.sum(self.evaluation_time)),
+                'framework'     : float(np.sum(self.framework_time)),
+                'n_evaluations' : int(np.sum(self.n_evaluations))}
+    #--------------------------------------------------------------------------------
+    def records(self,n_iters=None):
+        """
+        Builds the tidy table of the timings, with one row per iteration.
+
+        Args:
+            n_iters (int, optional): The number of iterations to include. Defaults to None (all the `max_iters` iterations).
+
+        Returns:
+            list[dict]: The iteration, the time of each phase, of the history and of the objective function, and the number of evaluations of each phase.
+        """
+        n_rows = (self.max_iters if n_iters is None else n_iters) + 1
+        return [{'iteration'       : row,
+                 **{f'{phase}_time': float(getattr(self,f'{phase}_time')[row]) for phase in PHASES_},
+                 'history_time'    : float(self.history_time[row]),
+                 'evaluation_time' : float(self.evaluation_time[row]),
+                 **{f'{phase}_evaluations': int(getattr(self,f'{phase}_evaluations')[row]) for phase in PHASES_}} for row in range(n_rows)]
+    #--------------------------------------------------------------------------------
+    def to_dataframe(self,n_iters=None):
+        """
+        Builds the tidy table of the timings as a pandas DataFrame (pandas is only required by this method).
+
+        Args:
+            n_iters (int, optional): The number of iterations to include. Defaults to None (all the `max_iters` iterations).
+
+        Returns:
+            pandas.DataFrame: The table of the timings (see `records`).
+
+        Raises:
+            ImportError: If pandas is not installed.
+        """
+        return records_to_dataframe(self.records(n_iters))
+    #--------------------------------------------------------------------------------
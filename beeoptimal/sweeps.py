@@ -0,0 +1,324 @@
+#++++++++++++++++++++++++++++++++++++
+# Libraries and modules
+#++++++++++++++++++++++++++++++++++++
+
+import numpy as np
+import os
+import json
+import sqlite3
+import itertools
+from concurrent.futures import ProcessPoolExecutor,as_completed
+from .abc import ArtificialBeeColony
+from .benchmarks import BenchmarkFunction
+from .runs import COLONY_PARAMS_,RESERVED_PARAMS_,run_once_
+from .utils import get_progress_bar,records_to_dataframe
+
+#++++++++++++++++++++++++++++++++++++
+# ResultStore class
+#++++++++++++++++++++++++++++++++++++
+
+class ResultStore():
+    """
+    On-disk store of the runs of a sweep (see `run_sweep`), backed by an SQLite database with one row per finished run.
+
+    Attributes:
+        path (str)        : The path of the SQLite database.
+        entropy (int)     : The entropy from which the random streams of the runs are derived (None until the first sweep).
+        base_config (str) : The canonical JSON encoding of the parameters shared by the runs of the store (None until the first sweep).
+
+    .. note::
+            Each run is committed as soon as it finishes, hence an interrupted sweep only loses the runs in progress.
+            Convergence curves and best positions are stored as raw float64 bytes.
+
+    Examples:
+        >>> store = ResultStore('simulations/report.sqlite')
+        >>> len(store)
+        3600
+        >>> store.to_dataframe().groupby(['benchmark','mutation'])['best_value'].median()
+    """
+    #--------------------------------------------------------------------------------
+    def __init__(self,path):
+        """
+        Opens the store, creating the database if it does not exist.
+
+        Args:
+            path (str or PathLike): The path of the SQLite database.
+        """
+        self.path       = os.fspath(path)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS runs (point         TEXT    NOT NULL,
+                                             point_idx     INTEGER NOT NULL,
+                                             run           INTEGER NOT NULL,
+                                             best_value    REAL,
+                                             n_evaluations INTEGER,
+                                             n_iters       INTEGER,
+                                             stagnated     INTEGER,
+                                             elapsed       REAL,
+                                             best_position BLOB,
+                                             convergence   BLOB,
+                                             PRIMARY KEY (point,run));
+        """)
+        self.connection.commit()
+    #--------------------------------------------------------------------------------
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+    #--------------------------------------------------------------------------------
+    def __enter__(self):
+        return self
+    #--------------------------------------------------------------------------------
+    def __exit__(self,*exc_info):
+        self.close()
+    #--------------------------------------------------------------------------------
+    @property
+    def entropy(self):
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'entropy'").fetchone()
+        return None if row is None else int(row[0])
+    #--------------------------------------------------------------------------------
+    @entropy.setter
+    def entropy(self,entropy):
+        self.connection.execute("INSERT OR REPLACE INTO meta (key,value) VALUES ('entropy',?)",(str(entropy),))
+        self.connection.commit()
+    #--------------------------------------------------------------------------------
+    @property
+    def base_config(self):
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'base_config'").fetchone()
+        return None if row is None else row[0]
+    #--------------------------------------------------------------------------------
+    @base_config.setter
+    def base_config(self,base_config):
+        self.connection.execute("INSERT OR REPLACE INTO meta (key,value) VALUES ('base_config',?)",(base_config,))
+        self.connection.commit()
+    #--------------------------------------------------------------------------------
+    def completed(self):
+        """
+        Lists the completed runs.
+
+        Returns:
+            set[tuple]: The (point, run) keys of the completed runs, where `point` is the JSON encoding of the grid labels.
+        """
+        return set(self.connection.execute("SELECT point,run FROM runs"))
+    #--------------------------------------------------------------------------------
+    def add(self,point,point_idx,run_idx,outcome):
+        """
+        Appends a finished run and commits it.
+
+        Args:
+            point (str)     : The JSON encoding of the grid labels of the run.
+            point_idx (int) : The position of the grid point in the sweep (used to sort the runs).
+            run_idx (int)   : The index of the run within its grid point.
+            outcome (dict)  : The outcome of the run (see `run_many`).
+        """
+        self.connection.execute("INSERT OR REPLACE INTO runs VALUES (?,?,?,?,?,?,?,?,?,?)",
+                                (point,
+                                 point_idx,
+                                 run_idx,
+                                 float(outcome['best_value']),
+                                 int(outcome['n_evaluations']),
+                                 int(outcome['n_iters']),
+                                 int(outcome['stagnated']),
+                                 float(outcome['elapsed']),
+                                 np.asarray(outcome['best_position'],dtype=np.float64).tobytes(),
+                                 np.asarray(outcome['convergence'],dtype=np.float64).tobytes()))
+        self.connection.commit()
+    #--------------------------------------------------------------------------------
+    def records(self,arrays=False):
+        """
+        Builds the tidy table of the stored runs, with one row per run.
+
+        Args:
+            arrays (bool, optional): Whether to include the best positions and convergence curves. Defaults to False.
+
+        Returns:
+            list[dict]: The grid labels, run index, best value, number of evaluations, number of iterations, stagnation flag and elapsed time of each run
+            (sorted by grid point and run index).
+        """
+        records = []
+        for row in self.connection.execute("SELECT * FROM runs ORDER BY point_idx,run"):
+            point,_,run_idx,best_value,n_evaluations,n_iters,stagnated,elapsed,best_position,convergence = row
+            record = {**json.loads(point),
+                      'run'           : run_idx,
+                      'best_value'    : best_value,
+                      'n_evaluations' : n_evaluations,
+                      'n_iters'       : n_iters,
+                      'stagnated'     : bool(stagnated),
+                      'elapsed'       : elapsed}
+            if arrays:
+                record['best_position'] = np.frombuffer(best_position,dtype=np.float64)
+                record['convergence']   = np.frombuffer(convergence,dtype=np.float64)
+            records.append(record)
+        return records
+    #--------------------------------------------------------------------------------
+    def to_dataframe(self,arrays=False):
+        """
+        Builds the tidy table of the stored runs as a pandas DataFrame (pandas is only required by this method).
+
+        Args:
+            arrays (bool, optional): Whether to include the best positions and convergence curves. Defaults to False.
+
+        Returns:
+            pandas.DataFrame: The table of the runs (see `records`).
+
+        Raises:
+            ImportError: If pandas is not installed.
+        """
+        return records_to_dataframe(self.records(arrays=arrays))
+    #--------------------------------------------------------------------------------
+    def close(self):
+        """
+        Closes the connection to the database.
+        """
+        self.connection.close()
+    #--------------------------------------------------------------------------------
+
+#++++++++++++++++++++++++++++++++++++
+# Sweep runner
+#++++++++++++++++++++++++++++++++++++
+
+def run_sweep(grid,n_runs,store,base_config=None,n_jobs=None,random_seed=None,verbose=False):
+    """
+    Runs every combination of the grid parameters `n_runs` times, appending each finished run to a result store.
+    Runs already in the store are skipped, hence an interrupted sweep is resumed by calling `run_sweep` again with the same arguments.
+
+    Args:
+        grid (dict)                   : The swept parameters, mapping each parameter name to its list of values (e.g. `{'mutation': ['StandardABC','ModifiedABC']}`).
+                                        The special parameter 'benchmark' takes `BenchmarkFunction` values, providing both `function` and `bounds`.
+        n_runs (int)                  : The number of independent runs of each grid point.
+        store (ResultStore or str)    : The result store, or the path of its SQLite database.
+        base_config (dict, optional)  : The parameters shared by all the runs (see `run_many`). Defaults to None.
+        n_jobs (int, optional)        : The number of worker processes (-1 to use all the cores). Defaults to None (runs are executed serially).
+        random_seed (int, optional)   : The entropy from which the random stream of each run is derived. Defaults to None
+                                        (the entropy of the store, or fresh entropy for a new store).
+        verbose (bool, optional)      : Whether to display the progress of the sweep. Defaults to False.
+
+    Returns:
+        ResultStore: The result store, including the runs of previous sweeps.
+
+    Raises:
+        TypeError  : If `grid` is not a dictionary of non-empty lists.
+        TypeError  : If a 'benchmark' value is not a `BenchmarkFunction`.
+        ValueError : If `n_runs` is not a positive integer.
+        ValueError : If `n_jobs` is not a positive integer or -1.
+        ValueError : If a parameter cannot be shared by independent runs (e.g. `random_seed` or `history_path`).
+        ValueError : If `random_seed` differs from the entropy the store was created with.
+        ValueError : If `base_config` differs from the one the store was created with.
+        TypeError  : If `verbose` is not a boolean.
+
+    .. note::
+            The stream of each run only depends on the entropy, the position of its grid point and its run index,
+            hence results do not depend on `n_jobs` nor on how many times the sweep was interrupted.
+            With `n_jobs`, only the main process writes to the store.
+
+    Examples:
+        >>> grid  = {'benchmark': [Sphere10d,Ackley10d], 'mutation': ['StandardABC','DirectedABC']}
+        >>> store = run_sweep(grid,n_runs=15,store='sweep.sqlite',base_config={'colony_size': 100, 'max_iters': 1000},n_jobs=-1,random_seed=1234)
+        >>> store.to_dataframe().groupby(['benchmark','mutation'])['best_value'].median()
+    """
+
+    if not (isinstance(grid,dict) and all(isinstance(values,(list,tuple)) and (len(values) > 0) for values in grid.values())):
+        raise TypeError("`grid` must be a dictionary mapping each parameter to a non-empty list of values.")
+    if not all(isinstance(benchmark,BenchmarkFunction) for benchmark in grid.get('benchmark',[])):
+        raise TypeError("The values of 'benchmark' must be `BenchmarkFunction` instances.")
+
+    if not (isinstance(n_runs,int) and (n_runs >= 1)):
+        raise ValueError(f"`n_runs` must be a positive integer, but got {n_runs}")
+
+    if n_jobs is not None:
+        if not (isinstance(n_jobs,int) and ((n_jobs >= 1) or (n_jobs == -1))):
+            raise ValueError(f"`n_jobs` must be a positive integer or -1, but got {n_jobs}")
+
+    if not isinstance(verbose,bool):
+        raise TypeError("`verbose` must be bool")
+
+    base_config     = {} if base_config is None else dict(base_config)
+    reserved_params = [param for param in RESERVED_PARAMS_ if (param in base_config) or (param in grid)]
+    if len(reserved_params) > 0:
+        raise ValueError(f"A sweep cannot set {', '.join(reserved_params)}: each run is seeded and executed independently.")
+
+    if not isinstance(store,ResultStore):
+        store = ResultStore(store)
+    if store.entropy is None:
+        store.entropy = np.random.SeedSequence(random_seed).entropy
+    elif (random_seed is not None) and (random_seed != store.entropy):
+        raise ValueError(f"The store was created with `random_seed={store.entropy}`, but got {random_seed}")
+    # Runs are identified by their grid point only, hence all the runs of a store must share the same base config
+    config_key = json.dumps({param: config_label_(value) for param,value in base_config.items()},sort_keys=True)
+    if store.base_config is None:
+        store.base_config = config_key
+    elif store.base_config != config_key:
+        raise ValueError(f"The store was created with `base_config={store.base_config}`, but got {config_key}: please use a new store.")
+
+    # Pending runs (the grid point index keeps the streams stable across resumed sweeps)
+    completed = store.completed()
+    tasks     = []
+    for point_idx,values in enumerate(itertools.product(*grid.values())):
+        point_params = dict(zip(grid.keys(),values))
+        point        = json.dumps({param: label_(value) for param,value in point_params.items()})
+        config       = {**base_config,**point_params}
+        if 'benchmark' in config:
+            benchmark = config.pop('benchmark')
+            config    = {'function': benchmark.fun, 'bounds': benchmark.bounds, **config}
+        colony_config   = {param: value for param,value in config.items() if param in COLONY_PARAMS_}
+        optimize_config = {'history': 'best', **{param: value for param,value in config.items() if param not in COLONY_PARAMS_}}
+        for run_idx in range(n_runs):
+            if (point,run_idx) not in completed:
+                seed = np.random.SeedSequence(store.entropy,spawn_key=(point_idx,run_idx))
+                tasks.append((point,point_idx,run_idx,colony_config,optimize_config,seed))
+
+    # Builds (and discards) a colony per grid point to validate the configs before dispatching the runs
+    for colony_config in {task[0]: task[3] for task in tasks}.values():
+        ArtificialBeeColony(**colony_config)
+
+    n_workers    = (os.cpu_count() if n_jobs == -1 else n_jobs)
+    progress_bar = get_progress_bar(total=len(tasks),desc='Running Sweep',disable= not verbose)
+    try:
+        if (n_workers is None) or (n_workers == 1):
+            for point,point_idx,run_idx,colony_config,optimize_config,seed in tasks:
+                store.add(point,point_idx,run_idx,run_once_(colony_config,optimize_config,seed))
+                progress_bar.update(1)
+        else:
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                futures = {executor.submit(run_once_,colony_config,optimize_config,seed): (point,point_idx,run_idx)
+                           for point,point_idx,run_idx,colony_config,optimize_config,seed in tasks}
+                try:
+                    for future in as_completed(futures):
+                        store.add(*futures[future],future.result())
+                        progress_bar.update(1)
+                except BaseException:
+                    # Keeps the finished runs and stops dispatching the pending ones
+                    for future in futures:
+                        future.cancel()
+                    raise
+    finally:
+        progress_bar.close()
+
+    return store
+
+#--------------------------------------------------------------------------------
+
+def label_(value):
+    """
+    Builds the JSON-serializable label of a grid value, identifying its runs in the store.
+    """
+    if isinstance(value,BenchmarkFunction):
+        return value.name
+    if callable(value):
+        return getattr(value,'__name__',repr(value))
+    if isinstance(value,np.generic):
+        return value.item()
+    if isinstance(value,(str,int,float,bool)) or (value is None):
+        return value
+    return repr(value)
+
+#--------------------------------------------------------------------------------
+
+def config_label_(value):
+    """
+    Builds the JSON-serializable label of a base config value, where arrays (e.g. `bounds`) are stored in full.
+    """
+    if isinstance(value,np.ndarray):
+        return value.tolist()
+    return label_(value)
+
+#--------------------------------------------------------------------------------
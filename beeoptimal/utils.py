@@ -2,6 +2,8 @@
 # Libraries and modules
 #--------------------------------------------------------------------------------
 import os
+import sys
+import warnings
 
 #--------------------------------------------------------------------------------
 # Utility functions
@@ -25,4 +27,80 @@ def get_marker_path():
     marker_path = os.path.join(base_dir, "./package_assets", "BeeMarker.png")
     if not os.path.exists(marker_path):
         raise FileNotFoundError(f"Marker file not found at: {marker_path}")
-    return marker_path
\ No newline at end of file
+    return marker_path
+
+#--------------------------------------------------------------------------------
+
+# Utility function to create a progress bar (tqdm is an optional dependency)
+def get_progress_bar(total,desc,disable=False,initial=0):
+    """
+    Creates a tqdm progress bar, importing tqdm only when the bar is created. If tqdm is not installed,
+    a silent progress bar is returned instead (with a warning when the bar was meant to be displayed).
+
+    Args:
+        total (int)              : The total number of steps.
+        desc (str)               : The description of the bar.
+        disable (bool, optional) : Whether to hide the bar. Defaults to False.
+        initial (int, optional)  : The initial number of steps. Defaults to 0.
+
+    Returns:
+        tqdm or SilentProgressBar: The progress bar.
+    """
+    try:
+        from tqdm import tqdm
+    except ImportError:
+        if not disable:
+            warnings.warn("Progress bars require tqdm (`pip install beeoptimal[progress]`): progress will not be displayed.",stacklevel=3)
+        return SilentProgressBar(total=total,initial=initial)
+    return tqdm(total=total,desc=desc,initial=initial,disable=disable,bar_format='{l_bar}{bar}|[{elapsed}<{remaining}]')
+
+#--------------------------------------------------------------------------------
+
+# Utility function to build a pandas DataFrame (pandas is an optional dependency)
+def records_to_dataframe(records):
+    """
+    Builds a pandas DataFrame from a tidy table, importing pandas only when the DataFrame is built.
+
+    Args:
+        records (list[dict]): The rows of the table.
+
+    Returns:
+        pandas.DataFrame: The table.
+
+    Raises:
+        ImportError: If pandas is not installed.
+    """
+    try:
+        import pandas as pd
+    except ImportError as error:
+        raise ImportError("`to_dataframe` requires pandas. Please install it (e.g. `pip install pandas`).") from error
+    return pd.DataFrame(records)
+
+#--------------------------------------------------------------------------------
+# Utility classes
+#--------------------------------------------------------------------------------
+
+class SilentProgressBar():
+    """
+    Stand-in for a tqdm progress bar when tqdm is not installed: it only keeps count of the steps.
+    """
+    #--------------------------------------------------------------------------------
+    def __init__(self,total,initial=0):
+        self.total = total
+        self.n     = initial
+    #--------------------------------------------------------------------------------
+    def update(self,n=1):
+        self.n += n
+    #--------------------------------------------------------------------------------
+    def close(self):
+        pass
+    #--------------------------------------------------------------------------------
+    @staticmethod
+    def write(message,file=None,end='\n'):
+        """
+        Writes a message like `tqdm.write` (to `sys.stdout` by default, followed by `end`).
+        """
+        file = sys.stdout if file is None else file
+        file.write(f'{message}{end}')
+        file.flush()
+    #--------------------------------------------------------------------------------